@@ -0,0 +1,122 @@
+import numpy as np
+from quadtree_plano import QuadtreePlano
+from expansion import tramos, expandir
+from constants import G, THETA_BARNES_HUT
+
+# Máximo de partículas de un grupo destino que comparte un mismo recorrido del árbol
+TAMANO_GRUPO = 32
+
+
+# Devuelve los nodos más altos con a lo sumo `tamano` partículas (grupos destino).
+# Las hojas que superan el tamaño (profundidad máxima alcanzada) son grupos por sí mismas
+def grupos_destino(arbol, tamano=TAMANO_GRUPO):
+    cantidades = arbol.cantidades
+    padre_grande = np.ones(arbol.num_nodos, dtype=bool)
+    con_padre = arbol.padres >= 0
+    padre_grande[con_padre] = cantidades[arbol.padres[con_padre]] > tamano
+    candidatos = (cantidades <= tamano) | (arbol.hijos < 0)
+    return np.flatnonzero(candidatos & padre_grande & (cantidades > 0))
+
+
+# Para cada pareja (grupo destino, nodo fuente) decide si el nodo puede aproximarse
+# por su centro de masa: tamaño / distancia < theta y el nodo no contiene al grupo
+def es_aceptable(arbol, grupos, nodos, theta):
+    destino = arbol.limites[grupos]
+    fuente = arbol.limites[nodos]
+    # Un nodo que contiene al grupo incluye sus propias partículas: siempre se abre
+    contiene = np.all(fuente[:, :2] <= destino[:, :2], axis=1) & np.all(
+        destino[:, 2:] <= fuente[:, 2:], axis=1
+    )
+    tamano = np.max(fuente[:, 2:] - fuente[:, :2], axis=1)
+    # Distancia del centro de masa al punto más cercano del grupo destino
+    centros = arbol.centros_masa[nodos]
+    d = np.maximum(np.maximum(destino[:, :2] - centros, centros - destino[:, 2:]), 0)
+    return ~contiene & (tamano < theta * np.sqrt((d**2).sum(axis=1)))
+
+
+# Recorrido dual vectorizado: expande a la vez las parejas (grupo, nodo) nivel a nivel
+# y las clasifica en campo lejano (centro de masa) o campo cercano (hojas exactas)
+def listas_interaccion(arbol, grupos, theta):
+    lejanos_g, lejanos_n = [], []
+    cercanos_g, cercanos_n = [], []
+    g = grupos
+    nodos = np.zeros(len(grupos), dtype=np.int64)
+    while len(g):
+        con_masa = arbol.masas[nodos] > 0
+        g, nodos = g[con_masa], nodos[con_masa]
+        aceptable = es_aceptable(arbol, g, nodos, theta)
+        lejanos_g.append(g[aceptable])
+        lejanos_n.append(nodos[aceptable])
+
+        hoja = arbol.hijos[nodos] < 0
+        cercano = ~aceptable & hoja
+        cercanos_g.append(g[cercano])
+        cercanos_n.append(nodos[cercano])
+
+        abrir = ~aceptable & ~hoja
+        g = np.repeat(g[abrir], 4)
+        nodos = (arbol.hijos[nodos[abrir], None] + np.arange(4)).reshape(-1)
+    return (
+        np.concatenate(lejanos_g),
+        np.concatenate(lejanos_n),
+        np.concatenate(cercanos_g),
+        np.concatenate(cercanos_n),
+    )
+
+
+# Acumula en `aceleraciones` la contribución de unas fuentes sobre las partículas i
+def _acumular(aceleraciones, i, pos_fuente, masas_fuente, radios_fuente, pos, radios):
+    dx = pos_fuente[:, 0] - pos[i, 0]
+    dy = pos_fuente[:, 1] - pos[i, 1]
+    # Misma distancia mínima que el kernel exacto; la propia partícula aporta dx = dy = 0
+    dist = np.maximum(np.sqrt(dx**2 + dy**2), 2 * np.maximum(radios[i], radios_fuente))
+    factor = G * masas_fuente / dist**3
+    n = len(aceleraciones)
+    aceleraciones[:, 0] += np.bincount(i, weights=factor * dx, minlength=n)
+    aceleraciones[:, 1] += np.bincount(i, weights=factor * dy, minlength=n)
+
+
+# Aceleraciones Barnes–Hut O(N log N) sobre el quadtree plano con agregados de masa.
+# theta = 0 abre todos los nodos y reproduce el kernel exacto
+def calcular_aceleraciones_barnes_hut(
+    posiciones, masas, radios, theta=THETA_BARNES_HUT, arbol=None
+):
+    if arbol is None:
+        arbol = QuadtreePlano.desde_posiciones(posiciones)
+    arbol.calcular_masas(masas, radios)
+    cantidades = arbol.cantidades
+    aceleraciones = np.zeros((len(posiciones), 2))
+
+    lejanos_g, lejanos_n, cercanos_g, cercanos_n = listas_interaccion(
+        arbol, grupos_destino(arbol), theta
+    )
+
+    # Campo lejano: cada partícula del grupo frente al centro de masa del nodo
+    for inicio, fin in tramos(cantidades[lejanos_g]):
+        g, nodos = lejanos_g[inicio:fin], lejanos_n[inicio:fin]
+        pareja, local = expandir(cantidades[g])
+        i = arbol.orden[arbol.inicios[g][pareja] + local]
+        nodos = nodos[pareja]
+        _acumular(
+            aceleraciones,
+            i,
+            arbol.centros_masa[nodos],
+            arbol.masas[nodos],
+            arbol.radios_max[nodos],
+            posiciones,
+            radios,
+        )
+
+    # Campo cercano: todas las parejas de partículas entre el grupo y la hoja abierta
+    for inicio, fin in tramos(cantidades[cercanos_g] * cantidades[cercanos_n]):
+        g, hojas = cercanos_g[inicio:fin], cercanos_n[inicio:fin]
+        tam_hoja = cantidades[hojas]
+        pareja, local = expandir(cantidades[g] * tam_hoja)
+        fila, columna = np.divmod(local, tam_hoja[pareja])
+        i = arbol.orden[arbol.inicios[g][pareja] + fila]
+        j = arbol.orden[arbol.inicios[hojas][pareja] + columna]
+        _acumular(
+            aceleraciones, i, posiciones[j], masas[j], radios[j], posiciones, radios
+        )
+
+    return aceleraciones
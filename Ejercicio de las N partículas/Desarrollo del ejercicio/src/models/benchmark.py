@@ -0,0 +1,316 @@
+import argparse
+import os
+import time
+import numpy as np
+from particula_manager import ParticulaManager
+from fuerzas import calcular_fuerzas_bucle, calcular_fuerzas_vectorizado
+from fuerzas_paralelo import MotorFuerzasParalelo
+from barnes_hut import calcular_aceleraciones_barnes_hut
+from quadtree_node import QuadtreeNode
+from par_cercano import (
+    MODOS_PAR_CERCANO,
+    SeguidorParCercano,
+    par_mas_cercano_directo,
+    par_mas_cercano_rejilla,
+)
+from quadtree_plano import QuadtreePlano
+from spatial_hash_grid import SpatialHashGrid
+from constants import ANCHO, ALTO
+
+
+# Crea un sistema de partículas reproducible a partir de una semilla
+def generar_sistema(num_particulas, semilla=0):
+    np.random.seed(semilla)
+    return ParticulaManager(num_particulas)
+
+
+# Devuelve el mejor tiempo (en segundos) y el resultado de varias ejecuciones
+def cronometrar(funcion, *args, repeticiones=3):
+    mejor = float("inf")
+    resultado = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(*args)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+# Compara el kernel de bucles con el vectorizado y verifica que den la misma física
+def benchmark_fuerzas(tamanos):
+    print(
+        f"{'N':>7} {'bucle (s)':>11} {'vectorizado (s)':>16} "
+        f"{'aceleración':>12} {'error rel. máx':>15} {'mismo par':>10}"
+    )
+    for n in tamanos:
+        sistema = generar_sistema(n)
+        args = (sistema.posiciones, sistema.masas, sistema.radios)
+        t_bucle, (acel_ref, dist_ref, par_ref) = cronometrar(
+            calcular_fuerzas_bucle, *args, repeticiones=1
+        )
+        t_vec, (acel, dist, par) = cronometrar(calcular_fuerzas_vectorizado, *args)
+        error = np.max(np.abs(acel - acel_ref)) / np.max(np.abs(acel_ref))
+        mismo_par = par == par_ref and np.isclose(dist, dist_ref)
+        print(
+            f"{n:>7} {t_bucle:>11.4f} {t_vec:>16.4f} "
+            f"{t_bucle / t_vec:>11.1f}x {error:>15.2e} {str(mismo_par):>10}"
+        )
+
+
+# Informe de precisión de Barnes–Hut frente al kernel exacto para varios theta
+def benchmark_barnes_hut(tamanos, thetas):
+    for n in tamanos:
+        sistema = generar_sistema(n)
+        args = (sistema.posiciones, sistema.masas, sistema.radios)
+        t_exacto, (acel_ref, _, _) = cronometrar(
+            calcular_fuerzas_vectorizado, *args, repeticiones=1
+        )
+        norma_ref = np.linalg.norm(acel_ref, axis=1)
+        print(f"\nN = {n} (kernel exacto: {t_exacto:.3f} s)")
+        print(
+            f"{'theta':>6} {'tiempo (s)':>11} {'aceleración':>12} "
+            f"{'error mediana':>14} {'error p99':>10} {'error máx':>10}"
+        )
+        for theta in thetas:
+            t_bh, acel = cronometrar(
+                calcular_aceleraciones_barnes_hut, *args, theta, repeticiones=1
+            )
+            error = np.linalg.norm(acel - acel_ref, axis=1) / norma_ref
+            print(
+                f"{theta:>6.2f} {t_bh:>11.3f} {t_exacto / t_bh:>11.1f}x "
+                f"{np.median(error):>14.2e} {np.percentile(error, 99):>10.2e} "
+                f"{error.max():>10.2e}"
+            )
+
+
+# Compara la construcción del quadtree de objetos con la del quadtree plano
+def benchmark_quadtree(tamanos):
+    print(
+        f"{'N':>8} {'QuadtreeNode (s)':>17} {'QuadtreePlano (s)':>18} "
+        f"{'aceleración':>12} {'nodos':>8} {'mismas hojas':>13}"
+    )
+    for n in tamanos:
+        posiciones = generar_sistema(n).posiciones
+        t_plano, plano = cronometrar(QuadtreePlano.desde_posiciones, posiciones)
+        t_nodo, raiz = cronometrar(
+            QuadtreeNode.desde_posiciones,
+            posiciones,
+            0,
+            0,
+            ANCHO,
+            ALTO,
+            repeticiones=1,
+        )
+        # Mismo reparto: cada hoja del árbol de objetos tiene una gemela en el plano
+        hojas_nodo = []
+        pendientes = [raiz]
+        while pendientes:
+            nodo = pendientes.pop()
+            pendientes.extend(nodo.hijos)
+            if not nodo.hijos and nodo.particulas:
+                ids = frozenset(p["id"] for p in nodo.particulas)
+                hojas_nodo.append((nodo.limite, ids))
+        hojas_plano = [
+            (tuple(plano.limites[h]), frozenset(plano.particulas(h).tolist()))
+            for h in plano.hojas()
+        ]
+        mismas = set(hojas_nodo) == set(hojas_plano)
+        print(
+            f"{n:>8} {t_nodo:>17.4f} {t_plano:>18.4f} "
+            f"{t_nodo / t_plano:>11.1f}x {plano.num_nodos:>8} {str(mismas):>13}"
+        )
+
+
+# Verifica todos los modos de par más cercano contra la fuerza bruta y mide tiempos
+def benchmark_par_cercano(tamanos, casos_verificacion=200, max_n_directo=20000):
+    rng = np.random.default_rng(0)
+    fallos = 0
+    for caso in range(casos_verificacion):
+        n = int(rng.integers(2, 400))
+        posiciones = rng.random((n, 2)) * [ANCHO, ALTO]
+        if caso % 4 == 0:
+            # Puntos repetidos y alineados para forzar empates y casos degenerados
+            posiciones = np.round(posiciones / 50) * 50
+        referencia, par_referencia = par_mas_cercano_directo(posiciones)
+        for nombre, buscar in MODOS_PAR_CERCANO.items():
+            distancia, (i, j) = buscar(posiciones)
+            real = np.linalg.norm(posiciones[i] - posiciones[j])
+            # Todos los modos deben devolver el mismo par que la fuerza bruta, también
+            # con empates
+            if not (
+                np.isclose(distancia, referencia)
+                and np.isclose(real, distancia)
+                and (i, j) == par_referencia
+            ):
+                fallos += 1
+                print(f"Discrepancia en {nombre} (caso {caso}, N = {n})")
+    print(
+        f"Verificación: {casos_verificacion} casos aleatorios, {fallos} discrepancias"
+    )
+
+    print(f"\n{'N':>8} " + " ".join(f"{nombre:>16}" for nombre in MODOS_PAR_CERCANO))
+    for n in tamanos:
+        posiciones = generar_sistema(n).posiciones
+        tiempos = []
+        distancias = set()
+        for nombre, buscar in MODOS_PAR_CERCANO.items():
+            if nombre == "directo" and n > max_n_directo:
+                tiempos.append(f"{'-':>16}")
+                continue
+            t, (distancia, _) = cronometrar(buscar, posiciones, repeticiones=1)
+            distancias.add(round(distancia, 12))
+            tiempos.append(f"{t:>15.4f}s")
+        coinciden = "coinciden" if len(distancias) == 1 else "NO coinciden"
+        print(f"{n:>8} " + " ".join(tiempos) + f"  ({coinciden})")
+
+
+# Coste por fotograma del seguimiento incremental frente a recalcular desde cero,
+# moviendo las partículas con las velocidades iniciales de la simulación (±2 px por
+# fotograma) multiplicadas por `escala` (un sistema que evoluciona despacio)
+def benchmark_incremental(tamanos, fotogramas=200, escalas=(1.0, 0.1, 0.01)):
+    for escala in escalas:
+        print(f"\nVelocidad x{escala}")
+        _benchmark_incremental(tamanos, fotogramas, escala)
+
+
+def _benchmark_incremental(tamanos, fotogramas, escala):
+    print(
+        f"{'N':>8} {'desde cero (ms)':>16} {'incremental (ms)':>17} "
+        f"{'aceleración':>12} {'reconstrucciones':>17} {'exacto':>7}"
+    )
+    for n in tamanos:
+        sistema = generar_sistema(n)
+        posiciones = sistema.posiciones.copy()
+        velocidades = sistema.velocidades * escala
+        seguidor = SeguidorParCercano()
+        t_cero = t_incremental = 0.0
+        exacto = True
+        for _ in range(fotogramas):
+            posiciones += velocidades
+            # Rebote en los bordes para que las partículas sigan en pantalla
+            fuera = (posiciones < 0) | (posiciones > [ANCHO, ALTO])
+            velocidades[fuera] *= -1
+            np.clip(posiciones, 0, [ANCHO, ALTO], out=posiciones)
+
+            inicio = time.perf_counter()
+            referencia = par_mas_cercano_rejilla(posiciones)
+            t_cero += time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            resultado = seguidor.actualizar(posiciones)
+            t_incremental += time.perf_counter() - inicio
+            exacto &= resultado == referencia
+        print(
+            f"{n:>8} {1000 * t_cero / fotogramas:>16.3f} "
+            f"{1000 * t_incremental / fotogramas:>17.3f} "
+            f"{t_cero / t_incremental:>11.1f}x "
+            f"{seguidor.reconstrucciones:>17} {str(exacto):>7}"
+        )
+
+
+# Coste de la rejilla espacial (construcción, solapamientos y selección con el ratón)
+# frente a N, con partículas de tamaño fijo y densidad constante para ver el O(N)
+def benchmark_rejilla(tamanos, consultas=1000):
+    print(
+        f"{'N':>8} {'construir (ms)':>15} {'solapamientos (ms)':>19} "
+        f"{'pares':>8} {'consulta (us)':>14} {'ns/partícula':>13}"
+    )
+    for n in tamanos:
+        np.random.seed(0)
+        lado = np.sqrt(n / 1000) * ANCHO
+        posiciones = np.random.rand(n, 2) * lado
+        radios = np.random.rand(n) * 5 + 2.5
+        t_construir, rejilla = cronometrar(
+            SpatialHashGrid.desde_posiciones, posiciones, radios
+        )
+        t_solapes, (i, _, _) = cronometrar(rejilla.solapamientos, radios)
+        puntos = np.random.rand(consultas, 2) * lado
+        inicio = time.perf_counter()
+        for x, y in puntos:
+            rejilla.consultar_radio(x, y, radios.max())
+        t_consulta = (time.perf_counter() - inicio) / consultas
+        print(
+            f"{n:>8} {1000 * t_construir:>15.3f} {1000 * t_solapes:>19.3f} "
+            f"{len(i):>8} {1e6 * t_consulta:>14.1f} "
+            f"{1e9 * (t_construir + t_solapes) / n:>13.1f}"
+        )
+
+
+# Escalado del motor paralelo con el número de procesos frente al kernel vectorizado
+# de un solo núcleo; comprueba además que el resultado sea idéntico bit a bit
+def benchmark_paralelo(tamanos, lista_procesos):
+    print(f"Núcleos disponibles: {os.cpu_count()}")
+    print(
+        f"{'N':>7} {'procesos':>9} {'tiempo (s)':>11} {'aceleración':>12} "
+        f"{'eficiencia':>11} {'idéntico':>9}"
+    )
+    for n in tamanos:
+        sistema = generar_sistema(n)
+        args = (sistema.posiciones, sistema.masas, sistema.radios)
+        t_serie, referencia = cronometrar(calcular_fuerzas_vectorizado, *args)
+        print(f"{n:>7} {'serie':>9} {t_serie:>11.4f}")
+        for procesos in lista_procesos:
+            with MotorFuerzasParalelo(n, procesos) as motor:
+                motor.calcular(*args)  # Arranque de los procesos fuera de la medida
+                t_paralelo, (acel, dist, par) = cronometrar(motor.calcular, *args)
+            identico = np.array_equal(acel, referencia[0]) and (dist, par) == tuple(
+                referencia[1:]
+            )
+            aceleracion = t_serie / t_paralelo
+            print(
+                f"{n:>7} {procesos:>9} {t_paralelo:>11.4f} {aceleracion:>11.2f}x "
+                f"{aceleracion / procesos:>10.0%} {str(identico):>9}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmarks del simulador de N partículas"
+    )
+    parser.add_argument(
+        "prueba",
+        choices=[
+            "fuerzas",
+            "barnes_hut",
+            "quadtree",
+            "par_cercano",
+            "incremental",
+            "rejilla",
+            "paralelo",
+        ],
+    )
+    parser.add_argument(
+        "--tamanos", type=int, nargs="+", default=None, help="Valores de N a medir"
+    )
+    parser.add_argument(
+        "--thetas",
+        type=float,
+        nargs="+",
+        default=[0.2, 0.3, 0.5, 0.7, 1.0],
+        help="Ángulos de apertura para el informe de Barnes–Hut",
+    )
+    parser.add_argument(
+        "--procesos",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Números de procesos para el escalado del motor paralelo",
+    )
+    argumentos = parser.parse_args()
+
+    if argumentos.prueba == "fuerzas":
+        benchmark_fuerzas(argumentos.tamanos or [100, 1000, 5000])
+    elif argumentos.prueba == "barnes_hut":
+        benchmark_barnes_hut(argumentos.tamanos or [2000, 10000], argumentos.thetas)
+    elif argumentos.prueba == "quadtree":
+        benchmark_quadtree(argumentos.tamanos or [1000, 10000, 100000])
+    elif argumentos.prueba == "par_cercano":
+        benchmark_par_cercano(argumentos.tamanos or [1000, 10000, 100000, 1000000])
+    elif argumentos.prueba == "incremental":
+        benchmark_incremental(argumentos.tamanos or [1000, 10000, 100000])
+    elif argumentos.prueba == "rejilla":
+        benchmark_rejilla(argumentos.tamanos or [1000, 10000, 100000, 1000000])
+    elif argumentos.prueba == "paralelo":
+        nucleos = os.cpu_count() or 1
+        potencias = [p for p in (1, 2, 4, 8, 16, 32) if p < nucleos] + [nucleos]
+        benchmark_paralelo(
+            argumentos.tamanos or [5000, 20000], argumentos.procesos or potencias
+        )
@@ -17,3 +17,15 @@ ALTO = 600
 FPS = 60
 G = 0.1
 MAX_PARTICULAS_NODO = 4
+# Número máximo de interacciones (pares) evaluadas a la vez por el kernel vectorizado
+MAX_INTERACCIONES_BLOQUE = 1 << 20
+# Profundidad máxima del quadtree (evita subdividir sin fin partículas coincidentes)
+PROFUNDIDAD_MAXIMA_NODO = 16
+# Ángulo de apertura por defecto del método de Barnes–Hut
+THETA_BARNES_HUT = 0.5
+# Modo de búsqueda del par más cercano cuando el motor de fuerzas no lo calcula
+MODO_PAR_CERCANO = "rejilla"
+# Piel inicial (en píxeles) de la lista de vecinos del seguimiento incremental
+PIEL_PAR_CERCANO = 5.0
+# Por encima de este número de partículas no se dibujan sus etiquetas (nivel de detalle)
+MAX_PARTICULAS_ETIQUETAS = 2000
@@ -17,14 +17,9 @@ class EventHandler:
                 eventos["salir"] = True
             elif evento.type == MOUSEBUTTONDOWN:
                 x, y = pygame.mouse.get_pos()
-                for i in range(particula_manager.num_particulas):
-                    dx = x - particula_manager.posiciones[i, 0]
-                    dy = y - particula_manager.posiciones[i, 1]
-                    if dx**2 + dy**2 <= particula_manager.radios[i] ** 2:
-                        eventos["particula_seleccionada"] = i
-                        break
-                else:
-                    eventos["particula_seleccionada"] = None
+                eventos["particula_seleccionada"] = (
+                    particula_manager.seleccionar_particula(x, y)
+                )
             elif evento.type == KEYDOWN:
                 if evento.key == K_SPACE:
                     eventos["mostrar_distancias"] = not eventos["mostrar_distancias"]
@@ -0,0 +1,22 @@
+import numpy as np
+from constants import MAX_INTERACCIONES_BLOQUE
+
+
+# Divide una lista de parejas en tramos cuyo número de interacciones no supere el límite
+def tramos(interacciones, limite=MAX_INTERACCIONES_BLOQUE):
+    acumulado = np.cumsum(interacciones)
+    inicio = 0
+    while inicio < len(interacciones):
+        base = acumulado[inicio - 1] if inicio else 0
+        fin = int(np.searchsorted(acumulado, base + limite, side="right"))
+        fin = max(fin, inicio + 1)
+        yield inicio, fin
+        inicio = fin
+
+
+# Repite cada elemento k `cantidades[k]` veces y devuelve también su posición local
+def expandir(cantidades):
+    total = int(cantidades.sum())
+    repeticion = np.repeat(np.arange(len(cantidades)), cantidades)
+    local = np.arange(total) - np.repeat(np.cumsum(cantidades) - cantidades, cantidades)
+    return repeticion, local
@@ -0,0 +1,153 @@
+import os
+import queue
+import shutil
+import subprocess
+import threading
+import pygame
+from renderer import Renderer
+from constants import ANCHO, ALTO, FPS
+
+# Extensiones que se codifican con ffmpeg; cualquier otra ruta es una carpeta de PNG
+FORMATOS_VIDEO = (".mp4", ".gif")
+# Fotogramas que pueden esperar a ser codificados antes de frenar la simulación
+MAX_FOTOGRAMAS_PENDIENTES = 8
+
+
+# Argumentos de ffmpeg para codificar fotogramas RGB crudos recibidos por stdin
+def _comando_ffmpeg(ruta, ancho, alto, fps):
+    comando = [
+        "ffmpeg",
+        "-y",
+        "-loglevel",
+        "error",
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "rgb24",
+        "-s",
+        f"{ancho}x{alto}",
+        "-r",
+        str(fps),
+        "-i",
+        "-",
+    ]
+    if ruta.lower().endswith(".gif"):
+        # Paleta calculada sobre el propio vídeo: colores fieles en el GIF
+        comando += ["-vf", "split[a][b];[a]palettegen[p];[b][p]paletteuse"]
+    else:
+        comando += ["-c:v", "libx264", "-pix_fmt", "yuv420p"]
+    return comando + [ruta]
+
+
+# Guarda un fotograma RGB de ancho × alto como PNG con pygame
+def guardar_png_pygame(datos, ancho, alto, ruta):
+    pygame.image.save(pygame.image.frombuffer(datos, (ancho, alto), "RGB"), ruta)
+
+
+# Escribe fotogramas RGB en un hilo aparte, para que la codificación se solape con la
+# simulación. Según la ruta, los envía a ffmpeg (.mp4, .gif) o los guarda como
+# secuencia de PNG en una carpeta con `guardar_png(datos, ancho, alto, ruta)`, la
+# única parte que depende de la biblioteca gráfica. La cola es acotada: si el
+# codificador no da abasto, `escribir` espera en lugar de acumular fotogramas en
+# memoria. Un error del hilo escritor se relanza en la siguiente llamada a escribir o
+# en cerrar.
+# Copia en Simulación orbital/Desarrollo del ejercicio/Views/ExportadorOrbital.py
+class EscritorFotogramas:
+    def __init__(self, ruta, ancho, alto, fps=FPS, guardar_png=guardar_png_pygame):
+        self.ruta = ruta
+        self.ancho = ancho
+        self.alto = alto
+        self.fps = fps
+        self.guardar_png = guardar_png
+        self.es_video = ruta.lower().endswith(FORMATOS_VIDEO)
+        self.fotogramas = 0
+        self._cola = queue.Queue(maxsize=MAX_FOTOGRAMAS_PENDIENTES)
+        self._error = None
+        self._proceso = None
+        if self.es_video:
+            if shutil.which("ffmpeg") is None:
+                raise RuntimeError(
+                    "Exportar a MP4 o GIF necesita ffmpeg en el PATH; "
+                    "indique una carpeta para guardar PNG"
+                )
+            self._proceso = subprocess.Popen(
+                _comando_ffmpeg(ruta, ancho, alto, fps), stdin=subprocess.PIPE
+            )
+        else:
+            os.makedirs(ruta, exist_ok=True)
+        self._hilo = threading.Thread(target=self._bucle, daemon=True)
+        self._hilo.start()
+
+    def _bucle(self):
+        numero = 0
+        while True:
+            datos = self._cola.get()
+            if datos is None:
+                break
+            if self._error is not None:
+                continue  # Se vacía la cola sin escribir
+            try:
+                if self.es_video:
+                    self._proceso.stdin.write(datos)
+                else:
+                    self.guardar_png(
+                        datos,
+                        self.ancho,
+                        self.alto,
+                        os.path.join(self.ruta, f"fotograma_{numero:06d}.png"),
+                    )
+                numero += 1
+            except Exception as error:
+                self._error = error
+
+    # Encola un fotograma (bytes RGB de ancho × alto píxeles)
+    def escribir(self, datos):
+        if self._error is not None:
+            raise self._error
+        self._cola.put(datos)
+        self.fotogramas += 1
+
+    # Espera a que se escriban los fotogramas pendientes y cierra el archivo
+    def cerrar(self):
+        if self._hilo is None:
+            return
+        self._cola.put(None)
+        self._hilo.join()
+        self._hilo = None
+        if self._proceso is not None:
+            self._proceso.stdin.close()
+            if self._proceso.wait() != 0 and self._error is None:
+                self._error = RuntimeError(
+                    f"ffmpeg terminó con código {self._proceso.returncode}"
+                )
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+# Dibuja la simulación en una superficie fuera de pantalla (sin ventana ni pantalla
+# física) con el mismo Renderer que la ventana, y pasa cada fotograma al escritor
+class ExportadorParticulas:
+    def __init__(self, ruta, fps=FPS, ancho=ANCHO, alto=ALTO):
+        pygame.font.init()
+        self.superficie = pygame.Surface((ancho, alto))
+        self.renderer = Renderer(self.superficie, pygame.font.SysFont("Arial", 12))
+        self.escritor = EscritorFotogramas(ruta, ancho, alto, fps)
+
+    # Dibuja el estado actual del gestor de partículas y lo encola
+    def capturar(self, manager):
+        self.renderer.dibujar_fotograma(
+            manager.posiciones,
+            manager.radios,
+            manager.par_mas_cercano,
+            manager.min_distancia,
+        )
+        self.escritor.escribir(pygame.image.tobytes(self.superficie, "RGB"))
+
+    def cerrar(self):
+        self.escritor.cerrar()
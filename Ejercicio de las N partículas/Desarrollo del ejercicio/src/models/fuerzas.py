@@ -0,0 +1,120 @@
+import numpy as np
+from barnes_hut import calcular_aceleraciones_barnes_hut
+from constants import G, MAX_INTERACCIONES_BLOQUE
+
+
+# Kernel de referencia: recorre todos los pares con bucles de Python (O(N²) muy lento)
+def calcular_fuerzas_bucle(posiciones, masas, radios):
+    n = len(posiciones)
+    aceleraciones = np.zeros((n, 2))
+    min_distancia = float("inf")
+    par_mas_cercano = (None, None)
+
+    for i in range(n):
+        for j in range(i + 1, n):
+            dx = posiciones[j, 0] - posiciones[i, 0]
+            dy = posiciones[j, 1] - posiciones[i, 1]
+            dist = np.sqrt(dx**2 + dy**2)
+
+            if dist < min_distancia:
+                min_distancia = dist
+                par_mas_cercano = (i, j)
+
+            dist = max(dist, 2 * max(radios[i], radios[j]))
+            fuerza = G * masas[i] * masas[j] / (dist**2)
+            aceleraciones[i] += fuerza * np.array([dx, dy]) / (dist * masas[i])
+            aceleraciones[j] -= fuerza * np.array([dx, dy]) / (dist * masas[j])
+
+    return aceleraciones, min_distancia, par_mas_cercano
+
+
+# Calcula las aceleraciones de las partículas [inicio, fin) frente a todas las demás
+# y el par más cercano (i, j) con i en el bloque y j > i
+def aceleraciones_bloque(posiciones, masas, radios, inicio, fin):
+    n = len(posiciones)
+    # Diferencias de posición entre cada partícula j (columnas) y cada i del bloque (filas)
+    dx = posiciones[None, :, 0] - posiciones[inicio:fin, 0, None]
+    dy = posiciones[None, :, 1] - posiciones[inicio:fin, 1, None]
+    dist = np.sqrt(dx**2 + dy**2)
+
+    # Solo cuentan los pares con j > i para no repetir ni compararse consigo misma
+    pares_validos = np.arange(n)[None, :] > np.arange(inicio, fin)[:, None]
+    dist_pares = np.where(pares_validos, dist, np.inf)
+    k = int(np.argmin(dist_pares))
+    fila, columna = divmod(k, n)
+    min_distancia = float(dist_pares[fila, columna])
+    if min_distancia < float("inf"):
+        par_mas_cercano = (inicio + fila, columna)
+    else:
+        par_mas_cercano = (None, None)
+
+    # Previene superposición excesiva estableciendo una distancia mínima por par
+    dist = np.maximum(dist, 2 * np.maximum(radios[inicio:fin, None], radios[None, :]))
+    # a_i = sum_j G * m_j * (p_j - p_i) / |p_j - p_i|³ (la diagonal aporta dx = dy = 0)
+    factor = G * masas[None, :] / dist**3
+    aceleraciones = np.empty((fin - inicio, 2))
+    aceleraciones[:, 0] = (factor * dx).sum(axis=1)
+    aceleraciones[:, 1] = (factor * dy).sum(axis=1)
+    return aceleraciones, min_distancia, par_mas_cercano
+
+
+# Kernel vectorizado por bloques de filas: misma física que el bucle, con memoria acotada
+def calcular_fuerzas_vectorizado(posiciones, masas, radios):
+    n = len(posiciones)
+    aceleraciones = np.zeros((n, 2))
+    min_distancia = float("inf")
+    par_mas_cercano = (None, None)
+
+    filas_por_bloque = max(1, MAX_INTERACCIONES_BLOQUE // max(n, 1))
+    for inicio in range(0, n, filas_por_bloque):
+        fin = min(inicio + filas_por_bloque, n)
+        acel, distancia, par = aceleraciones_bloque(
+            posiciones, masas, radios, inicio, fin
+        )
+        aceleraciones[inicio:fin] = acel
+        # Comparación estricta: ante empates gana el primer par en orden (i, j)
+        if distancia < min_distancia:
+            min_distancia = distancia
+            par_mas_cercano = par
+
+    return aceleraciones, min_distancia, par_mas_cercano
+
+
+# Adaptadores de cada motor para ParticulaManager: reciben el gestor y devuelven las
+# aceleraciones y (distancia mínima, par más cercano) si el motor los obtiene de paso
+# (los que recorren todos los pares), o None
+def _motor_vectorizado(manager):
+    aceleraciones, min_distancia, par = calcular_fuerzas_vectorizado(
+        manager.posiciones, manager.masas, manager.radios
+    )
+    return aceleraciones, (min_distancia, par)
+
+
+def _motor_barnes_hut(manager):
+    aceleraciones = calcular_aceleraciones_barnes_hut(
+        manager.posiciones, manager.masas, manager.radios, manager.theta
+    )
+    return aceleraciones, None
+
+
+def _motor_paralelo(manager):
+    aceleraciones, min_distancia, par = manager.iniciar_motor_paralelo().calcular(
+        manager.posiciones, manager.masas, manager.radios
+    )
+    return aceleraciones, (min_distancia, par)
+
+
+def _motor_bucle(manager):
+    aceleraciones, min_distancia, par = calcular_fuerzas_bucle(
+        manager.posiciones, manager.masas, manager.radios
+    )
+    return aceleraciones, (min_distancia, par)
+
+
+# Motores de fuerza disponibles
+MOTORES_FUERZAS = {
+    "vectorizado": _motor_vectorizado,
+    "barnes_hut": _motor_barnes_hut,
+    "paralelo": _motor_paralelo,
+    "bucle": _motor_bucle,
+}
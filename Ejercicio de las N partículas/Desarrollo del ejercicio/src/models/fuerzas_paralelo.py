@@ -0,0 +1,141 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from fuerzas import aceleraciones_bloque
+from constants import MAX_INTERACCIONES_BLOQUE
+
+# Bloques de filas por proceso: más de uno reparte mejor la carga entre núcleos
+BLOQUES_POR_PROCESO = 4
+
+# Vistas de la memoria compartida dentro de cada proceso trabajador
+_compartido = {}
+
+
+# Crea (o se conecta a) un bloque de memoria compartida y lo ve como array de NumPy
+def _array_compartido(forma, nombre=None):
+    tamano = int(np.prod(forma)) * np.dtype(np.float64).itemsize
+    if nombre is None:
+        memoria = shared_memory.SharedMemory(create=True, size=max(tamano, 1))
+    else:
+        memoria = shared_memory.SharedMemory(name=nombre)
+    return memoria, np.ndarray(forma, dtype=np.float64, buffer=memoria.buf)
+
+
+# Se ejecuta una vez en cada trabajador: se conecta a los arrays compartidos
+def _inicializar_trabajador(nombres, num_particulas):
+    for clave, nombre in nombres.items():
+        forma = (
+            (num_particulas, 2)
+            if clave in ("posiciones", "aceleraciones")
+            else (num_particulas,)
+        )
+        _compartido[clave] = _array_compartido(forma, nombre)
+
+
+# Trabajo de un proceso: aceleraciones de las filas [inicio, fin) frente a todas las
+# partículas, escritas directamente en la memoria compartida (cada bloque escribe sus
+# propias filas, así que no hay conflictos). Devuelve solo el par más cercano local
+def _calcular_bloque(inicio, fin):
+    posiciones = _compartido["posiciones"][1]
+    masas = _compartido["masas"][1]
+    radios = _compartido["radios"][1]
+    aceleraciones = _compartido["aceleraciones"][1]
+    n = len(posiciones)
+    min_distancia = float("inf")
+    par_mas_cercano = (None, None)
+
+    filas_por_bloque = max(1, MAX_INTERACCIONES_BLOQUE // max(n, 1))
+    for sub_inicio in range(inicio, fin, filas_por_bloque):
+        sub_fin = min(sub_inicio + filas_por_bloque, fin)
+        acel, distancia, par = aceleraciones_bloque(
+            posiciones, masas, radios, sub_inicio, sub_fin
+        )
+        aceleraciones[sub_inicio:sub_fin] = acel
+        if distancia < min_distancia:
+            min_distancia = distancia
+            par_mas_cercano = par
+    return min_distancia, par_mas_cercano
+
+
+# Motor de fuerzas exacto repartido en un pool de procesos. Las posiciones, masas,
+# radios y aceleraciones viven en memoria compartida, de modo que por paso solo se
+# envían los límites de cada bloque de filas y se recibe el par más cercano local.
+# La matriz de interacciones se reparte por bloques de filas completas: cada par se
+# evalúa dos veces (una por fila), a cambio de que ningún proceso escriba las filas de
+# otro y no haga falta reducir resultados parciales.
+# Los trabajadores se arrancan con "spawn" y no con fork: el motor puede crearse desde
+# el hilo de física del modo pipeline, y hacer fork de un proceso con varios hilos
+# puede dejar cerrojos tomados en el hijo
+class MotorFuerzasParalelo:
+    def __init__(self, num_particulas, procesos=None):
+        self.num_particulas = num_particulas
+        self.procesos = procesos or os.cpu_count() or 1
+        self._memorias = []
+        nombres = {}
+        self.arrays = {}
+        for clave, forma in (
+            ("posiciones", (num_particulas, 2)),
+            ("masas", (num_particulas,)),
+            ("radios", (num_particulas,)),
+            ("aceleraciones", (num_particulas, 2)),
+        ):
+            memoria, array = _array_compartido(forma)
+            self._memorias.append(memoria)
+            self.arrays[clave] = array
+            nombres[clave] = memoria.name
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.procesos,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_inicializar_trabajador,
+            initargs=(nombres, num_particulas),
+        )
+
+        # Bloques de filas de tamaño parecido para todos los procesos
+        bloques = min(num_particulas, self.procesos * BLOQUES_POR_PROCESO) or 1
+        cortes = np.linspace(0, num_particulas, bloques + 1).astype(int)
+        self._inicios = cortes[:-1].tolist()
+        self._fines = cortes[1:].tolist()
+
+    # Mismo resultado que calcular_fuerzas_vectorizado: (aceleraciones, distancia
+    # mínima, par más cercano)
+    def calcular(self, posiciones, masas, radios):
+        if len(posiciones) != self.num_particulas:
+            raise ValueError(
+                f"El motor paralelo se creó para {self.num_particulas} partículas "
+                f"y recibió {len(posiciones)}"
+            )
+        self.arrays["posiciones"][:] = posiciones
+        self.arrays["masas"][:] = masas
+        self.arrays["radios"][:] = radios
+
+        min_distancia = float("inf")
+        par_mas_cercano = (None, None)
+        # Los bloques llegan en orden de filas: con la comparación estricta gana el
+        # primer par en orden (i, j), igual que en el kernel secuencial
+        for distancia, par in self._pool.map(
+            _calcular_bloque, self._inicios, self._fines
+        ):
+            if distancia < min_distancia:
+                min_distancia = distancia
+                par_mas_cercano = par
+        return self.arrays["aceleraciones"].copy(), min_distancia, par_mas_cercano
+
+    # Detiene los procesos y libera la memoria compartida
+    def cerrar(self):
+        if self._pool is None:
+            return
+        self._pool.shutdown()
+        self._pool = None
+        self.arrays = {}
+        for memoria in self._memorias:
+            memoria.close()
+            memoria.unlink()
+        self._memorias = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
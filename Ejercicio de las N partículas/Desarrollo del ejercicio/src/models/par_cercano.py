@@ -0,0 +1,294 @@
+import numpy as np
+from quadtree_plano import QuadtreePlano
+from spatial_hash_grid import SpatialHashGrid
+from constants import ANCHO, ALTO, MAX_INTERACCIONES_BLOQUE, PIEL_PAR_CERCANO
+
+# Tamaño por debajo del cual divide y vencerás resuelve por fuerza bruta
+TAMANO_BASE_DIVIDE_VENCERAS = 32
+# Vecinos siguientes (ordenados por y) que hay que revisar en la franja central
+VECINOS_FRANJA = 7
+# Coste de reconstruir la lista de vecinos (por partícula) relativo al de revisar un
+# par de la lista; fija la piel automática del seguimiento incremental
+COSTE_RELATIVO_RECONSTRUCCION = 5.0
+# Pares por partícula que como mucho admite la lista de vecinos con piel automática
+MAX_PARES_POR_PARTICULA = 8
+# Candidatos por partícula por encima de los cuales la rejilla cede el cálculo a
+# divide y vencerás (distribuciones muy agrupadas)
+MAX_CANDIDATOS_POR_PARTICULA = 64
+# Semilla de la muestra con la que la rejilla acota la distancia mínima
+SEMILLA_MUESTRA_REJILLA = 0
+
+
+# Elige, entre pares candidatos, el de menor distancia; ante empates el menor (i, j),
+# igual que el recorrido por fuerza bruta
+def _mejor_par(i, j, distancias, ordenados=False):
+    if len(distancias) == 0:
+        return float("inf"), (None, None)
+    if not ordenados:
+        i, j = np.minimum(i, j), np.maximum(i, j)
+    minimo = distancias.min()
+    empatados = np.flatnonzero(distancias == minimo)
+    k = empatados[np.lexsort((j[empatados], i[empatados]))[0]]
+    return float(minimo), (int(i[k]), int(j[k]))
+
+
+# Distancias entre los pares (i[k], j[k]); trabaja por columnas porque reducir un
+# eje de tamaño 2 con sum(axis=1) es mucho más lento en NumPy
+def distancias_pares(posiciones, i, j):
+    dx = posiciones[i, 0] - posiciones[j, 0]
+    dy = posiciones[i, 1] - posiciones[j, 1]
+    return np.sqrt(dx * dx + dy * dy)
+
+
+# Fuerza bruta vectorizada por bloques de filas: O(N²), sirve de referencia
+def par_mas_cercano_directo(posiciones):
+    n = len(posiciones)
+    min_distancia = float("inf")
+    par_mas_cercano = (None, None)
+
+    filas_por_bloque = max(1, MAX_INTERACCIONES_BLOQUE // max(n, 1))
+    for inicio in range(0, n, filas_por_bloque):
+        fin = min(inicio + filas_por_bloque, n)
+        dx = posiciones[None, :, 0] - posiciones[inicio:fin, 0, None]
+        dy = posiciones[None, :, 1] - posiciones[inicio:fin, 1, None]
+        dist = np.sqrt(dx**2 + dy**2)
+        dist[np.arange(n)[None, :] <= np.arange(inicio, fin)[:, None]] = np.inf
+        fila, columna = divmod(int(np.argmin(dist)), n)
+        if dist[fila, columna] < min_distancia:
+            min_distancia = float(dist[fila, columna])
+            par_mas_cercano = (inicio + fila, columna)
+
+    return min_distancia, par_mas_cercano
+
+
+# Divide y vencerás clásico O(N log N): mitades por x y franja central revisada
+# comparando cada punto con sus siguientes VECINOS_FRANJA en orden de y. Cada mitad
+# devuelve también sus puntos ordenados por y, de modo que la franja sale de mezclar
+# dos listas ordenadas en lugar de ordenarla en cada nivel
+def par_mas_cercano_divide_venceras(posiciones):
+    orden_x = np.argsort(posiciones[:, 0], kind="stable")
+
+    def resolver(indices):
+        if len(indices) <= TAMANO_BASE_DIVIDE_VENCERAS:
+            d = np.sqrt(
+                (
+                    (posiciones[indices, None, :] - posiciones[None, indices, :]) ** 2
+                ).sum(axis=2)
+            )
+            a, b = np.triu_indices(len(indices), k=1)
+            por_y = indices[np.argsort(posiciones[indices, 1], kind="stable")]
+            return _mejor_par(indices[a], indices[b], d[a, b]), por_y
+
+        mitad = len(indices) // 2
+        x_corte = posiciones[indices[mitad], 0]
+        mejor_izquierda, y_izquierda = resolver(indices[:mitad])
+        mejor_derecha, y_derecha = resolver(indices[mitad:])
+        mejor = min(mejor_izquierda, mejor_derecha)
+        # La ordenación estable de NumPy (timsort) reconoce los dos tramos ya
+        # ordenados y los mezcla en tiempo lineal
+        por_y = np.concatenate((y_izquierda, y_derecha))
+        por_y = por_y[np.argsort(posiciones[por_y, 1], kind="stable")]
+
+        # Franja de ancho 2·delta alrededor del corte, ya ordenada por y. Se incluye
+        # el borde para no perder pares empatados con delta (o coincidentes si es 0)
+        delta = mejor[0]
+        franja = por_y[np.abs(posiciones[por_y, 0] - x_corte) <= delta]
+        for k in range(1, min(VECINOS_FRANJA, len(franja) - 1) + 1):
+            d = np.sqrt(
+                ((posiciones[franja[k:]] - posiciones[franja[:-k]]) ** 2).sum(1)
+            )
+            candidato = _mejor_par(franja[:-k], franja[k:], d)
+            mejor = min(mejor, candidato)
+        return mejor, por_y
+
+    if len(posiciones) < 2:
+        return float("inf"), (None, None)
+    return resolver(orden_x)[0]
+
+
+# Todos los pares (i < j) a distancia <= radio con una rejilla espacial de celdas de
+# lado `radio` (media plantilla de SpatialHashGrid.pares_cercanos)
+def pares_en_rejilla(posiciones, radio):
+    return SpatialHashGrid(posiciones, radio).pares_cercanos(radio)
+
+
+# Cota superior de la distancia mínima al estilo de Rabin: el par más cercano de una
+# muestra aleatoria de unos N^(2/3) puntos (una distancia real entre dos puntos).
+# Con pocos puntos la muestra sería casi todo: se resuelve directamente
+def cota_par_cercano_muestreada(posiciones):
+    n = len(posiciones)
+    tamano = max(2, int(n ** (2 / 3)))
+    if n <= TAMANO_BASE_DIVIDE_VENCERAS:
+        return par_mas_cercano_divide_venceras(posiciones)[0]
+    generador = np.random.default_rng(SEMILLA_MUESTRA_REJILLA)
+    muestra = generador.choice(n, tamano, replace=False)
+    # La muestra se resuelve con la propia rejilla (recursión sobre N^(2/3), N^(4/9)...)
+    return par_mas_cercano_rejilla(posiciones[muestra])[0]
+
+
+# Par (i < j) de puntos coincidentes con menor (i, j), o distancia infinita si no hay.
+# Ordenados por coordenadas y luego por índice, el menor par de cada grupo de puntos
+# iguales son sus dos primeros
+def _par_coincidente(posiciones):
+    orden = np.lexsort((np.arange(len(posiciones)), posiciones[:, 1], posiciones[:, 0]))
+    ordenadas = posiciones[orden]
+    iguales = (ordenadas[1:] == ordenadas[:-1]).all(axis=1)
+    primeros = np.flatnonzero(iguales & ~np.concatenate(([False], iguales[:-1])))
+    return _mejor_par(orden[primeros], orden[primeros + 1], np.zeros(len(primeros)))
+
+
+# Rejilla uniforme O(N) esperado: el lado de celda es la distancia mínima de una
+# muestra, que acota la real, así que el par más cercano está entre los pares a
+# distancia <= radio y el mínimo encontrado es exacto. Si la distribución está tan
+# agrupada que habría más de MAX_CANDIDATOS_POR_PARTICULA candidatos por partícula,
+# se resuelve con divide y vencerás, que no depende de la distribución
+def par_mas_cercano_rejilla(posiciones):
+    n = len(posiciones)
+    if n < 2:
+        return float("inf"), (None, None)
+    radio = cota_par_cercano_muestreada(posiciones)
+    if radio == 0:
+        # Hay puntos coincidentes y la rejilla necesita un lado de celda positivo
+        return _par_coincidente(posiciones)
+    rejilla = SpatialHashGrid(posiciones, radio)
+    if rejilla.num_candidatos(radio) > MAX_CANDIDATOS_POR_PARTICULA * n:
+        return par_mas_cercano_divide_venceras(posiciones)
+    i, j, distancias = rejilla.pares_cercanos(radio)
+    return _mejor_par(i, j, distancias, ordenados=True)
+
+
+# Búsqueda con el quadtree: vecino más cercano de cada partícula con
+# QuadtreePlano.buscar_vecinos, podando con la mejor distancia encontrada hasta ahora.
+# Recorriendo i en orden creciente, el primer i que alcanza la distancia mínima es el
+# menor de los pares empatados, y buscar_vecinos devuelve el menor vecino empatado.
+# Los límites del árbol se amplían hasta contener todos los puntos: uno fuera de la
+# pantalla iría a una celda del borde cuyos límites no lo contienen y la poda lo
+# descartaría
+def par_mas_cercano_quadtree(posiciones, arbol=None):
+    if arbol is None:
+        minimos = np.minimum(posiciones.min(axis=0, initial=0), 0)
+        maximos = np.maximum(posiciones.max(axis=0, initial=0), (ANCHO, ALTO))
+        arbol = QuadtreePlano.desde_posiciones(posiciones, limite=(*minimos, *maximos))
+    min_distancia = float("inf")
+    par_mas_cercano = (None, None)
+    for i in range(len(posiciones)):
+        vecino, distancia = arbol.buscar_vecinos(i, min_distancia)
+        if vecino is not None:
+            min_distancia = distancia
+            par_mas_cercano = (min(i, vecino), max(i, vecino))
+    return min_distancia, par_mas_cercano
+
+
+# Seguimiento incremental del par más cercano entre fotogramas con una lista de
+# vecinos tipo Verlet. Al reconstruir se guardan todos los pares a distancia
+# <= R = cota + 2·piel, donde cota >= distancia mínima en ese momento. Si D es la
+# suma de los dos mayores desplazamientos desde entonces, ningún par fuera de la
+# lista está ahora a menos de R - D; mientras el mínimo dentro de la lista no supere
+# R - D ese mínimo es el exacto. Si lo supera (las partículas se movieron más que la
+# piel) se reconstruye la lista.
+# Con piel=None la piel se ajusta en cada reconstrucción al desplazamiento por
+# fotograma observado y a la densidad. Si en un solo fotograma las partículas se
+# mueven más que la piel admisible, la lista no compensa y se recalcula desde cero
+class SeguidorParCercano:
+    def __init__(self, piel=None):
+        self.piel = piel
+        self.reconstrucciones = 0
+        self.actualizaciones = 0
+        self.reiniciar()
+
+    # Descarta la lista de vecinos (por ejemplo al reiniciar las partículas)
+    def reiniciar(self):
+        self._referencia = None
+        self._anteriores = None
+        self._radio_lista = 0.0
+        self._fotogramas_desde_reconstruccion = 0
+        self._i = self._j = np.zeros(0, dtype=np.int64)
+
+    # Suma de los dos mayores desplazamientos entre dos configuraciones
+    @staticmethod
+    def _desplazamiento_maximo(posiciones, referencia):
+        dx = posiciones[:, 0] - referencia[:, 0]
+        dy = posiciones[:, 1] - referencia[:, 1]
+        desplazamientos = np.sqrt(dx * dx + dy * dy)
+        dos_mayores = np.partition(desplazamientos, len(desplazamientos) - 2)[-2:]
+        return float(dos_mayores.sum())
+
+    # Piel para la próxima lista: minimiza (pares en la lista) + (coste de reconstruir /
+    # fotogramas entre reconstrucciones), lo que da piel ∝ (desplazamiento /
+    # densidad)^(1/3), limitada a MAX_PARES_POR_PARTICULA pares por partícula.
+    # Devuelve (piel, piel máxima admisible)
+    def _elegir_piel(self, posiciones, por_fotograma):
+        if self.piel is not None:
+            return self.piel, self.piel
+        extension = posiciones.max(axis=0) - posiciones.min(axis=0)
+        densidad = len(posiciones) / max(float(extension[0] * extension[1]), 1e-12)
+        maxima = float(np.sqrt(MAX_PARES_POR_PARTICULA / (2 * np.pi * densidad)))
+        if por_fotograma is None:
+            return min(PIEL_PAR_CERCANO, maxima), maxima
+        optima = (COSTE_RELATIVO_RECONSTRUCCION * por_fotograma / densidad) ** (1 / 3)
+        return min(float(optima), maxima), maxima
+
+    # Construye la lista de pares candidatos a partir de las posiciones actuales
+    def _reconstruir(self, posiciones, cota, piel):
+        self._radio_lista = cota + 2 * piel
+        self._i, self._j, _ = pares_en_rejilla(posiciones, self._radio_lista)
+        self._referencia = posiciones.copy()
+        self._fotogramas_desde_reconstruccion = 0
+        self.reconstrucciones += 1
+
+    # Mínimo dentro de la lista (los pares ya vienen con i < j)
+    def _minimo_lista(self, posiciones):
+        distancias = distancias_pares(posiciones, self._i, self._j)
+        return _mejor_par(self._i, self._j, distancias, ordenados=True)
+
+    # Devuelve (distancia mínima, par más cercano) para las posiciones actuales
+    def actualizar(self, posiciones):
+        self.actualizaciones += 1
+        if len(posiciones) < 2:
+            return float("inf"), (None, None)
+        if self._anteriores is not None and self._anteriores.shape != posiciones.shape:
+            self.reiniciar()
+        por_fotograma = None
+        if self._anteriores is not None:
+            por_fotograma = self._desplazamiento_maximo(posiciones, self._anteriores)
+        self._anteriores = posiciones.copy()
+
+        # Con lista vigente: su mínimo es exacto si ningún par externo pudo adelantarlo
+        cota = None
+        if self._referencia is not None:
+            self._fotogramas_desde_reconstruccion += 1
+            resultado = self._minimo_lista(posiciones)
+            desplazamiento = self._desplazamiento_maximo(posiciones, self._referencia)
+            if resultado[0] + desplazamiento <= self._radio_lista:
+                return resultado
+            # El mínimo de la lista sigue siendo cota superior de la distancia mínima
+            cota = resultado[0]
+            self._referencia = None
+
+        piel, maxima = self._elegir_piel(posiciones, por_fotograma)
+        # Solo merece la pena una lista que sobreviva a más de un fotograma
+        if por_fotograma is not None and por_fotograma >= maxima:
+            return par_mas_cercano_rejilla(posiciones)
+        if cota is None:
+            cota = par_mas_cercano_rejilla(posiciones)[0]
+        self._reconstruir(posiciones, cota, piel)
+        return self._minimo_lista(posiciones)
+
+
+# Modos de búsqueda del par más cercano disponibles
+MODOS_PAR_CERCANO = {
+    "directo": par_mas_cercano_directo,
+    "divide_venceras": par_mas_cercano_divide_venceras,
+    "rejilla": par_mas_cercano_rejilla,
+    "quadtree": par_mas_cercano_quadtree,
+}
+
+
+# Devuelve (distancia mínima, par más cercano) con el modo indicado
+def buscar_par_mas_cercano(posiciones, modo="rejilla"):
+    if modo not in MODOS_PAR_CERCANO:
+        raise ValueError(
+            f"Modo de par más cercano desconocido: {modo}. "
+            f"Opciones: {', '.join(MODOS_PAR_CERCANO)}"
+        )
+    return MODOS_PAR_CERCANO[modo](posiciones)
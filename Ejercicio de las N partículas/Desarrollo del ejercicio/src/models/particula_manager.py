@@ -1,13 +1,69 @@
 import numpy as np
-from quadtree_node import QuadtreeNode
-from constants import G, MAX_PARTICULAS_NODO, ANCHO, ALTO
+from quadtree_plano import QuadtreePlano
+from spatial_hash_grid import SpatialHashGrid
+from fuerzas import MOTORES_FUERZAS
+from fuerzas_paralelo import MotorFuerzasParalelo
+from par_cercano import (
+    MODOS_PAR_CERCANO,
+    SeguidorParCercano,
+    buscar_par_mas_cercano,
+)
+from constants import ANCHO, ALTO, THETA_BARNES_HUT, MODO_PAR_CERCANO
+
+# Modos de par más cercano: los del subsistema más el seguimiento incremental
+MODOS_PAR_MAS_CERCANO = tuple(MODOS_PAR_CERCANO) + ("incremental",)
+
+
+# Partícula bajo el punto (x, y) o None. Si hay varias gana la de menor índice, como
+# al recorrerlas en orden. Una sola pasada vectorizada O(N): para un clic suelto sale
+# más barata que construir una rejilla
+def particula_en_punto(posiciones, radios, x, y):
+    dentro = np.flatnonzero(
+        (posiciones[:, 0] - x) ** 2 + (posiciones[:, 1] - y) ** 2 <= radios**2
+    )
+    return int(dentro[0]) if len(dentro) else None
 
 
 # Clase que gestiona la física y el comportamiento de las partículas en la simulación
 class ParticulaManager:
-    # Constructor: inicializa el sistema con un número específico de partículas
-    def __init__(self, num_particulas):
+    # Constructor: inicializa el sistema con un número específico de partículas,
+    # el motor de fuerzas a utilizar, el ángulo de apertura theta de Barnes–Hut y el
+    # modo de búsqueda del par más cercano (None: se obtiene del motor de fuerzas
+    # cuando este recorre todos los pares y, si no, con MODO_PAR_CERCANO) y si las
+    # partículas chocan entre sí de forma elástica. `procesos` es el número de
+    # procesos del motor "paralelo" (None: uno por núcleo)
+    def __init__(
+        self,
+        num_particulas,
+        motor_fuerzas="vectorizado",
+        theta=THETA_BARNES_HUT,
+        motor_par_cercano=None,
+        colisiones_elasticas=False,
+        procesos=None,
+    ):
+        if motor_fuerzas not in MOTORES_FUERZAS:
+            raise ValueError(
+                f"Motor de fuerzas desconocido: {motor_fuerzas}. "
+                f"Opciones: {', '.join(MOTORES_FUERZAS)}"
+            )
+        if (
+            motor_par_cercano is not None
+            and motor_par_cercano not in MODOS_PAR_MAS_CERCANO
+        ):
+            raise ValueError(
+                f"Modo de par más cercano desconocido: {motor_par_cercano}. "
+                f"Opciones: {', '.join(MODOS_PAR_MAS_CERCANO)}"
+            )
         self.num_particulas = num_particulas
+        self.motor_fuerzas = motor_fuerzas
+        self.theta = theta
+        self.motor_par_cercano = motor_par_cercano
+        self.colisiones_elasticas = colisiones_elasticas
+        self.procesos = procesos
+        # Pool de procesos del motor "paralelo"; se crea en el primer cálculo
+        self.motor_paralelo = None
+        # Lista de vecinos que se conserva entre fotogramas (modo "incremental")
+        self.seguidor_par_cercano = SeguidorParCercano()
         self.min_distancia = float("inf")
         self.par_mas_cercano = (
             None,
@@ -27,61 +83,105 @@ class ParticulaManager:
         self.masas = np.random.rand(self.num_particulas) * 10 + 5
         # El radio de cada partícula es proporcional a su masa
         self.radios = self.masas / 2
+        # Las partículas nuevas invalidan la lista de vecinos del modo incremental
+        self.seguidor_par_cercano.reiniciar()
 
     # Método para construir el árbol cuaternario (quadtree) para optimización espacial
     def construir_quadtree(self):
-        root = QuadtreeNode(0, 0, ANCHO, ALTO, max_particulas=MAX_PARTICULAS_NODO)
-        for i in range(self.num_particulas):
-            part = {"id": i, "pos": tuple(self.posiciones[i])}
-            root.insertar(part)
-        return root
+        return QuadtreePlano.desde_posiciones(self.posiciones)
+
+    # Rejilla espacial uniforme con celdas de lado 2·max(radios)
+    def construir_rejilla(self):
+        return SpatialHashGrid.desde_posiciones(self.posiciones, self.radios)
+
+    # Devuelve la partícula bajo el punto (x, y) o None
+    def seleccionar_particula(self, x, y):
+        return particula_en_punto(self.posiciones, self.radios, x, y)
+
+    # Choques elásticos entre las partículas que se solapan. Todos los pares se
+    # resuelven a la vez: cada uno que se acerca intercambia el impulso a lo largo de
+    # la línea de centros (conserva momento y energía cinética) y las partículas se
+    # separan hasta tocarse, repartiendo el solapamiento según las masas
+    def resolver_colisiones(self):
+        i, j, dist = self.construir_rejilla().solapamientos(self.radios)
+        separadas = dist > 0  # Con centros coincidentes no hay dirección de choque
+        i, j, dist = i[separadas], j[separadas], dist[separadas]
+        if len(i) == 0:
+            return 0
+        normal = (self.posiciones[j] - self.posiciones[i]) / dist[:, None]
+        masa_i, masa_j = self.masas[i], self.masas[j]
+        masa_total = masa_i + masa_j
+
+        # Velocidad relativa a lo largo de la normal; solo chocan los que se acercan
+        relativa = ((self.velocidades[j] - self.velocidades[i]) * normal).sum(axis=1)
+        impulso = (
+            np.where(relativa < 0, 2 * relativa / masa_total, 0.0)[:, None] * normal
+        )
+        # Corrección de posición: cada una se aparta en proporción a la masa de la otra
+        solape = (
+            (self.radios[i] + self.radios[j] - dist)[:, None]
+            * normal
+            / masa_total[:, None]
+        )
+
+        n = self.num_particulas
+        for eje in range(2):
+            self.velocidades[:, eje] += np.bincount(
+                i, weights=masa_j * impulso[:, eje], minlength=n
+            ) - np.bincount(j, weights=masa_i * impulso[:, eje], minlength=n)
+            self.posiciones[:, eje] += np.bincount(
+                j, weights=masa_i * solape[:, eje], minlength=n
+            ) - np.bincount(i, weights=masa_j * solape[:, eje], minlength=n)
+        return len(i)
+
+    # Calcula las aceleraciones con el motor elegido. Devuelve también
+    # (distancia mínima, par más cercano) si el motor los obtiene de paso, o None
+    def calcular_fuerzas(self):
+        return MOTORES_FUERZAS[self.motor_fuerzas](self)
+
+    # Pool de procesos del motor "paralelo", creado la primera vez que se pide
+    def iniciar_motor_paralelo(self):
+        if self.motor_paralelo is None:
+            self.motor_paralelo = MotorFuerzasParalelo(
+                self.num_particulas, self.procesos
+            )
+        return self.motor_paralelo
+
+    # Libera los procesos y la memoria compartida del motor "paralelo"
+    def cerrar(self):
+        if self.motor_paralelo is not None:
+            self.motor_paralelo.cerrar()
+            self.motor_paralelo = None
+
+    # Busca la distancia mínima y el par más cercano con el subsistema de par cercano
+    def calcular_par_mas_cercano(self):
+        if self.motor_par_cercano == "incremental":
+            return self.seguidor_par_cercano.actualizar(self.posiciones)
+        return buscar_par_mas_cercano(
+            self.posiciones, self.motor_par_cercano or MODO_PAR_CERCANO
+        )
 
     # Método principal que actualiza la física del sistema
     def actualizar_fisica(self):
-        n = self.num_particulas
-        # Array para almacenar las aceleraciones de cada partícula
-        aceleraciones = np.zeros((n, 2))
-        self.min_distancia = float("inf")
-        self.par_mas_cercano = (None, None)
-
-        # Cálculo de fuerzas gravitacionales entre todas las partículas
-        for i in range(n):
-            for j in range(i + 1, n):
-                # Calcula la distancia entre partículas
-                dx = self.posiciones[j, 0] - self.posiciones[i, 0]
-                dy = self.posiciones[j, 1] - self.posiciones[i, 1]
-                dist = np.sqrt(dx**2 + dy**2)
-
-                # Actualiza el par más cercano si corresponde
-                if dist < self.min_distancia:
-                    self.min_distancia = dist
-                    self.par_mas_cercano = (i, j)
-
-                # Previene superposición excesiva estableciendo una distancia mínima
-                dist = max(dist, 2 * max(self.radios[i], self.radios[j]))
-                # Calcula la fuerza gravitacional
-                fuerza = G * self.masas[i] * self.masas[j] / (dist**2)
-                # Actualiza las aceleraciones según la ley de Newton
-                aceleraciones[i] += fuerza * np.array([dx, dy]) / (dist * self.masas[i])
-                aceleraciones[j] -= fuerza * np.array([dx, dy]) / (dist * self.masas[j])
+        # Cálculo de fuerzas gravitacionales con el motor elegido
+        aceleraciones, par_de_fuerzas = self.calcular_fuerzas()
+        # Par más cercano (con las posiciones previas al movimiento, como las fuerzas)
+        if self.motor_par_cercano is None and par_de_fuerzas is not None:
+            self.min_distancia, self.par_mas_cercano = par_de_fuerzas
+        else:
+            self.min_distancia, self.par_mas_cercano = self.calcular_par_mas_cercano()
 
         # Actualiza velocidades y posiciones usando las aceleraciones calculadas
         self.velocidades += aceleraciones
         self.posiciones += self.velocidades
+        if self.colisiones_elasticas:
+            self.resolver_colisiones()
 
         # Manejo de colisiones con los bordes de la pantalla
-        for i in range(n):
-            for dim in range(2):
-                limite = ANCHO if dim == 0 else ALTO
-                # Rebote en los bordes con pérdida de energía (factor 0.9)
-                if (
-                    self.posiciones[i, dim] < self.radios[i]
-                    or self.posiciones[i, dim] > limite - self.radios[i]
-                ):
-                    self.velocidades[i, dim] *= -0.9
-            # Asegura que las partículas permanezcan dentro de los límites
-            self.posiciones[i] = np.clip(
-                self.posiciones[i],
-                self.radios[i],
-                [ANCHO - self.radios[i], ALTO - self.radios[i]],
-            )
+        minimos = self.radios[:, None]
+        maximos = np.array([ANCHO, ALTO]) - self.radios[:, None]
+        # Rebote en los bordes con pérdida de energía (factor 0.9)
+        fuera = (self.posiciones < minimos) | (self.posiciones > maximos)
+        self.velocidades[fuera] *= -0.9
+        # Asegura que las partículas permanezcan dentro de los límites
+        np.clip(self.posiciones, minimos, maximos, out=self.posiciones)
@@ -0,0 +1,146 @@
+import threading
+import time
+from collections import deque
+from particula_manager import particula_en_punto
+
+
+# Mide la tasa de eventos (pasos de física o fotogramas) en una ventana deslizante
+class ContadorTasa:
+    def __init__(self, ventana=1.0):
+        self.ventana = ventana
+        self.total = 0
+        self._instantes = deque()
+
+    def registrar(self):
+        ahora = time.perf_counter()
+        self.total += 1
+        self._instantes.append(ahora)
+        while self._instantes and ahora - self._instantes[0] > self.ventana:
+            self._instantes.popleft()
+
+    # Eventos por segundo en la última ventana
+    @property
+    def tasa(self):
+        if len(self._instantes) < 2:
+            return 0.0
+        duracion = self._instantes[-1] - self._instantes[0]
+        return (len(self._instantes) - 1) / duracion if duracion > 0 else 0.0
+
+
+# Copia del estado necesario para dibujar un fotograma
+class InstantaneaFisica:
+    def __init__(self):
+        self.posiciones = None
+        self.radios = None
+        self.par_mas_cercano = (None, None)
+        self.min_distancia = float("inf")
+        self.paso = 0
+        # Aumenta con cada reinicio, para que el renderizador invalide su caché
+        self.generacion = 0
+
+    def copiar_de(self, manager, paso, generacion):
+        if self.posiciones is None or self.posiciones.shape != manager.posiciones.shape:
+            self.posiciones = manager.posiciones.copy()
+            self.radios = manager.radios.copy()
+        else:
+            self.posiciones[:] = manager.posiciones
+            self.radios[:] = manager.radios
+        self.par_mas_cercano = manager.par_mas_cercano
+        self.min_distancia = manager.min_distancia
+        self.paso = paso
+        self.generacion = generacion
+
+    # Igual que ParticulaManager.seleccionar_particula, pero sobre la copia: el hilo de
+    # física puede estar modificando las posiciones del gestor mientras tanto
+    def seleccionar_particula(self, x, y):
+        return particula_en_punto(self.posiciones, self.radios, x, y)
+
+
+# Ejecuta la física de un ParticulaManager en un hilo propio y publica instantáneas en
+# un triple búfer: el hilo de física escribe siempre en su búfer, el de dibujo lee
+# siempre el suyo y el tercero sirve de intercambio, así ninguno espera al otro más
+# que el instante de intercambiar índices. NumPy libera el GIL en las operaciones
+# pesadas, por lo que ambos hilos avanzan a la vez.
+# `pasos_por_segundo_max` limita la física (None: sin límite)
+class PipelineFisica:
+    def __init__(self, particula_manager, pasos_por_segundo_max=None):
+        self.manager = particula_manager
+        self.pasos_por_segundo_max = pasos_por_segundo_max
+        self.contador_pasos = ContadorTasa()
+        self._buferes = [InstantaneaFisica() for _ in range(3)]
+        self._escritura, self._intercambio, self._lectura = 0, 1, 2
+        self._hay_nueva = False
+        self._cerrojo = threading.Lock()
+        self._detener = threading.Event()
+        self._reinicio = threading.Event()
+        self._hilo = None
+        self._generacion = 0
+        self.error = None
+        # El pool del motor paralelo se crea aquí, en el hilo principal, y no en el
+        # primer paso del hilo de física
+        if particula_manager.motor_fuerzas == "paralelo":
+            particula_manager.iniciar_motor_paralelo()
+        # La primera instantánea (estado inicial) está lista antes de arrancar
+        self._buferes[self._lectura].copiar_de(particula_manager, 0, 0)
+
+    def iniciar(self):
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._bucle, daemon=True)
+        self._hilo.start()
+
+    def detener(self):
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join()
+            self._hilo = None
+
+    # El reinicio lo hace el propio hilo de física para no tocar el estado a medias
+    def solicitar_reinicio(self):
+        self._reinicio.set()
+
+    @property
+    def pasos_por_segundo(self):
+        return self.contador_pasos.tasa
+
+    def _publicar(self, paso):
+        self._buferes[self._escritura].copiar_de(self.manager, paso, self._generacion)
+        with self._cerrojo:
+            self._escritura, self._intercambio = self._intercambio, self._escritura
+            self._hay_nueva = True
+
+    def _bucle(self):
+        paso = 0
+        siguiente = time.perf_counter()
+        try:
+            while not self._detener.is_set():
+                if self._reinicio.is_set():
+                    self._reinicio.clear()
+                    self.manager.inicializar_particulas()
+                    self._generacion += 1
+                self.manager.actualizar_fisica()
+                paso += 1
+                self.contador_pasos.registrar()
+                self._publicar(paso)
+                if self.pasos_por_segundo_max:
+                    siguiente += 1 / self.pasos_por_segundo_max
+                    espera = siguiente - time.perf_counter()
+                    if espera > 0:
+                        self._detener.wait(espera)
+                    else:
+                        # Si la física va retrasada no intenta recuperar el tiempo
+                        siguiente = time.perf_counter()
+        except Exception as excepcion:
+            self.error = excepcion
+
+    # Instantánea más reciente publicada (la misma si no hay ninguna nueva). Es válida
+    # hasta la siguiente llamada; los errores del hilo de física se relanzan aquí
+    def ultima_instantanea(self):
+        if self.error is not None:
+            raise RuntimeError(
+                "El hilo de física se detuvo por un error"
+            ) from self.error
+        with self._cerrojo:
+            if self._hay_nueva:
+                self._lectura, self._intercambio = self._intercambio, self._lectura
+                self._hay_nueva = False
+        return self._buferes[self._lectura]
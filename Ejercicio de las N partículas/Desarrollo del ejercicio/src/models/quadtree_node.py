@@ -1,4 +1,5 @@
 import numpy as np
+from constants import PROFUNDIDAD_MAXIMA_NODO
 
 
 class QuadtreeNode:
@@ -9,6 +10,13 @@ class QuadtreeNode:
         self.particulas = []
         self.hijos = []
 
+    @classmethod
+    def desde_posiciones(cls, posiciones, x_min, y_min, x_max, y_max, max_particulas=4):
+        raiz = cls(x_min, y_min, x_max, y_max, max_particulas=max_particulas)
+        for i in range(len(posiciones)):
+            raiz.insertar({"id": i, "pos": tuple(posiciones[i])})
+        return raiz
+
     def insertar(self, particula):
         if self.hijos:
             for hijo in self.hijos:
@@ -17,7 +25,10 @@ class QuadtreeNode:
                     return
         else:
             self.particulas.append(particula)
-            if len(self.particulas) > self.max_particulas:
+            if (
+                len(self.particulas) > self.max_particulas
+                and self.profundidad < PROFUNDIDAD_MAXIMA_NODO
+            ):
                 self.subdividir()
                 for p in self.particulas:
                     for hijo in self.hijos:
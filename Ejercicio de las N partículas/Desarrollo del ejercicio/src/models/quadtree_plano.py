@@ -0,0 +1,259 @@
+import numpy as np
+from constants import (
+    ANCHO,
+    ALTO,
+    MAX_PARTICULAS_NODO,
+    PROFUNDIDAD_MAXIMA_NODO,
+)
+
+
+# Intercala con ceros los 32 bits bajos de cada entero (paso previo al código Morton)
+def _separar_bits(valores):
+    v = valores.astype(np.uint64) & np.uint64(0xFFFFFFFF)
+    v = (v | (v << np.uint64(16))) & np.uint64(0x0000FFFF0000FFFF)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF00FF00FF)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x3333333333333333)
+    v = (v | (v << np.uint64(1))) & np.uint64(0x5555555555555555)
+    return v
+
+
+# Quadtree compacto guardado en arrays de NumPy (estructura de arrays).
+# Cada nodo cubre un rango contiguo [inicio, fin) de `orden`, la permutación de las
+# partículas ordenadas por código Morton; los cuatro hijos de un nodo son contiguos y
+# siguen el orden de QuadtreeNode.subdividir (inferior izquierdo, inferior derecho,
+# superior izquierdo, superior derecho).
+# Solo se construye de una vez (desde_posiciones), no tiene `insertar`: añadir una
+# partícula obligaría a desplazar los rangos de todos los nodos. Para añadir
+# partículas se reconstruye el árbol, que reparte igual que insertarlas una a una en
+# QuadtreeNode; las consultas (buscar_vecinos, hojas, particulas) sí son las mismas
+class QuadtreePlano:
+    def __init__(
+        self,
+        posiciones,
+        orden,
+        limites,
+        hijos,
+        padres,
+        inicios,
+        fines,
+        profundidades,
+    ):
+        # Copia de las posiciones en el momento de construir
+        self.posiciones = posiciones
+        self.orden = orden  # Índices de partícula en orden Morton
+        self.limites = limites  # (M, 4): x_min, y_min, x_max, y_max de cada nodo
+        self.hijos = hijos  # Índice del primer hijo, o -1 si es hoja
+        self.padres = padres  # Índice del padre, o -1 para la raíz
+        self.inicios = inicios  # Rango de partículas del nodo en `orden`
+        self.fines = fines
+        self.profundidades = profundidades
+        # Agregados para Barnes–Hut (se rellenan con calcular_masas)
+        self.masas = None
+        self.centros_masa = None
+        self.radios_max = None
+        self._cache_listas = None
+
+    # Construye el árbol completo a partir de un array (N, 2) en una sola llamada.
+    # Reparte las partículas igual que insertar una a una en QuadtreeNode: un nodo
+    # se subdivide cuando supera max_particulas y no alcanzó la profundidad máxima
+    @classmethod
+    def desde_posiciones(
+        cls,
+        posiciones,
+        limite=(0, 0, ANCHO, ALTO),
+        max_particulas=MAX_PARTICULAS_NODO,
+        profundidad_maxima=PROFUNDIDAD_MAXIMA_NODO,
+    ):
+        if profundidad_maxima > 31:
+            raise ValueError("La profundidad máxima del quadtree plano es 31")
+        posiciones = np.array(posiciones, dtype=float).reshape(-1, 2)
+        n = len(posiciones)
+        x_min, y_min, x_max, y_max = limite
+        niveles = 1 << profundidad_maxima
+
+        # Celda de la rejilla más fina de cada partícula y su código Morton
+        # (las partículas fuera de los límites se asignan a la celda del borde)
+        celdas_x = np.clip(
+            np.floor((posiciones[:, 0] - x_min) / (x_max - x_min) * niveles),
+            0,
+            niveles - 1,
+        ).astype(np.uint64)
+        celdas_y = np.clip(
+            np.floor((posiciones[:, 1] - y_min) / (y_max - y_min) * niveles),
+            0,
+            niveles - 1,
+        ).astype(np.uint64)
+        codigos = _separar_bits(celdas_x) | (_separar_bits(celdas_y) << np.uint64(1))
+        orden = np.argsort(codigos, kind="stable")
+        codigos = codigos[orden]
+
+        # Construcción por niveles: cada nivel se procesa con operaciones vectorizadas
+        prefijos = np.zeros(1, dtype=np.uint64)
+        niveles_limites = [np.array([[x_min, y_min, x_max, y_max]], dtype=float)]
+        niveles_padres = [np.array([-1])]
+        niveles_inicios = [np.array([0])]
+        niveles_fines = [np.array([n])]
+        niveles_hijos = []
+        total_nodos = 1
+        profundidad = 0
+        while True:
+            inicios, fines = niveles_inicios[-1], niveles_fines[-1]
+            dividir = fines - inicios > max_particulas
+            if profundidad >= profundidad_maxima:
+                dividir[:] = False
+            hijos = np.full(len(inicios), -1)
+            a_dividir = np.flatnonzero(dividir)
+            hijos[a_dividir] = total_nodos + 4 * np.arange(len(a_dividir))
+            niveles_hijos.append(hijos)
+            if len(a_dividir) == 0:
+                break
+
+            # Rangos de los cuatro hijos: búsqueda binaria de los prefijos Morton hijos
+            desplazamiento = np.uint64(2 * (profundidad_maxima - profundidad - 1))
+            prefijos_hijos = (
+                prefijos[a_dividir, None] * np.uint64(4)
+                + np.arange(5, dtype=np.uint64)[None, :]
+            )
+            cortes = np.searchsorted(codigos, prefijos_hijos << desplazamiento)
+            cortes[:, 0] = inicios[a_dividir]
+            cortes[:, 4] = fines[a_dividir]
+
+            # Límites de los hijos con la misma aritmética que QuadtreeNode.subdividir
+            x0, y0, x1, y1 = niveles_limites[-1][a_dividir].T
+            mx = (x0 + x1) / 2
+            my = (y0 + y1) / 2
+            limites_hijos = np.stack(
+                [
+                    np.stack([x0, y0, mx, my], axis=1),
+                    np.stack([mx, y0, x1, my], axis=1),
+                    np.stack([x0, my, mx, y1], axis=1),
+                    np.stack([mx, my, x1, y1], axis=1),
+                ],
+                axis=1,
+            ).reshape(-1, 4)
+
+            niveles_limites.append(limites_hijos)
+            niveles_padres.append(np.repeat(total_nodos - len(inicios) + a_dividir, 4))
+            niveles_inicios.append(cortes[:, :4].reshape(-1))
+            niveles_fines.append(cortes[:, 1:].reshape(-1))
+            prefijos = prefijos_hijos[:, :4].reshape(-1)
+            total_nodos += len(limites_hijos)
+            profundidad += 1
+
+        profundidades = np.repeat(
+            np.arange(len(niveles_inicios), dtype=np.int16),
+            [len(nivel) for nivel in niveles_inicios],
+        )
+        return cls(
+            posiciones,
+            orden,
+            np.concatenate(niveles_limites),
+            np.concatenate(niveles_hijos),
+            np.concatenate(niveles_padres),
+            np.concatenate(niveles_inicios),
+            np.concatenate(niveles_fines),
+            profundidades,
+        )
+
+    @property
+    def num_nodos(self):
+        return len(self.inicios)
+
+    @property
+    def cantidades(self):
+        return self.fines - self.inicios
+
+    def es_hoja(self, nodo):
+        return self.hijos[nodo] < 0
+
+    def particulas(self, nodo):
+        return self.orden[self.inicios[nodo] : self.fines[nodo]]
+
+    def contiene(self, nodo, x, y):
+        x_min, y_min, x_max, y_max = self.limites[nodo]
+        return x_min <= x < x_max and y_min <= y < y_max
+
+    # Hojas no vacías, equivalentes a las hojas con partículas de QuadtreeNode
+    def hojas(self):
+        return np.flatnonzero((self.hijos < 0) & (self.fines > self.inicios))
+
+    # Agregados por nodo (masa total, centro de masa y radio máximo). Como cada nodo
+    # es un rango contiguo de `orden`, bastan sumas prefijas sobre el orden Morton
+    def calcular_masas(self, masas, radios):
+        m = masas[self.orden]
+        pos = self.posiciones[self.orden]
+        acumulado = np.zeros((len(m) + 1, 3))
+        acumulado[1:, 0] = np.cumsum(m)
+        acumulado[1:, 1] = np.cumsum(m * pos[:, 0])
+        acumulado[1:, 2] = np.cumsum(m * pos[:, 1])
+        sumas = acumulado[self.fines] - acumulado[self.inicios]
+
+        self.masas = sumas[:, 0]
+        self.centros_masa = np.zeros((self.num_nodos, 2))
+        con_masa = self.masas > 0
+        self.centros_masa[con_masa] = sumas[con_masa, 1:] / self.masas[con_masa, None]
+
+        # Máximo por rango con reduceat sobre pares (inicio, fin) de nodos no vacíos
+        self.radios_max = np.zeros(self.num_nodos)
+        no_vacios = np.flatnonzero(self.fines > self.inicios)
+        if len(no_vacios):
+            r = np.append(radios[self.orden], 0.0)
+            rangos = np.stack(
+                [self.inicios[no_vacios], self.fines[no_vacios]], axis=1
+            ).reshape(-1)
+            self.radios_max[no_vacios] = np.maximum.reduceat(r, rangos)[::2]
+        return self.masas
+
+    # Copia de la estructura en listas de Python para las consultas punto a punto,
+    # donde indexar escalares de NumPy resulta mucho más lento
+    def _listas(self):
+        if self._cache_listas is None:
+            self._cache_listas = (
+                self.limites.tolist(),
+                self.hijos.tolist(),
+                self.inicios.tolist(),
+                self.fines.tolist(),
+                self.orden.tolist(),
+                self.posiciones.tolist(),
+            )
+        return self._cache_listas
+
+    # Vecino más cercano de la partícula i (mismo recorrido con poda que
+    # QuadtreeNode.buscar_vecinos) a distancia menor que `distancia_minima`; entre
+    # vecinos a la misma distancia, el de menor índice. Devuelve (índice, distancia)
+    def buscar_vecinos(self, i, distancia_minima=float("inf")):
+        limites, hijos, inicios, fines, orden, posiciones = self._listas()
+        x, y = posiciones[i]
+        vecino = None
+        pila = [0]
+        while pila:
+            nodo = pila.pop()
+            x_min, y_min, x_max, y_max = limites[nodo]
+            dx = max(x_min - x, 0, x - x_max)
+            dy = max(y_min - y, 0, y - y_max)
+            caja = (dx**2 + dy**2) ** 0.5
+            # Una vez hay vecino, una caja a la misma distancia aún puede tener uno
+            # empatado de menor índice
+            if caja > distancia_minima or (caja == distancia_minima and vecino is None):
+                continue
+            primero = hijos[nodo]
+            if primero >= 0:
+                # Se apila al final el hijo que contiene el punto para visitarlo primero
+                cuadrante = (x >= limites[primero][2]) + 2 * (y >= limites[primero][3])
+                pila.extend(
+                    h for h in range(primero, primero + 4) if h != primero + cuadrante
+                )
+                pila.append(primero + cuadrante)
+                continue
+            for k in range(inicios[nodo], fines[nodo]):
+                j = orden[k]
+                if j == i:
+                    continue
+                px, py = posiciones[j]
+                dist = ((px - x) ** 2 + (py - y) ** 2) ** 0.5
+                if dist < distancia_minima or (
+                    dist == distancia_minima and vecino is not None and j < vecino
+                ):
+                    vecino, distancia_minima = j, dist
+        return vecino, distancia_minima
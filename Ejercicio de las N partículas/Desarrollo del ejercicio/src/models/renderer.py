@@ -1,39 +1,103 @@
 import pygame
-from constants import COLORES, COLOR_FONDO
+from constants import COLORES, COLOR_FONDO, MAX_PARTICULAS_ETIQUETAS
 
 
 # Clase encargada de toda la renderización gráfica de la simulación
 class Renderer:
-    # Constructor: recibe la superficie de pygame y la fuente para el texto
-    def __init__(self, pantalla, fuente):
+    # Constructor: recibe la superficie de pygame, la fuente para el texto y el número
+    # de partículas a partir del cual se omiten las etiquetas
+    def __init__(self, pantalla, fuente, max_etiquetas=MAX_PARTICULAS_ETIQUETAS):
         self.pantalla = pantalla
         self.fuente = fuente
+        self.max_etiquetas = max_etiquetas
+        # Sprites de círculo ya dibujados, por (radio, color)
+        self._sprites = {}
+        # Sprite y radio entero de cada partícula (los radios no cambian hasta reiniciar)
+        self._sprites_particulas = []
+        self._radios_particulas = []
+        # Etiquetas con el número de cada partícula y su semiancho/semialto
+        self._etiquetas = []
+        self._medias_etiquetas = []
+
+    # Descarta lo cacheado por partícula (al reiniciar las partículas)
+    def invalidar_cache(self):
+        self._sprites_particulas = []
+        self._radios_particulas = []
+        self._etiquetas = []
+        self._medias_etiquetas = []
 
     # Limpia la pantalla con el color de fondo
     def limpiar_pantalla(self):
         self.pantalla.fill(COLOR_FONDO)
 
-    # Dibuja todas las partículas con sus números identificadores
+    # Círculo de un radio y color sobre fondo transparente (color clave), dibujado
+    # con pygame.draw.circle una sola vez
+    def _sprite(self, radio, color):
+        clave = (radio, color)
+        sprite = self._sprites.get(clave)
+        if sprite is None:
+            sprite = pygame.Surface((2 * radio + 1, 2 * radio + 1))
+            sprite.fill(COLOR_FONDO)
+            pygame.draw.circle(sprite, color, (radio, radio), radio)
+            sprite.set_colorkey(COLOR_FONDO, pygame.RLEACCEL)
+            self._sprites[clave] = sprite
+        return sprite
+
+    # Asigna a cada partícula su sprite según su radio y su color cíclico
+    def _preparar_sprites(self, radios):
+        if len(self._sprites_particulas) == len(radios):
+            return
+        self._radios_particulas = radios.astype(int).tolist()
+        self._sprites_particulas = [
+            self._sprite(r, COLORES[i % len(COLORES)])
+            for i, r in enumerate(self._radios_particulas)
+        ]
+
+    # Rasteriza las etiquetas de 0 a n-1 solo cuando cambia el número de partículas
+    def _preparar_etiquetas(self, n):
+        if len(self._etiquetas) == n:
+            return
+        self._etiquetas = [
+            self.fuente.render(str(i), True, (255, 255, 255)) for i in range(n)
+        ]
+        self._medias_etiquetas = [
+            (texto.get_width() / 2, texto.get_height() / 2) for texto in self._etiquetas
+        ]
+
+    # Dibuja todas las partículas con sus números identificadores en un solo
+    # Surface.blits (sin etiquetas por encima de max_etiquetas partículas)
     def dibujar_particulas(self, posiciones, radios):
-        for i in range(len(posiciones)):
-            # Asigna colores cíclicamente desde la lista de colores disponibles
-            color = COLORES[i % len(COLORES)]
-            # Dibuja el círculo que representa la partícula
-            pygame.draw.circle(
-                self.pantalla,
-                color,
-                (int(posiciones[i, 0]), int(posiciones[i, 1])),
-                int(radios[i]),
+        n = len(posiciones)
+        # Conversión a listas de Python de una vez: indexar NumPy elemento a elemento
+        # es mucho más lento
+        xs = posiciones[:, 0].tolist()
+        ys = posiciones[:, 1].tolist()
+        self._preparar_sprites(radios)
+        operaciones = [
+            (sprite, (int(x) - r, int(y) - r))
+            for sprite, r, x, y in zip(
+                self._sprites_particulas, self._radios_particulas, xs, ys
             )
-            # Renderiza y coloca el número identificador en el centro de la partícula
-            texto = self.fuente.render(str(i), True, (255, 255, 255))
-            self.pantalla.blit(
-                texto,
-                (
-                    int(posiciones[i, 0] - texto.get_width() / 2),
-                    int(posiciones[i, 1] - texto.get_height() / 2),
-                ),
+        ]
+
+        if n <= self.max_etiquetas:
+            self._preparar_etiquetas(n)
+            operaciones.extend(
+                (texto, (int(x - medio_ancho), int(y - medio_alto)))
+                for texto, (medio_ancho, medio_alto), x, y in zip(
+                    self._etiquetas, self._medias_etiquetas, xs, ys
+                )
             )
+        self.pantalla.blits(operaciones, doreturn=False)
+
+    # Dibuja un fotograma completo: fondo, partículas y, si existe, el par más
+    # cercano (lo comparten la ventana y la exportación sin pantalla)
+    def dibujar_fotograma(self, posiciones, radios, par_mas_cercano, min_distancia):
+        self.limpiar_pantalla()
+        self.dibujar_particulas(posiciones, radios)
+        if par_mas_cercano[0] is not None:
+            self.dibujar_linea_minima(posiciones, par_mas_cercano, min_distancia)
+            self.dibujar_distancia_minima_arriba(min_distancia)
 
     # Dibuja la línea entre el par de partículas más cercanas
     def dibujar_linea_minima(self, posiciones, par, distancia):
@@ -70,3 +134,13 @@ class Renderer:
             f"Distancia mínima: {distancia:.2f}px", True, color_texto
         )
         self.pantalla.blit(texto, (10, 10))
+
+    # Muestra bajo la distancia mínima los pasos de física y fotogramas por segundo
+    def dibujar_contadores(self, pasos_por_segundo, fotogramas_por_segundo):
+        texto = self.fuente.render(
+            f"Física: {pasos_por_segundo:.1f} pasos/s  "
+            f"Dibujo: {fotogramas_por_segundo:.1f} FPS",
+            True,
+            (200, 200, 200),
+        )
+        self.pantalla.blit(texto, (10, 26))
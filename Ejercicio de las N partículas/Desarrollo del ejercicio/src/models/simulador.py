@@ -4,13 +4,15 @@ from pygame.locals import *
 from particula_manager import ParticulaManager
 from renderer import Renderer
 from event_handler import EventHandler
+from pipeline_fisica import ContadorTasa, PipelineFisica
 from constants import ANCHO, ALTO, FPS
 
 
 # Clase principal que coordina toda la simulación
 class Simulador:
-    # Constructor: inicializa pygame y los componentes principales
-    def __init__(self, num_particulas=15):
+    # Constructor: inicializa pygame y los componentes principales. Con pipeline=True
+    # la física corre en un hilo aparte y el dibujo muestra la última instantánea
+    def __init__(self, num_particulas=15, pipeline=False):
         pygame.init()
         # Configura la ventana de visualización
         self.pantalla = pygame.display.set_mode((ANCHO, ALTO))
@@ -20,43 +22,81 @@ class Simulador:
         self.particula_manager = ParticulaManager(num_particulas)
         self.renderer = Renderer(self.pantalla, self.fuente)
         self.reloj = pygame.time.Clock()
+        self.pipeline = pipeline
 
     # Bucle principal de la simulación
     def ejecutar(self):
+        if self.pipeline:
+            self.ejecutar_pipeline()
         while True:
             # Procesa los eventos de usuario (teclado, ratón, etc.)
             eventos = EventHandler.procesar_eventos(self.particula_manager)
             if eventos["salir"]:
+                self.particula_manager.cerrar()
                 pygame.quit()
                 sys.exit()
             if eventos["reiniciar"]:
                 self.particula_manager.inicializar_particulas()
+                # Los radios cambian: hay que volver a asignar los sprites cacheados
+                self.renderer.invalidar_cache()
 
             # Actualiza la física de las partículas
             self.particula_manager.actualizar_fisica()
-            # Limpia la pantalla para el nuevo frame
-            self.renderer.limpiar_pantalla()
-
-            # Renderiza las partículas
-            self.renderer.dibujar_particulas(
-                self.particula_manager.posiciones, self.particula_manager.radios
+            self.dibujar(
+                self.particula_manager.posiciones,
+                self.particula_manager.radios,
+                self.particula_manager.par_mas_cercano,
+                self.particula_manager.min_distancia,
             )
 
-            # Renderiza la línea de distancia mínima si existe
-            if self.particula_manager.par_mas_cercano[0] is not None:
-                self.renderer.dibujar_linea_minima(
-                    self.particula_manager.posiciones,
-                    self.particula_manager.par_mas_cercano,
-                    self.particula_manager.min_distancia,
-                )
-                self.renderer.dibujar_distancia_minima_arriba(
-                    self.particula_manager.min_distancia
-                )
-
             # Actualiza la pantalla y mantiene el framerate constante
             pygame.display.flip()
             self.reloj.tick(FPS)
 
+    # Bucle con física y dibujo desacoplados: la física avanza en su hilo (como mucho
+    # FPS pasos por segundo, la misma velocidad que el modo secuencial) y el dibujo
+    # muestra la instantánea más reciente. Se muestran ambos ritmos por separado
+    def ejecutar_pipeline(self):
+        pipeline = PipelineFisica(self.particula_manager, pasos_por_segundo_max=FPS)
+        contador_fotogramas = ContadorTasa()
+        generacion = 0
+        pipeline.iniciar()
+        while True:
+            instantanea = pipeline.ultima_instantanea()
+            # Los clics se resuelven sobre la instantánea que se va a dibujar, no sobre
+            # el estado que el hilo de física está modificando
+            eventos = EventHandler.procesar_eventos(instantanea)
+            if eventos["salir"]:
+                pipeline.detener()
+                self.particula_manager.cerrar()
+                pygame.quit()
+                sys.exit()
+            if eventos["reiniciar"]:
+                pipeline.solicitar_reinicio()
+
+            if instantanea.generacion != generacion:
+                generacion = instantanea.generacion
+                self.renderer.invalidar_cache()
+            self.dibujar(
+                instantanea.posiciones,
+                instantanea.radios,
+                instantanea.par_mas_cercano,
+                instantanea.min_distancia,
+            )
+            contador_fotogramas.registrar()
+            self.renderer.dibujar_contadores(
+                pipeline.pasos_por_segundo, contador_fotogramas.tasa
+            )
+
+            pygame.display.flip()
+            self.reloj.tick(FPS)
+
+    # Dibuja un fotograma: partículas y, si existe, el par más cercano
+    def dibujar(self, posiciones, radios, par_mas_cercano, min_distancia):
+        self.renderer.dibujar_fotograma(
+            posiciones, radios, par_mas_cercano, min_distancia
+        )
+
 
 # Punto de entrada del programa
 if __name__ == "__main__":
@@ -70,5 +110,6 @@ if __name__ == "__main__":
         except ValueError:
             print("Por favor, ingrese un número entero válido.")
 
-    sim = Simulador(num_particulas)
+    # Con el argumento --pipeline la física corre en un hilo aparte
+    sim = Simulador(num_particulas, pipeline="--pipeline" in sys.argv)
     sim.ejecutar()
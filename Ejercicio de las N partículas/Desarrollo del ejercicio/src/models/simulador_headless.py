@@ -0,0 +1,212 @@
+import argparse
+import sys
+import time
+import numpy as np
+from particula_manager import (
+    MODOS_PAR_MAS_CERCANO,
+    MOTORES_FUERZAS,
+    ParticulaManager,
+)
+from constants import FPS, THETA_BARNES_HUT
+
+try:
+    import resource
+except ImportError:  # Windows: no hay getrusage
+    resource = None
+
+# Motores que no evalúan todos los pares; para ellos no se informa de interacciones
+MOTORES_APROXIMADOS = ("barnes_hut",)
+
+
+# Pico de memoria residente del proceso en MB (None si el sistema no lo ofrece).
+# Lo lleva el sistema operativo, así que medirlo no ralentiza el bucle cronometrado
+def pico_memoria_residente_mb():
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux lo da en KB y macOS en bytes
+    return pico / 2**20 if sys.platform == "darwin" else pico / 2**10
+
+
+# Ejecuta la física sin ventana ni límite de FPS (no importa pygame) y devuelve las
+# métricas de rendimiento. Si se indica `ruta_trayectoria`, guarda las posiciones cada
+# `cada` pasos en un .npy de forma (fotogramas, N, 2) escrito directamente a disco.
+# Con `ruta_video` graba también un fotograma cada `cada` pasos (MP4, GIF o carpeta de
+# PNG) dibujado fuera de pantalla; solo en ese caso se importa pygame.
+# El pico de memoria es el máximo residente del proceso principal en toda su vida
+# (intérprete y NumPy incluidos, sin los trabajadores del motor paralelo, cuyos arrays
+# grandes viven en memoria compartida)
+def ejecutar_sin_ventana(
+    num_particulas,
+    pasos,
+    semilla=0,
+    motor_fuerzas="vectorizado",
+    theta=THETA_BARNES_HUT,
+    motor_par_cercano=None,
+    ruta_trayectoria=None,
+    cada=1,
+    procesos=None,
+    ruta_video=None,
+    fps_video=FPS,
+):
+    np.random.seed(semilla)
+    manager = ParticulaManager(
+        num_particulas, motor_fuerzas, theta, motor_par_cercano, procesos=procesos
+    )
+    exportador = None
+    try:
+        if ruta_video is not None:
+            from exportador import ExportadorParticulas
+
+            exportador = ExportadorParticulas(ruta_video, fps_video)
+            exportador.capturar(manager)
+        trayectoria = None
+        if ruta_trayectoria is not None:
+            # El fotograma 0 son las posiciones iniciales
+            trayectoria = np.lib.format.open_memmap(
+                ruta_trayectoria,
+                mode="w+",
+                dtype=np.float64,
+                shape=(pasos // cada + 1, num_particulas, 2),
+            )
+            trayectoria[0] = manager.posiciones
+
+        inicio = time.perf_counter()
+        for paso in range(1, pasos + 1):
+            manager.actualizar_fisica()
+            if trayectoria is not None and paso % cada == 0:
+                trayectoria[paso // cada] = manager.posiciones
+            if exportador is not None and paso % cada == 0:
+                exportador.capturar(manager)
+        duracion = time.perf_counter() - inicio
+
+        if trayectoria is not None:
+            trayectoria.flush()
+            del trayectoria
+        if exportador is not None:
+            # Espera a que se codifiquen los fotogramas pendientes
+            exportador.cerrar()
+            exportador = None
+    finally:
+        if exportador is not None:
+            exportador.escritor.cerrar()
+        manager.cerrar()
+
+    # Pares evaluados por segundo con el cálculo exacto de todos los pares; con un
+    # motor aproximado no tiene sentido y se deja en None
+    interacciones_por_segundo = None
+    if motor_fuerzas not in MOTORES_APROXIMADOS:
+        interacciones = num_particulas * (num_particulas - 1) // 2
+        interacciones_por_segundo = (
+            interacciones * pasos / duracion if duracion > 0 else float("inf")
+        )
+    return {
+        "pasos": pasos,
+        "segundos": duracion,
+        "pasos_por_segundo": pasos / duracion if duracion > 0 else float("inf"),
+        "interacciones_por_segundo": interacciones_por_segundo,
+        "pico_memoria_mb": pico_memoria_residente_mb(),
+        "min_distancia": manager.min_distancia,
+        "par_mas_cercano": manager.par_mas_cercano,
+    }
+
+
+# Punto de entrada por línea de comandos, pensado para servidores sin pantalla
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Simulación de N partículas sin ventana, con métricas de rendimiento"
+    )
+    parser.add_argument(
+        "-n", "--particulas", type=int, default=1000, help="Número de partículas"
+    )
+    parser.add_argument(
+        "-p", "--pasos", type=int, default=100, help="Pasos de física a simular"
+    )
+    parser.add_argument(
+        "-s",
+        "--semilla",
+        type=int,
+        default=0,
+        help="Semilla de las condiciones iniciales",
+    )
+    parser.add_argument(
+        "-m",
+        "--motor",
+        choices=MOTORES_FUERZAS,
+        default="vectorizado",
+        help="Motor de fuerzas",
+    )
+    parser.add_argument(
+        "--theta",
+        type=float,
+        default=THETA_BARNES_HUT,
+        help="Ángulo de apertura de Barnes–Hut",
+    )
+    parser.add_argument(
+        "--par-cercano",
+        choices=MODOS_PAR_MAS_CERCANO,
+        default=None,
+        help="Modo de búsqueda del par más cercano",
+    )
+    parser.add_argument(
+        "--trayectoria",
+        default=None,
+        help="Archivo .npy donde guardar las posiciones (fotogramas, N, 2)",
+    )
+    parser.add_argument(
+        "--cada",
+        type=int,
+        default=1,
+        help="Guarda la trayectoria y los fotogramas cada este número de pasos",
+    )
+    parser.add_argument(
+        "--procesos",
+        type=int,
+        default=None,
+        help="Procesos del motor paralelo (por defecto, uno por núcleo)",
+    )
+    parser.add_argument(
+        "--video",
+        default=None,
+        help="Graba la simulación en un .mp4 o .gif (con ffmpeg) o en una carpeta de PNG",
+    )
+    parser.add_argument(
+        "--fps", type=int, default=FPS, help="Fotogramas por segundo del vídeo"
+    )
+    argumentos = parser.parse_args()
+    if argumentos.particulas <= 0 or argumentos.pasos <= 0 or argumentos.cada <= 0:
+        parser.error("El número de partículas, de pasos y --cada deben ser positivos")
+
+    metricas = ejecutar_sin_ventana(
+        argumentos.particulas,
+        argumentos.pasos,
+        argumentos.semilla,
+        argumentos.motor,
+        argumentos.theta,
+        argumentos.par_cercano,
+        argumentos.trayectoria,
+        argumentos.cada,
+        argumentos.procesos,
+        argumentos.video,
+        argumentos.fps,
+    )
+    print(f"Partículas:             {argumentos.particulas}")
+    print(f"Motor de fuerzas:       {argumentos.motor}")
+    print(
+        f"Pasos:                  {metricas['pasos']} en {metricas['segundos']:.3f} s"
+    )
+    print(f"Pasos por segundo:      {metricas['pasos_por_segundo']:.2f}")
+    if metricas["interacciones_por_segundo"] is not None:
+        print(f"Interacciones/segundo:  {metricas['interacciones_por_segundo']:.3e}")
+    else:
+        print("Interacciones/segundo:  no aplica (motor aproximado)")
+    if metricas["pico_memoria_mb"] is not None:
+        print(f"Pico de memoria (RSS):  {metricas['pico_memoria_mb']:.1f} MB")
+    print(
+        f"Par más cercano final:  {metricas['par_mas_cercano']} "
+        f"a {metricas['min_distancia']:.3f} px"
+    )
+    if argumentos.trayectoria is not None:
+        print(f"Trayectoria guardada en {argumentos.trayectoria}")
+    if argumentos.video is not None:
+        print(f"Vídeo guardado en {argumentos.video}")
@@ -0,0 +1,141 @@
+import numpy as np
+from expansion import tramos, expandir
+
+
+# Rejilla espacial uniforme (spatial hash) construida de una vez a partir de un array
+# (N, 2). Cada partícula recibe la clave lineal de su celda; en lugar de una tabla hash
+# se ordenan las partículas por clave (una ordenación por conteo en la práctica), de
+# modo que las partículas de una celda, y las de celdas consecutivas en y de una misma
+# columna, forman rangos contiguos de `orden` que se localizan con búsqueda binaria
+class SpatialHashGrid:
+    def __init__(self, posiciones, tamano_celda):
+        if tamano_celda <= 0:
+            raise ValueError("El tamaño de celda de la rejilla debe ser positivo")
+        self.posiciones = np.asarray(posiciones, dtype=float).reshape(-1, 2)
+        self.tamano_celda = float(tamano_celda)
+        n = len(self.posiciones)
+        self.origen = self.posiciones.min(axis=0) if n else np.zeros(2)
+        celdas = self._celdas(self.posiciones)
+        self.alto = int(celdas[:, 1].max()) + 1 if n else 1  # Filas por columna
+        claves = celdas[:, 0] * self.alto + celdas[:, 1]
+        self.orden = np.argsort(claves, kind="stable")  # Partículas por celda
+        self.claves = claves[self.orden]  # Clave de cada posición de `orden`
+        self.claves_celda, self.inicios, self.cantidades = np.unique(
+            self.claves, return_index=True, return_counts=True
+        )
+
+    # Rejilla con celdas de lado 2·max(radios): dos partículas que se solapan caen
+    # siempre en la misma celda o en celdas vecinas
+    @classmethod
+    def desde_posiciones(cls, posiciones, radios=None, tamano_celda=None):
+        if tamano_celda is None:
+            if radios is None or len(radios) == 0:
+                raise ValueError("Hace falta tamano_celda o los radios de la rejilla")
+            tamano_celda = 2 * float(np.max(radios))
+        return cls(posiciones, tamano_celda)
+
+    # Coordenadas enteras de celda de unos puntos (N, 2)
+    def _celdas(self, puntos):
+        return np.floor((puntos - self.origen) / self.tamano_celda).astype(np.int64)
+
+    # Índices (ordenados) de las partículas a distancia <= radio del punto (x, y)
+    def consultar_radio(self, x, y, radio):
+        if len(self.posiciones) == 0:
+            return np.zeros(0, dtype=np.int64)
+        (x0, y0), (x1, y1) = self._celdas(
+            np.array([[x - radio, y - radio], [x + radio, y + radio]])
+        )
+        # Solo columnas y filas que existen en la rejilla
+        ancho = int(self.claves[-1] // self.alto)
+        x0, x1 = max(x0, 0), min(x1, ancho)
+        y0, y1 = max(y0, 0), min(y1, self.alto - 1)
+        if x0 > x1 or y0 > y1:
+            return np.zeros(0, dtype=np.int64)
+        # En cada columna el rango de filas [y0, y1] es un tramo contiguo de `orden`
+        columnas = np.arange(x0, x1 + 1) * self.alto
+        inicios = np.searchsorted(self.claves, columnas + y0)
+        fines = np.searchsorted(self.claves, columnas + y1, side="right")
+        columna, local = expandir(fines - inicios)
+        candidatos = self.orden[inicios[columna] + local]
+        dx = self.posiciones[candidatos, 0] - x
+        dy = self.posiciones[candidatos, 1] - y
+        return np.sort(candidatos[dx * dx + dy * dy <= radio * radio])
+
+    # Parejas de celdas a comparar para encontrar los pares a distancia <= radio: cada
+    # celda consigo misma y con la mitad de sus vecinas a ceil(radio / tamano_celda)
+    # celdas (media plantilla), así cada par de celdas se visita una única vez.
+    # Genera (misma_celda, celdas origen, celdas destino) por desplazamiento
+    def _parejas_celdas(self, radio):
+        k = int(np.ceil(radio / self.tamano_celda))
+        desplazamientos = [(0, 0)] + [(0, dy) for dy in range(1, k + 1)]
+        desplazamientos += [
+            (dx, dy) for dx in range(1, k + 1) for dy in range(-k, k + 1)
+        ]
+        for desplazamiento_x, desplazamiento_y in desplazamientos:
+            vecinas = (
+                self.claves_celda + desplazamiento_x * self.alto + desplazamiento_y
+            )
+            posicion = np.minimum(
+                np.searchsorted(self.claves_celda, vecinas), len(self.claves_celda) - 1
+            )
+            existe = self.claves_celda[posicion] == vecinas
+            # Una fila fuera de [0, alto) cae en otra columna: no es vecina real
+            fila_vecina = self.claves_celda % self.alto + desplazamiento_y
+            existe &= (fila_vecina >= 0) & (fila_vecina < self.alto)
+            misma_celda = desplazamiento_x == 0 and desplazamiento_y == 0
+            yield misma_celda, np.flatnonzero(existe), posicion[existe]
+
+    # Número de pares candidatos que examinaría pares_cercanos(radio), sin generarlos
+    def num_candidatos(self, radio=None):
+        radio = self.tamano_celda if radio is None else float(radio)
+        total = 0
+        for misma_celda, origen, destino in self._parejas_celdas(radio):
+            cantidades = self.cantidades[origen] * self.cantidades[destino]
+            if misma_celda:
+                cantidades = (cantidades - self.cantidades[origen]) // 2
+            total += int(cantidades.sum())
+        return total
+
+    # Todos los pares (i < j) a distancia <= radio, con sus distancias. Los candidatos
+    # se generan y filtran por tramos, así la memoria depende de los pares cercanos
+    # y no de los candidatos
+    def pares_cercanos(self, radio=None):
+        radio = self.tamano_celda if radio is None else float(radio)
+        vacio = np.zeros(0, dtype=np.int64)
+        if len(self.posiciones) < 2:
+            return vacio, vacio, np.zeros(0)
+
+        lista_i, lista_j, lista_distancias = [], [], []
+        for misma_celda, origen, destino in self._parejas_celdas(radio):
+            cantidad_origen = self.cantidades[origen]
+            cantidad_destino = self.cantidades[destino]
+            for inicio, fin in tramos(cantidad_origen * cantidad_destino):
+                pareja, local = expandir(
+                    cantidad_origen[inicio:fin] * cantidad_destino[inicio:fin]
+                )
+                fila, columna = np.divmod(local, cantidad_destino[inicio:fin][pareja])
+                i = self.orden[self.inicios[origen[inicio:fin]][pareja] + fila]
+                j = self.orden[self.inicios[destino[inicio:fin]][pareja] + columna]
+                if misma_celda:
+                    # Dentro de la misma celda cada par aparece dos veces (y consigo misma)
+                    unico = fila < columna
+                    i, j = i[unico], j[unico]
+                dx = self.posiciones[i, 0] - self.posiciones[j, 0]
+                dy = self.posiciones[i, 1] - self.posiciones[j, 1]
+                distancias = np.sqrt(dx * dx + dy * dy)
+                cerca = distancias <= radio
+                lista_i.append(i[cerca])
+                lista_j.append(j[cerca])
+                lista_distancias.append(distancias[cerca])
+
+        if not lista_i:
+            return vacio, vacio, np.zeros(0)
+        i = np.concatenate(lista_i)
+        j = np.concatenate(lista_j)
+        return np.minimum(i, j), np.maximum(i, j), np.concatenate(lista_distancias)
+
+    # Pares (i < j) de partículas que se solapan (distancia < r_i + r_j) y su distancia
+    def solapamientos(self, radios):
+        i, j, distancias = self.pares_cercanos(2 * float(np.max(radios)))
+        solapa = distancias < radios[i] + radios[j]
+        return i[solapa], j[solapa], distancias[solapa]
@@ -0,0 +1,100 @@
+import argparse
+import os
+import time
+import numpy as np
+from Controllers.BarridoParalelo import (
+    CODIGOS_METODO,
+    METODOS,
+    ResultadosColumnares,
+    configuraciones,
+    ejecutar_barrido,
+)
+
+DIA = 86400
+
+
+def mostrar_progreso(fila, hechas, total):
+    nombre = list(METODOS)[int(fila["metodo"])]
+    print(
+        f"[{hechas}/{total}] {nombre:>14} dt={fila['dt'] / DIA:g} d "
+        f"v0={fila['velocidad_inicial']:.0f} m/s  "
+        f"deriva={fila['deriva_energia_maxima']:.2e}  "
+        f"{fila['segundos']:.2f} s (pid {int(fila['trabajador'])})"
+    )
+
+
+# Rendimiento de cada proceso: configuraciones y pasos por segundo de cálculo
+def mostrar_trabajadores(estadisticas, duracion):
+    print(f"\n{'trabajador':>10} {'config.':>8} {'pasos':>10} {'pasos/s':>10}")
+    for pid, (n, pasos, segundos) in sorted(estadisticas.items()):
+        print(f"{int(pid):>10} {n:>8} {pasos:>10.0f} {pasos / segundos:>10.0f}")
+    n_total = sum(n for n, _, _ in estadisticas.values())
+    pasos_total = sum(pasos for _, pasos, _ in estadisticas.values())
+    print(
+        f"{'total':>10} {n_total:>8} {pasos_total:>10.0f} "
+        f"{pasos_total / duracion if duracion else 0:>10.0f}  "
+        f"({duracion:.2f} s de reloj)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Barrido de integradores, dt y velocidades iniciales en paralelo"
+    )
+    parser.add_argument(
+        "--metodos", nargs="+", default=list(METODOS), choices=list(METODOS)
+    )
+    parser.add_argument(
+        "--dts",
+        nargs="+",
+        type=float,
+        default=[4, 2, 1, 0.5],
+        help="Pasos de tiempo en días",
+    )
+    parser.add_argument(
+        "--velocidades",
+        nargs=3,
+        type=float,
+        default=[20000, 40000, 5],
+        metavar=("MIN", "MAX", "N"),
+        help="Velocidades iniciales (m/s): N valores entre MIN y MAX",
+    )
+    parser.add_argument("--anios", type=float, default=1, help="Años simulados")
+    parser.add_argument(
+        "--salida",
+        default="resultados_barrido",
+        help="Directorio de resultados (si ya existe, el barrido se reanuda)",
+    )
+    parser.add_argument(
+        "--procesos",
+        type=int,
+        default=None,
+        help="Procesos (por defecto, uno por núcleo)",
+    )
+    argumentos = parser.parse_args()
+
+    minimo, maximo, n = argumentos.velocidades
+    configs = configuraciones(
+        argumentos.metodos,
+        [d * DIA for d in argumentos.dts],
+        np.linspace(minimo, maximo, int(n)),
+        argumentos.anios * 365 * DIA,
+    )
+    procesos = argumentos.procesos or os.cpu_count() or 1
+    print(f"{len(configs)} configuraciones en {procesos} procesos")
+    inicio = time.perf_counter()
+    estadisticas = ejecutar_barrido(
+        configs, argumentos.salida, procesos, al_completar=mostrar_progreso
+    )
+    mostrar_trabajadores(estadisticas, time.perf_counter() - inicio)
+
+    # Resumen a partir del archivo columnar: mejor deriva de energía por método
+    datos = ResultadosColumnares(argumentos.salida).cargar()
+    print(f"\n{'método':>14} {'config.':>8} {'deriva máx. mínima':>19}")
+    for nombre in argumentos.metodos:
+        filas = datos["metodo"] == CODIGOS_METODO[nombre]
+        if filas.any():
+            print(
+                f"{nombre:>14} {filas.sum():>8} "
+                f"{datos['deriva_energia_maxima'][filas].min():>19.3e}"
+            )
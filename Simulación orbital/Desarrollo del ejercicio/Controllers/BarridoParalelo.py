@@ -0,0 +1,185 @@
+import itertools
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import numpy as np
+from Models.Metodos import METODOS
+from Models.Diagnosticos import diagnosticar
+
+# Código numérico de cada integrador en el archivo de resultados: su posición en la
+# tabla METODOS
+CODIGOS_METODO = {nombre: codigo for codigo, nombre in enumerate(METODOS)}
+
+# Columnas de entrada (identifican la configuración) y de resultado
+COLUMNAS_CONFIGURACION = ("metodo", "dt", "velocidad_inicial", "t_total")
+# Columnas copiadas de Diagnosticos.diagnosticar
+COLUMNAS_DIAGNOSTICO = (
+    "energia_inicial",
+    "deriva_energia",
+    "deriva_energia_maxima",
+    "deriva_momento_maxima",
+    "excentricidad",
+    "periodo",
+    "perihelio",
+    "afelio",
+)
+COLUMNAS_RESULTADO = (
+    ("pasos", "evaluaciones")
+    + COLUMNAS_DIAGNOSTICO
+    + ("x_final", "y_final", "segundos", "trabajador")
+)
+# Configuraciones en vuelo por proceso: mantiene a todos ocupados sin encolar el
+# barrido completo de golpe
+EN_VUELO_POR_PROCESO = 4
+
+
+# Producto cartesiano de los parámetros del barrido: (código de método, dt,
+# velocidad inicial, t_total)
+def configuraciones(metodos, dts, velocidades, t_total):
+    for nombre in metodos:
+        if nombre not in METODOS:
+            raise ValueError(
+                f"Método desconocido: {nombre}. Opciones: {', '.join(METODOS)}"
+            )
+    return [
+        (float(CODIGOS_METODO[nombre]), float(dt), float(v), float(t_total))
+        for nombre, dt, v in itertools.product(metodos, dts, velocidades)
+    ]
+
+
+# Resultados en formato columnar: un archivo binario float64 por columna dentro de un
+# directorio, más un esquema JSON. Cada fila se añade al final de todas las columnas
+# y se vuelca a disco en el momento, así un barrido interrumpido conserva lo hecho.
+# Un directorio existente solo se reanuda si su esquema coincide con el actual; si la
+# interrupción dejó a medias la última fila, las columnas se recortan a la menor
+class ResultadosColumnares:
+    def __init__(self, directorio):
+        self.directorio = directorio
+        self.columnas = COLUMNAS_CONFIGURACION + COLUMNAS_RESULTADO
+        esquema = {"columnas": list(self.columnas), "metodos": list(METODOS)}
+        ruta_esquema = os.path.join(directorio, "esquema.json")
+        if os.path.exists(ruta_esquema):
+            with open(ruta_esquema) as archivo:
+                guardado = json.load(archivo)
+            if guardado != esquema:
+                raise ValueError(
+                    f"{directorio} guarda un barrido con otras columnas o métodos "
+                    f"({ruta_esquema}); use otro directorio de resultados"
+                )
+        else:
+            os.makedirs(directorio, exist_ok=True)
+            with open(ruta_esquema, "w") as archivo:
+                json.dump(esquema, archivo, indent=2)
+        self._reparar()
+        self._archivos = None
+
+    def _ruta(self, columna):
+        return os.path.join(self.directorio, f"{columna}.f64")
+
+    def _reparar(self):
+        tamanos = [
+            os.path.getsize(self._ruta(c)) if os.path.exists(self._ruta(c)) else 0
+            for c in self.columnas
+        ]
+        filas = min(tamanos) // 8
+        # Una escritura interrumpida deja como mucho una fila de diferencia; más que
+        # eso es un directorio dañado y recortarlo borraría resultados terminados
+        if max(tamanos) > (filas + 1) * 8:
+            raise ValueError(
+                f"Las columnas de {self.directorio} tienen entre {filas} y "
+                f"{max(tamanos) / 8:.0f} filas; no se recortan automáticamente"
+            )
+        for columna, tamano in zip(self.columnas, tamanos):
+            # Crea las columnas que falten y recorta la fila incompleta
+            with open(self._ruta(columna), "ab") as archivo:
+                if tamano != filas * 8:
+                    archivo.truncate(filas * 8)
+
+    def abrir(self):
+        self._archivos = [open(self._ruta(c), "ab") for c in self.columnas]
+
+    def cerrar(self):
+        for archivo in self._archivos or []:
+            archivo.close()
+        self._archivos = None
+
+    # Añade una fila (diccionario con todas las columnas)
+    def anadir(self, fila):
+        for columna, archivo in zip(self.columnas, self._archivos):
+            archivo.write(np.float64(fila[columna]).tobytes())
+        for archivo in self._archivos:
+            archivo.flush()
+
+    # Todas las columnas como arrays de NumPy
+    def cargar(self):
+        return {c: np.fromfile(self._ruta(c), dtype=np.float64) for c in self.columnas}
+
+    # Configuraciones que ya tienen resultado
+    def hechas(self):
+        datos = self.cargar()
+        return set(zip(*(datos[c].tolist() for c in COLUMNAS_CONFIGURACION)))
+
+
+# Trabajo de un proceso: simula una configuración y resume su trayectoria
+def ejecutar_configuracion(configuracion):
+    codigo, dt, velocidad_inicial, t_total = configuracion
+    clase = list(METODOS.values())[int(codigo)]
+    inicio = time.perf_counter()
+    simulador = clase(dt=dt, velocidad_inicial=velocidad_inicial, t_total=t_total)
+    simulador.simular()
+    diagnostico = diagnosticar(simulador)
+    fila = dict(zip(COLUMNAS_CONFIGURACION, configuracion))
+    fila.update({c: diagnostico[c] for c in COLUMNAS_DIAGNOSTICO})
+    fila.update(
+        pasos=simulador.trayectoria.pasos,
+        evaluaciones=simulador.evaluaciones,
+        x_final=simulador.x,
+        y_final=simulador.y,
+        segundos=time.perf_counter() - inicio,
+        trabajador=os.getpid(),
+    )
+    return fila
+
+
+# Reparte las configuraciones pendientes entre `procesos` y guarda cada resultado en
+# cuanto llega. Devuelve estadísticas por trabajador: {pid: (configuraciones, pasos,
+# segundos de cálculo)}. `al_completar(fila, hechas, total)` permite mostrar progreso
+def ejecutar_barrido(configs, directorio, procesos=None, al_completar=None):
+    resultados = ResultadosColumnares(directorio)
+    hechas = resultados.hechas()
+    pendientes = [c for c in configs if c not in hechas]
+    total = len(configs)
+    completadas = total - len(pendientes)
+    pendientes = iter(pendientes)
+    procesos = procesos or os.cpu_count() or 1
+    estadisticas = {}
+
+    resultados.abrir()
+    try:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            en_vuelo = {
+                pool.submit(ejecutar_configuracion, c)
+                for c in itertools.islice(pendientes, procesos * EN_VUELO_POR_PROCESO)
+            }
+            while en_vuelo:
+                listas, en_vuelo = wait(en_vuelo, return_when=FIRST_COMPLETED)
+                for futuro in listas:
+                    fila = futuro.result()
+                    resultados.anadir(fila)
+                    completadas += 1
+                    n, pasos, segundos = estadisticas.get(
+                        fila["trabajador"], (0, 0, 0.0)
+                    )
+                    estadisticas[fila["trabajador"]] = (
+                        n + 1,
+                        pasos + fila["pasos"],
+                        segundos + fila["segundos"],
+                    )
+                    if al_completar is not None:
+                        al_completar(fila, completadas, total)
+                for c in itertools.islice(pendientes, len(listas)):
+                    en_vuelo.add(pool.submit(ejecutar_configuracion, c))
+    finally:
+        resultados.cerrar()
+    return estadisticas
@@ -3,7 +3,17 @@ class Controlador:
         self.simulador = simulador
         self.vista = vista
 
-    def ejecutar_simulacion(self):
+    # Con rapido=True usa la animación incremental de la vista (trayectorias largas)
+    def ejecutar_simulacion(self, rapido=False):
         self.simulador.simular()
         self.vista.configurar_grafico()
-        self.vista.animar()
+        if rapido:
+            self.vista.animar_rapido()
+        else:
+            self.vista.animar()
+
+    # Anima mientras se simula: la vista recibe los estados en bloques según se
+    # calculan, sin esperar a que termine la simulación
+    def ejecutar_en_vivo(self, tamano_bloque=5):
+        self.vista.configurar_grafico()
+        self.vista.animar_en_vivo(self.simulador.simular_por_bloques(tamano_bloque))
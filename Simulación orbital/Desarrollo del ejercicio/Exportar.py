@@ -0,0 +1,38 @@
+import argparse
+import time
+from Models.Metodos import METODOS
+from Views.ExportadorOrbital import ExportadorOrbital
+
+DIA = 86400
+
+# Graba una simulación orbital sin pantalla (servidores de cálculo)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Exporta la simulación orbital a vídeo o imágenes sin pantalla"
+    )
+    parser.add_argument(
+        "--video",
+        required=True,
+        help="Archivo .mp4 o .gif (con ffmpeg) o carpeta donde guardar PNG",
+    )
+    parser.add_argument("--metodo", choices=list(METODOS), default="verlet")
+    parser.add_argument("--dt", type=float, default=1, help="Paso de tiempo en días")
+    parser.add_argument(
+        "--velocidad", type=float, default=29783, help="Velocidad inicial (m/s)"
+    )
+    parser.add_argument("--anios", type=float, default=1, help="Años simulados")
+    parser.add_argument("--fotogramas", type=int, default=300)
+    parser.add_argument("--fps", type=int, default=30)
+    argumentos = parser.parse_args()
+
+    simulador = METODOS[argumentos.metodo](
+        dt=argumentos.dt * DIA,
+        velocidad_inicial=argumentos.velocidad,
+        t_total=argumentos.anios * 365 * DIA,
+    )
+    inicio = time.perf_counter()
+    escritos = ExportadorOrbital(simulador, argumentos.video, argumentos.fps).exportar(
+        argumentos.fotogramas
+    )
+    duracion = time.perf_counter() - inicio
+    print(f"{escritos} fotogramas en {duracion:.2f} s guardados en {argumentos.video}")
@@ -5,7 +5,12 @@ from Controllers.Controlador import Controlador
 
 # Elegir método (EulerSimulador o VerletSimulador)
 simulador = VerletSimulador(dt=86400, velocidad_inicial=29783)
+# Sistema solar completo con gravedad mutua (la vista sigue a la Tierra):
+# from Models.NCuerposSimulador import NCuerposSimulador
+# simulador = NCuerposSimulador.sistema_solar(asteroides=2000)
 vista = VistaOrbital(simulador)
 controlador = Controlador(simulador, vista)
 
 controlador.ejecutar_simulacion()
+# Animar mientras se simula, sin esperar al final:
+# controlador.ejecutar_en_vivo()
@@ -0,0 +1,100 @@
+import math
+import numpy as np
+
+
+# Trayectoria (t, x, y, vx, vy) guardada en un bloque float64 preasignado. Guarda una
+# de cada `cada` muestras. En modo circular conserva solo las últimas `capacidad`
+# muestras, para simulaciones sin final; si no es circular y la capacidad se queda
+# corta, el bloque duplica su tamaño
+class AlmacenTrayectoria:
+    CAMPOS = ("t", "x", "y", "vx", "vy")
+
+    def __init__(self, capacidad, cada=1, circular=False):
+        if capacidad < 1:
+            raise ValueError("La capacidad de la trayectoria debe ser al menos 1")
+        if cada < 1:
+            raise ValueError("El diezmado (cada) debe ser al menos 1")
+        self.cada = cada
+        self.circular = circular
+        self.pasos = 0  # Pasos ofrecidos a registrar (antes de diezmar)
+        # Muestras guardadas (en modo circular puede superar la capacidad)
+        self.total = 0
+        self.datos = np.empty((len(self.CAMPOS), 0))
+        self._reservar(capacidad)
+
+    # Almacén dimensionado para los pasos de una simulación de t_total segundos
+    @classmethod
+    def para_simulacion(cls, t_total, dt, cada=1, circular=False, capacidad=None):
+        if capacidad is None:
+            if not math.isfinite(t_total):
+                raise ValueError(
+                    "Una simulación sin final necesita una capacidad fija (búfer circular)"
+                )
+            capacidad = math.ceil(t_total / dt) // cada + 1
+        return cls(capacidad, cada, circular)
+
+    def _reservar(self, capacidad):
+        # Conserva las muestras ya guardadas (solo se amplía en modo no circular)
+        datos = np.empty((len(self.CAMPOS), capacidad))
+        datos[:, : self.total] = self.datos[:, : self.total]
+        self.datos = datos
+        self.capacidad = capacidad
+        # Asignar floats de Python en un memoryview es bastante más rápido que
+        # indexar el array de NumPy, y el valor se guarda sin caja (8 bytes)
+        self._columnas = [memoryview(fila) for fila in datos]
+
+    # Registra un paso; devuelve la posición donde se guardó o None si se descartó
+    def registrar(self, t, x, y, vx, vy):
+        self.pasos += 1
+        if self.pasos % self.cada:
+            return None
+        k = self.total
+        if k >= self.capacidad:
+            if self.circular:
+                k %= self.capacidad
+            else:
+                self._reservar(2 * self.capacidad)
+        col_t, col_x, col_y, col_vx, col_vy = self._columnas
+        col_t[k] = t
+        col_x[k] = x
+        col_y[k] = y
+        col_vx[k] = vx
+        col_vy[k] = vy
+        self.total += 1
+        return k
+
+    def reiniciar(self):
+        self.pasos = 0
+        self.total = 0
+
+    def __len__(self):
+        return min(self.total, self.capacidad)
+
+    # Valores guardados de un campo en orden cronológico
+    def columna(self, campo):
+        fila = self.datos[self.CAMPOS.index(campo)]
+        if self.total <= self.capacidad:
+            return fila[: self.total]
+        # Búfer circular lleno: la muestra más antigua está en la posición de escritura
+        inicio = self.total % self.capacidad
+        return np.concatenate((fila[inicio:], fila[:inicio]))
+
+    @property
+    def t(self):
+        return self.columna("t")
+
+    @property
+    def x(self):
+        return self.columna("x")
+
+    @property
+    def y(self):
+        return self.columna("y")
+
+    @property
+    def vx(self):
+        return self.columna("vx")
+
+    @property
+    def vy(self):
+        return self.columna("vy")
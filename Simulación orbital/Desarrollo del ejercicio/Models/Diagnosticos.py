@@ -0,0 +1,197 @@
+import numpy as np
+from .SimuladorBase import SimuladorBase
+
+# Diagnósticos de la órbita de un cuerpo alrededor del Sol (mu = G·M_SOL) calculados
+# con NumPy sobre arrays de muestras: energía específica cinética y potencial, momento
+# angular específico, excentricidad, periodo y deriva de las cantidades conservadas.
+# Sirven para comparar integradores y elegir el dt más barato que cumple la precisión
+
+
+# Energía específica cinética y potencial de cada muestra
+def energias(x, y, vx, vy, mu):
+    return 0.5 * (vx**2 + vy**2), -mu / np.sqrt(x**2 + y**2)
+
+
+def energia_especifica(x, y, vx, vy, mu):
+    cinetica, potencial = energias(x, y, vx, vy, mu)
+    return cinetica + potencial
+
+
+# Componente z del momento angular específico (r × v)
+def momento_angular(x, y, vx, vy):
+    return x * vy - y * vx
+
+
+# Excentricidad de la cónica a partir de la energía y el momento angular
+def excentricidad(energia, momento, mu):
+    return np.sqrt(np.maximum(0.0, 1 + 2 * energia * momento**2 / mu**2))
+
+
+# Periodo de la elipse según la tercera ley de Kepler (NaN si la órbita no es ligada)
+def periodo_kepler(energia, mu):
+    energia = np.asarray(energia, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        semieje = -mu / (2 * energia)
+        return np.where(energia < 0, 2 * np.pi * np.sqrt(semieje**3 / mu), np.nan)
+
+
+# Deriva relativa a `referencia`; NaN si la referencia es 0 (caída radial con L0 = 0,
+# órbita parabólica con E0 = 0), donde una deriva relativa no tiene sentido
+def deriva_relativa(deriva, referencia):
+    return deriva / abs(referencia) if referencia != 0 else np.nan
+
+
+# Acumula los diagnósticos bloque a bloque, con memoria constante: admite los bloques
+# (5, n) de SimuladorBase.simular_por_bloques (filas t, x, y, vx, vy). `inicial` es el
+# estado (x, y, vx, vy) de referencia en el instante `t_inicial`; el periodo se mide
+# como el tiempo en barrer 2π desde ahí, interpolando dentro del paso en que se
+# completa la vuelta
+class DiagnosticoIncremental:
+    def __init__(self, mu, inicial, t_inicial=0.0):
+        self.mu = mu
+        x, y, vx, vy = inicial
+        self.energia_inicial = float(energia_especifica(x, y, vx, vy, mu))
+        self.momento_inicial = float(momento_angular(x, y, vx, vy))
+        r = float(np.hypot(x, y))
+        self.perihelio = r
+        self.afelio = r
+        self.deriva_energia_maxima = 0.0
+        self.deriva_momento_maxima = 0.0
+        self.periodo = np.nan
+        self.muestras = 0
+        self.t_inicial = float(t_inicial)
+        self._anterior = (self.t_inicial, x, y)  # Última muestra: t, x, y
+        self._angulo = 0.0
+        self._ultimo = (x, y, vx, vy)
+        self.t_final = self.t_inicial
+
+    def actualizar(self, bloque):
+        t, x, y, vx, vy = bloque
+        if len(t) == 0:
+            return
+        energia = energia_especifica(x, y, vx, vy, self.mu)
+        momento = momento_angular(x, y, vx, vy)
+        r = np.sqrt(x**2 + y**2)
+        self.perihelio = min(self.perihelio, float(r.min()))
+        self.afelio = max(self.afelio, float(r.max()))
+        self.deriva_energia_maxima = max(
+            self.deriva_energia_maxima,
+            float(np.max(np.abs(energia - self.energia_inicial))),
+        )
+        self.deriva_momento_maxima = max(
+            self.deriva_momento_maxima,
+            float(np.max(np.abs(momento - self.momento_inicial))),
+        )
+
+        if np.isnan(self.periodo):
+            # Ángulo barrido entre muestras consecutivas (la primera, desde el bloque
+            # anterior) y su suma acumulada
+            t_previo = np.concatenate(([self._anterior[0]], t[:-1]))
+            x_previo = np.concatenate(([self._anterior[1]], x[:-1]))
+            y_previo = np.concatenate(([self._anterior[2]], y[:-1]))
+            barrido = np.arctan2(
+                x_previo * y - y_previo * x, x_previo * x + y_previo * y
+            )
+            acumulado = self._angulo + np.cumsum(barrido)
+            vuelta = np.flatnonzero(np.abs(acumulado) >= 2 * np.pi)
+            if len(vuelta):
+                k = vuelta[0]
+                antes = acumulado[k] - barrido[k]
+                fraccion = (2 * np.pi - abs(antes)) / abs(barrido[k])
+                self.periodo = float(
+                    t_previo[k] + fraccion * (t[k] - t_previo[k]) - self.t_inicial
+                )
+            self._angulo = float(acumulado[-1])
+
+        self._anterior = (float(t[-1]), float(x[-1]), float(y[-1]))
+        self._ultimo = (float(x[-1]), float(y[-1]), float(vx[-1]), float(vy[-1]))
+        self.t_final = float(t[-1])
+        self.muestras += len(t)
+
+    # Resumen de la ejecución (las derivas son relativas al valor inicial, NaN si este
+    # es 0)
+    def resultado(self):
+        x, y, vx, vy = self._ultimo
+        energia_final = float(energia_especifica(x, y, vx, vy, self.mu))
+        momento_final = float(momento_angular(x, y, vx, vy))
+        return {
+            "muestras": self.muestras,
+            "t_final": self.t_final,
+            "energia_inicial": self.energia_inicial,
+            "deriva_energia": deriva_relativa(
+                energia_final - self.energia_inicial, self.energia_inicial
+            ),
+            "deriva_energia_maxima": deriva_relativa(
+                self.deriva_energia_maxima, self.energia_inicial
+            ),
+            "momento_inicial": self.momento_inicial,
+            "deriva_momento_maxima": deriva_relativa(
+                self.deriva_momento_maxima, self.momento_inicial
+            ),
+            "excentricidad": float(
+                excentricidad(self.energia_inicial, self.momento_inicial, self.mu)
+            ),
+            "excentricidad_final": float(
+                excentricidad(energia_final, momento_final, self.mu)
+            ),
+            "periodo_kepler": float(periodo_kepler(self.energia_inicial, self.mu)),
+            "periodo": self.periodo,
+            "perihelio": self.perihelio,
+            "afelio": self.afelio,
+        }
+
+
+# Diagnósticos de la trayectoria guardada de un simulador ya ejecutado. La referencia
+# es el estado inicial registrado por el simulador; si no lo hay, o si el búfer
+# circular ya descartó las primeras muestras, lo es la muestra más antigua que se
+# conserva (el periodo y las derivas se miden desde ella). Sin estado inicial ni
+# muestras se usa el estado actual del simulador
+def diagnosticar(simulador):
+    tray = simulador.trayectoria
+    datos = np.stack([tray.columna(campo) for campo in tray.CAMPOS])
+    inicial = getattr(simulador, "estado_inicial", None)
+    t_inicial = 0.0
+    if tray.total > tray.capacidad or (inicial is None and datos.shape[1]):
+        t_inicial, inicial = datos[0, 0], datos[1:, 0]
+        datos = datos[:, 1:]
+    elif inicial is None:
+        inicial = (simulador.x, simulador.y, simulador.vx, simulador.vy)
+    diagnostico = DiagnosticoIncremental(
+        simulador.G * simulador.M_SOL, inicial, t_inicial
+    )
+    diagnostico.actualizar(datos)
+    return diagnostico.resultado()
+
+
+# Simula en flujo (sin guardar la trayectoria) y diagnostica bloque a bloque. La
+# referencia es el estado actual del simulador, el mismo desde el que arranca
+# simular_por_bloques; si no se da ningún paso (t_final <= 0) el resumen es el de ese
+# estado
+def diagnosticar_en_flujo(simulador, tamano=1024, t_final=None):
+    diagnostico = DiagnosticoIncremental(
+        simulador.G * simulador.M_SOL,
+        (simulador.x, simulador.y, simulador.vx, simulador.vy),
+    )
+    for bloque in simulador.simular_por_bloques(tamano, t_final):
+        diagnostico.actualizar(bloque)
+    return diagnostico.resultado()
+
+
+# Informe compacto de una ejecución (días y UA para leerlo de un vistazo)
+def informe(resultado, nombre="", dia=86400, ua=SimuladorBase.UA):
+    periodo = resultado["periodo"] / dia
+    return (
+        f"{nombre + ': ' if nombre else ''}"
+        f"{resultado['muestras']} muestras, {resultado['t_final'] / dia:.1f} días\n"
+        f"  energía  E0 = {resultado['energia_inicial']:.6e} J/kg  "
+        f"deriva final {resultado['deriva_energia']:+.2e}  "
+        f"máx. {resultado['deriva_energia_maxima']:.2e}\n"
+        f"  momento  L0 = {resultado['momento_inicial']:.6e} m²/s  "
+        f"deriva máx. {resultado['deriva_momento_maxima']:.2e}\n"
+        f"  órbita   e = {resultado['excentricidad']:.6f} "
+        f"(final {resultado['excentricidad_final']:.6f})  "
+        f"perihelio {resultado['perihelio'] / ua:.4f} UA  "
+        f"afelio {resultado['afelio'] / ua:.4f} UA\n"
+        f"  periodo  Kepler {resultado['periodo_kepler'] / dia:.3f} d  "
+        f"medido {'—' if np.isnan(periodo) else f'{periodo:.3f} d'}"
+    )
@@ -0,0 +1,156 @@
+import numpy as np
+from .SimuladorBase import SimuladorBase
+
+
+# Integra a la vez muchas configuraciones del problema de un cuerpo alrededor del Sol
+# (un "ensamble"): cada miembro tiene su posición, velocidad y dt iniciales y todos
+# avanzan al mismo ritmo con operaciones de NumPy sobre arrays de tamaño M. Usa las
+# mismas fórmulas que EulerSimulador y VerletSimulador, de modo que cada miembro
+# reproduce la trayectoria del simulador escalar equivalente (salvo el último bit de
+# algunas potencias, que NumPy redondea distinto que math).
+# Cualquier parámetro puede ser un escalar o un array; se difunden a un tamaño común
+class EnsambleSimulador:
+    G = SimuladorBase.G
+    M_SOL = SimuladorBase.M_SOL
+    UA = SimuladorBase.UA
+    METODOS = ("verlet", "euler")
+
+    def __init__(
+        self,
+        velocidad_inicial=29783,
+        dt=86400,
+        x=None,
+        y=0.0,
+        vx=0.0,
+        t_total=None,
+        metodo="verlet",
+        guardar_trayectorias=False,
+        cada=1,
+    ):
+        if metodo not in self.METODOS:
+            raise ValueError(
+                f"Método desconocido: {metodo}. Opciones: {', '.join(self.METODOS)}"
+            )
+        x = self.UA if x is None else x
+        self.x, self.y, self.vx, self.vy, self.dt = [
+            np.array(valor, dtype=float)
+            for valor in np.broadcast_arrays(x, y, vx, velocidad_inicial, dt)
+        ]
+        self.x, self.y, self.vx, self.vy, self.dt = [
+            valor.reshape(-1) for valor in (self.x, self.y, self.vx, self.vy, self.dt)
+        ]
+        self.num_miembros = len(self.x)
+        # Como en SimuladorBase, un año de 365 pasos si no se indica; con dt distintos
+        # 365 pasos del mayor, para que ningún miembro se quede sin su año
+        self.t_total = np.max(self.dt) * 365 if t_total is None else t_total
+        self.metodo = metodo
+        self.guardar_trayectorias = guardar_trayectorias
+        self.cada = cada
+        self.trayectorias = None
+        self.evaluaciones = 0  # Evaluaciones vectorizadas (cada una sobre M miembros)
+
+    # Aceleración de todos los miembros a la vez; devuelve también la distancia al Sol
+    def calcular_aceleracion(self, x, y):
+        self.evaluaciones += 1
+        r = np.sqrt(x**2 + y**2)
+        a_mag = -self.G * self.M_SOL / r**3
+        return a_mag * x, a_mag * y, r
+
+    def energia_especifica(self, x, y, vx, vy):
+        return 0.5 * (vx**2 + vy**2) - self.G * self.M_SOL / np.sqrt(x**2 + y**2)
+
+    # Integra todos los miembros hasta t_total y devuelve sus métricas (ver metricas)
+    def simular(self):
+        x, y, vx, vy = self.x.copy(), self.y.copy(), self.vx.copy(), self.vy.copy()
+        dt = self.dt
+        t = np.zeros(self.num_miembros)
+        activos = t < self.t_total
+        energia_inicial = self.energia_especifica(x, y, vx, vy)
+        deriva_maxima = np.zeros(self.num_miembros)
+        # Energía del último estado; con t_total <= 0 el bucle no da ningún paso
+        energia = energia_inicial
+        r_min = np.sqrt(x**2 + y**2)
+        r_max = r_min.copy()
+        # Ángulo barrido acumulado y periodo (primera vuelta completa)
+        angulo = np.zeros(self.num_miembros)
+        periodo = np.full(self.num_miembros, np.nan)
+
+        pasos_maximos = int(np.ceil(np.max(self.t_total / dt)))
+        trayectorias = []
+        if self.guardar_trayectorias:
+            trayectorias = np.empty(
+                (pasos_maximos // self.cada + 1, self.num_miembros, 2)
+            )
+        muestras = 0
+        pasos = 0
+
+        ax, ay, _ = self.calcular_aceleracion(x, y)
+        while activos.any():
+            if self.metodo == "euler":
+                vx_n = vx + ax * dt
+                vy_n = vy + ay * dt
+                x_n = x + vx_n * dt
+                y_n = y + vy_n * dt
+                ax_n, ay_n, r = self.calcular_aceleracion(x_n, y_n)
+            else:
+                x_n = x + vx * dt + 0.5 * ax * dt**2
+                y_n = y + vy * dt + 0.5 * ay * dt**2
+                # La aceleración en la posición nueva sirve también para el paso
+                # siguiente: una evaluación por paso
+                ax_n, ay_n, r = self.calcular_aceleracion(x_n, y_n)
+                vx_n = vx + 0.5 * (ax + ax_n) * dt
+                vy_n = vy + 0.5 * (ay + ay_n) * dt
+
+            # Ángulo barrido en este paso; el periodo se interpola al completar 2π
+            barrido = np.arctan2(x * y_n - y * x_n, x * x_n + y * y_n)
+            vuelta = activos & np.isnan(periodo) & (angulo + barrido >= 2 * np.pi)
+            periodo[vuelta] = t[vuelta] + dt[vuelta] * (
+                (2 * np.pi - angulo[vuelta]) / barrido[vuelta]
+            )
+
+            if activos.all():
+                x, y, vx, vy, ax, ay = x_n, y_n, vx_n, vy_n, ax_n, ay_n
+                angulo += barrido
+                t += dt
+                r_activos = r
+            else:
+                # Los miembros que ya llegaron a t_total se quedan congelados
+                x, y = np.where(activos, x_n, x), np.where(activos, y_n, y)
+                vx, vy = np.where(activos, vx_n, vx), np.where(activos, vy_n, vy)
+                ax, ay = np.where(activos, ax_n, ax), np.where(activos, ay_n, ay)
+                angulo += np.where(activos, barrido, 0.0)
+                t += np.where(activos, dt, 0.0)
+                r_activos = np.where(activos, r, r_min)
+            np.minimum(r_min, r_activos, out=r_min)
+            np.maximum(r_max, np.where(activos, r, r_max), out=r_max)
+            energia = self.energia_especifica(x, y, vx, vy)
+            np.maximum(
+                deriva_maxima, np.abs(energia - energia_inicial), out=deriva_maxima
+            )
+
+            pasos += 1
+            if self.guardar_trayectorias and pasos % self.cada == 0:
+                trayectorias[muestras, :, 0] = x
+                trayectorias[muestras, :, 1] = y
+                muestras += 1
+            activos = t < self.t_total
+
+        if self.guardar_trayectorias:
+            self.trayectorias = trayectorias[:muestras]
+        self.x_final, self.y_final, self.vx_final, self.vy_final = x, y, vx, vy
+        self._metricas = {
+            "periodo": periodo,
+            "perihelio": r_min,
+            "afelio": r_max,
+            "energia_inicial": energia_inicial,
+            "deriva_energia": (energia - energia_inicial) / np.abs(energia_inicial),
+            "deriva_energia_maxima": deriva_maxima / np.abs(energia_inicial),
+            "ligado": energia_inicial < 0,
+        }
+        return self._metricas
+
+    # Métricas por miembro de la última simulación: periodo (s, NaN si no completó una
+    # vuelta), perihelio y afelio (m), energía específica inicial, deriva relativa de
+    # la energía al final y máxima, y si la órbita inicial está ligada
+    def metricas(self):
+        return self._metricas
@@ -0,0 +1,15 @@
+from .EulerSimulador import EulerSimulador
+from .VerletSimulador import VerletSimulador
+from .RK4Simulador import RK4Simulador
+from .YoshidaSimulador import YoshidaSimulador
+from .DormandPrinceSimulador import DormandPrinceSimulador
+
+# Integradores de una órbita disponibles por nombre (barridos, exportación). El orden
+# importa: los barridos guardan cada método como su posición en esta tabla
+METODOS = {
+    "euler": EulerSimulador,
+    "verlet": VerletSimulador,
+    "rk4": RK4Simulador,
+    "yoshida": YoshidaSimulador,
+    "dormand_prince": DormandPrinceSimulador,
+}
@@ -0,0 +1,200 @@
+import numpy as np
+from .SimuladorBase import SimuladorBase
+
+
+# Simulador de N cuerpos con gravedad mutua entre los cuerpos masivos (Sol, planetas,
+# lunas) y partículas de prueba sin masa (asteroides) que solo sienten a los masivos.
+# Integra con Verlet de velocidades sobre arrays de NumPy y reutiliza la aceleración
+# del paso anterior, así que hace una evaluación de fuerzas por paso.
+# Mantiene el contrato de SimuladorBase: x, y, vx, vy y x_vals, y_vals corresponden al
+# cuerpo seguido (la Tierra en el sistema solar), y además guarda en `historial` las
+# posiciones de todos los cuerpos masivos en cada muestra
+class NCuerposSimulador(SimuladorBase):
+    def __init__(
+        self,
+        masas,
+        posiciones,
+        velocidades,
+        dt=86400,
+        t_total=None,
+        nombres=None,
+        posiciones_prueba=None,
+        velocidades_prueba=None,
+        cuerpo_seguido=0,
+        suavizado=0.0,
+        cada=1,
+        circular=False,
+        capacidad=None,
+    ):
+        super().__init__(dt, 0.0, t_total, cada, circular, capacidad)
+        self.masas = np.asarray(masas, dtype=float)
+        self.n_masivos = len(self.masas)
+        self.nombres = list(nombres) if nombres is not None else None
+        if posiciones_prueba is None:
+            posiciones_prueba = np.zeros((0, 2))
+            velocidades_prueba = np.zeros((0, 2))
+        # Estado de todos los cuerpos: primero los masivos y después las de prueba
+        self.posiciones = np.concatenate(
+            [np.reshape(posiciones, (-1, 2)), np.reshape(posiciones_prueba, (-1, 2))]
+        ).astype(float)
+        self.velocidades = np.concatenate(
+            [
+                np.reshape(velocidades, (-1, 2)),
+                np.reshape(velocidades_prueba, (-1, 2)),
+            ]
+        ).astype(float)
+        self.suavizado = suavizado  # Longitud de suavizado (m) para encuentros cercanos
+        self.cuerpo_seguido = cuerpo_seguido
+        self._aceleraciones = None
+        self.historial = np.empty((self.trayectoria.capacidad, self.n_masivos, 2))
+        self._actualizar_cuerpo_seguido()
+
+    @property
+    def n_prueba(self):
+        return len(self.posiciones) - self.n_masivos
+
+    # Aceleración de todos los cuerpos debida a los masivos: O(N·M), con N cuerpos en
+    # total y M masivos. Se trabaja por componentes para no reducir un eje de tamaño 2
+    def calcular_aceleraciones(self, posiciones):
+        fuentes = posiciones[: self.n_masivos]
+        dx = fuentes[None, :, 0] - posiciones[:, 0, None]
+        dy = fuentes[None, :, 1] - posiciones[:, 1, None]
+        r2 = dx * dx + dy * dy + self.suavizado**2
+        # Un cuerpo masivo no se atrae a sí mismo: con r² infinito su término es cero
+        diagonal = np.arange(self.n_masivos)
+        r2[diagonal, diagonal] = np.inf
+        factor = (self.G * self.masas)[None, :] / (r2 * np.sqrt(r2))
+        self.evaluaciones += 1
+        aceleraciones = np.empty_like(posiciones)
+        aceleraciones[:, 0] = (factor * dx).sum(axis=1)
+        aceleraciones[:, 1] = (factor * dy).sum(axis=1)
+        return aceleraciones
+
+    # Energía cinética más potencial de los cuerpos masivos (las partículas de prueba
+    # no tienen masa y no aportan)
+    def energia_total(self):
+        m = self.masas
+        v = self.velocidades[: self.n_masivos]
+        p = self.posiciones[: self.n_masivos]
+        cinetica = 0.5 * (m * (v**2).sum(axis=1)).sum()
+        i, j = np.triu_indices(self.n_masivos, k=1)
+        r = np.sqrt(((p[i] - p[j]) ** 2).sum(axis=1) + self.suavizado**2)
+        return cinetica - (self.G * m[i] * m[j] / r).sum()
+
+    def _actualizar_cuerpo_seguido(self):
+        k = self.cuerpo_seguido
+        self.x, self.y = self.posiciones[k]
+        self.vx, self.vy = self.velocidades[k]
+
+    # Un paso de Verlet de velocidades para todos los cuerpos a la vez
+    def paso(self, restante):
+        dt = self.dt
+        if self._aceleraciones is None:
+            self._aceleraciones = self.calcular_aceleraciones(self.posiciones)
+        a = self._aceleraciones
+        self.posiciones += self.velocidades * dt + 0.5 * a * dt**2
+        a_nueva = self.calcular_aceleraciones(self.posiciones)
+        self.velocidades += 0.5 * (a + a_nueva) * dt
+        self._aceleraciones = a_nueva
+        self._actualizar_cuerpo_seguido()
+        return dt
+
+    # Además del cuerpo seguido, guarda las posiciones de todos los masivos
+    def registrar_estado(self, t):
+        k = super().registrar_estado(t)
+        if k is not None:
+            if k >= len(self.historial):
+                # La trayectoria amplió su capacidad: el historial la acompaña
+                ampliado = np.empty((self.trayectoria.capacidad, self.n_masivos, 2))
+                ampliado[: len(self.historial)] = self.historial
+                self.historial = ampliado
+            self.historial[k] = self.posiciones[: self.n_masivos]
+        return k
+
+    # Posiciones de los cuerpos masivos en orden cronológico (muestras, M, 2)
+    def historial_ordenado(self):
+        total, capacidad = self.trayectoria.total, self.trayectoria.capacidad
+        if total <= capacidad:
+            return self.historial[:total]
+        inicio = total % capacidad
+        return np.concatenate((self.historial[inicio:], self.historial[:inicio]))
+
+    # Sol, los ocho planetas y la Luna en órbitas circulares coplanarias (aproximación
+    # con semiejes y masas reales), más `asteroides` partículas de prueba en el
+    # cinturón principal. El sistema se pasa al centro de masas y se sigue a la Tierra.
+    # El paso por defecto (6 h) resuelve la órbita de la Luna; se simula un año
+    @classmethod
+    def sistema_solar(cls, asteroides=0, dt=21600, t_total=None, semilla=0, **opciones):
+        # (nombre, masa en kg, semieje mayor en UA, fase inicial en grados)
+        planetas = [
+            ("Mercurio", 3.301e23, 0.387, 252.3),
+            ("Venus", 4.867e24, 0.723, 182.0),
+            ("Tierra", 5.972e24, 1.000, 100.5),
+            ("Marte", 6.417e23, 1.524, 355.4),
+            ("Júpiter", 1.898e27, 5.203, 34.4),
+            ("Saturno", 5.683e26, 9.537, 50.1),
+            ("Urano", 8.681e25, 19.19, 314.1),
+            ("Neptuno", 1.024e26, 30.07, 304.3),
+        ]
+        G, M_SOL, UA = cls.G, cls.M_SOL, cls.UA
+        t_total = 365 * 86400 if t_total is None else t_total  # 1 año por defecto
+        nombres = ["Sol"]
+        masas = [M_SOL]
+        posiciones = [(0.0, 0.0)]
+        velocidades = [(0.0, 0.0)]
+        for nombre, masa, semieje, fase in planetas:
+            r = semieje * UA
+            v = np.sqrt(G * M_SOL / r)
+            angulo = np.radians(fase)
+            nombres.append(nombre)
+            masas.append(masa)
+            posiciones.append((r * np.cos(angulo), r * np.sin(angulo)))
+            velocidades.append((-v * np.sin(angulo), v * np.cos(angulo)))
+
+        # La Luna, en órbita circular alrededor de la Tierra
+        tierra = nombres.index("Tierra")
+        masa_luna, distancia_luna = 7.342e22, 3.844e8
+        v_luna = np.sqrt(G * masas[tierra] / distancia_luna)
+        angulo = np.radians(planetas[tierra - 1][3])
+        nombres.append("Luna")
+        masas.append(masa_luna)
+        posiciones.append(
+            (
+                posiciones[tierra][0] + distancia_luna * np.cos(angulo),
+                posiciones[tierra][1] + distancia_luna * np.sin(angulo),
+            )
+        )
+        velocidades.append(
+            (
+                velocidades[tierra][0] - v_luna * np.sin(angulo),
+                velocidades[tierra][1] + v_luna * np.cos(angulo),
+            )
+        )
+
+        masas = np.array(masas)
+        posiciones = np.array(posiciones)
+        velocidades = np.array(velocidades)
+        # Centro de masas en reposo en el origen
+        posiciones -= (masas[:, None] * posiciones).sum(axis=0) / masas.sum()
+        velocidades -= (masas[:, None] * velocidades).sum(axis=0) / masas.sum()
+
+        # Asteroides del cinturón principal (2.1–3.3 UA) en órbitas circulares
+        generador = np.random.default_rng(semilla)
+        r = generador.uniform(2.1, 3.3, asteroides) * UA
+        angulo = generador.uniform(0, 2 * np.pi, asteroides)
+        v = np.sqrt(G * M_SOL / r)
+        posiciones_prueba = np.stack([r * np.cos(angulo), r * np.sin(angulo)], axis=1)
+        velocidades_prueba = np.stack([-v * np.sin(angulo), v * np.cos(angulo)], axis=1)
+
+        return cls(
+            masas,
+            posiciones,
+            velocidades,
+            dt=dt,
+            t_total=t_total,
+            nombres=nombres,
+            posiciones_prueba=posiciones_prueba,
+            velocidades_prueba=velocidades_prueba,
+            cuerpo_seguido=tierra,
+            **opciones,
+        )
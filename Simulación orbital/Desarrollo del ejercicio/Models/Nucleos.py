@@ -0,0 +1,96 @@
+import math
+
+# Bucles de integración de EulerSimulador y VerletSimulador compilados con Numba, si
+# está instalado (es opcional: sin él los simuladores usan su bucle de Python). Cada
+# núcleo repite las operaciones de `paso` y `calcular_aceleracion` en el mismo orden,
+# con las mismas potencias en coma flotante (x**2.0, r**3.0, dt**2.0 llaman a pow
+# igual que en Python), para que la trayectoria coincida bit a bit con la del bucle
+# de Python. Los núcleos escriben directamente en los datos de AlmacenTrayectoria con
+# la misma lógica que `registrar` y paran si el búfer (no circular) se llena, para que
+# el llamador lo amplíe y continúe
+try:
+    from numba import njit
+
+    DISPONIBLE = True
+except ImportError:
+    DISPONIBLE = False
+
+    def njit(*args, **kwargs):
+        return lambda funcion: funcion
+
+
+@njit(cache=True)
+def _aceleracion(x, y, G, M_SOL):
+    r = math.sqrt(x**2.0 + y**2.0)
+    a_mag = -G * M_SOL / r**3.0
+    return a_mag * x, a_mag * y
+
+
+# Guarda una muestra como AlmacenTrayectoria.registrar; devuelve (pasos, total,
+# lleno), con lleno = True si el búfer no circular no tiene sitio (no se guarda)
+@njit(cache=True)
+def _registrar(datos, cada, circular, pasos, total, t, x, y, vx, vy):
+    if (pasos + 1) % cada:
+        return pasos + 1, total, False
+    k = total
+    capacidad = datos.shape[1]
+    if k >= capacidad:
+        if not circular:
+            return pasos, total, True
+        k %= capacidad
+    datos[0, k] = t
+    datos[1, k] = x
+    datos[2, k] = y
+    datos[3, k] = vx
+    datos[4, k] = vy
+    return pasos + 1, total + 1, False
+
+
+# Cada núcleo avanza desde el estado dado hasta t_total o hasta llenar el búfer, y
+# devuelve (x, y, vx, vy, t, pasos, total, evaluaciones, lleno). Con lleno = True el
+# último paso ya está calculado pero falta guardarlo: el llamador debe ampliar el
+# búfer y registrar el estado devuelto
+@njit(cache=True)
+def euler(x, y, vx, vy, t, t_total, dt, G, M_SOL, datos, cada, circular, pasos, total):
+    evaluaciones = 0
+    while t < t_total:
+        ax, ay = _aceleracion(x, y, G, M_SOL)
+        evaluaciones += 1
+        vx += ax * dt
+        vy += ay * dt
+        x += vx * dt
+        y += vy * dt
+        t += dt
+        pasos, total, lleno = _registrar(
+            datos, cada, circular, pasos, total, t, x, y, vx, vy
+        )
+        if lleno:
+            return x, y, vx, vy, t, pasos, total, evaluaciones, True
+    return x, y, vx, vy, t, pasos, total, evaluaciones, False
+
+
+@njit(cache=True)
+def verlet(x, y, vx, vy, t, t_total, dt, G, M_SOL, datos, cada, circular, pasos, total):
+    evaluaciones = 0
+    # La aceleración al inicio de un paso es la del final del anterior (mismas
+    # entradas, mismo resultado): se calcula una vez por paso, aunque se cuentan las
+    # dos evaluaciones de VerletSimulador.paso
+    ax, ay = _aceleracion(x, y, G, M_SOL)
+    while t < t_total:
+        x_nuevo = x + vx * dt + 0.5 * ax * dt**2.0
+        y_nuevo = y + vy * dt + 0.5 * ay * dt**2.0
+        ax_nuevo, ay_nuevo = _aceleracion(x_nuevo, y_nuevo, G, M_SOL)
+        evaluaciones += 2
+        vx += 0.5 * (ax + ax_nuevo) * dt
+        vy += 0.5 * (ay + ay_nuevo) * dt
+        x = x_nuevo
+        y = y_nuevo
+        ax = ax_nuevo
+        ay = ay_nuevo
+        t += dt
+        pasos, total, lleno = _registrar(
+            datos, cada, circular, pasos, total, t, x, y, vx, vy
+        )
+        if lleno:
+            return x, y, vx, vy, t, pasos, total, evaluaciones, True
+    return x, y, vx, vy, t, pasos, total, evaluaciones, False
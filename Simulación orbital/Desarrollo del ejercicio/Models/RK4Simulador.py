@@ -0,0 +1,26 @@
+from .SimuladorBase import SimuladorBase
+
+
+# Runge–Kutta clásico de orden 4 (cuatro evaluaciones de la aceleración por paso)
+class RK4Simulador(SimuladorBase):
+    def paso(self, restante):
+        dt = self.dt
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+
+        # Cada etapa k = (derivada de la posición, derivada de la velocidad)
+        ax1, ay1 = self.calcular_aceleracion(x, y)
+        x2, y2 = x + 0.5 * dt * vx, y + 0.5 * dt * vy
+        vx2, vy2 = vx + 0.5 * dt * ax1, vy + 0.5 * dt * ay1
+        ax2, ay2 = self.calcular_aceleracion(x2, y2)
+        x3, y3 = x + 0.5 * dt * vx2, y + 0.5 * dt * vy2
+        vx3, vy3 = vx + 0.5 * dt * ax2, vy + 0.5 * dt * ay2
+        ax3, ay3 = self.calcular_aceleracion(x3, y3)
+        x4, y4 = x + dt * vx3, y + dt * vy3
+        vx4, vy4 = vx + dt * ax3, vy + dt * ay3
+        ax4, ay4 = self.calcular_aceleracion(x4, y4)
+
+        self.x = x + dt / 6 * (vx + 2 * vx2 + 2 * vx3 + vx4)
+        self.y = y + dt / 6 * (vy + 2 * vy2 + 2 * vy3 + vy4)
+        self.vx = vx + dt / 6 * (ax1 + 2 * ax2 + 2 * ax3 + ax4)
+        self.vy = vy + dt / 6 * (ay1 + 2 * ay2 + 2 * ay3 + ay4)
+        return dt
@@ -1,27 +1,136 @@
 import math
+from .AlmacenTrayectoria import AlmacenTrayectoria
+from . import Nucleos
 
 
 class SimuladorBase:
     G = 6.6748e-11  # Constante gravitacional
     M_SOL = 1.989e30  # Masa del Sol (kg)
     UA = 1.496e11  # 1 UA en metros
+    # Bucle compilado equivalente a simular con este `paso` (ver Nucleos); se usa si
+    # Numba está instalado. Poner a None en la instancia fuerza el bucle de Python
+    nucleo = None
 
-    def __init__(self, dt=86400, velocidad_inicial=29783):
+    def __init__(
+        self,
+        dt=86400,
+        velocidad_inicial=29783,
+        t_total=None,
+        cada=1,
+        circular=False,
+        capacidad=None,
+        tolerancia=None,
+    ):
         self.dt = dt  # Paso de tiempo (1 día)
         self.x = self.UA  # Posición inicial en X
         self.y = 0.0  # Posición inicial en Y
         self.vx = 0.0  # Velocidad inicial en X
         self.vy = velocidad_inicial  # Velocidad inicial en Y
-        self.t_total = dt * 365  # 1 año en segundos
-        self.x_vals = []
-        self.y_vals = []
+        self.t_total = dt * 365 if t_total is None else t_total  # 1 año por defecto
+        # Trayectoria preasignada: una muestra cada `cada` pasos; con circular=True
+        # solo se conservan las últimas `capacidad` muestras
+        self.trayectoria = AlmacenTrayectoria.para_simulacion(
+            self.t_total, dt, cada, circular, capacidad
+        )
+        # Error local relativo admitido por los integradores adaptativos; en los de
+        # paso fijo no se usa (su precisión la fija dt)
+        self.tolerancia = tolerancia
+        self.evaluaciones = 0  # Llamadas a calcular_aceleracion
+        # Estado (x, y, vx, vy) al empezar a simular: referencia de los diagnósticos
+        self.estado_inicial = None
+
+    # Posiciones guardadas (arrays de NumPy, en el mismo orden que antes las listas)
+    @property
+    def x_vals(self):
+        return self.trayectoria.x
+
+    @property
+    def y_vals(self):
+        return self.trayectoria.y
+
+    def registrar_estado(self, t):
+        return self.trayectoria.registrar(t, self.x, self.y, self.vx, self.vy)
 
     def calcular_aceleracion(self, x, y):
+        self.evaluaciones += 1
         r = math.sqrt(x**2 + y**2)
         a_mag = -self.G * self.M_SOL / r**3
         ax = a_mag * x
         ay = a_mag * y
         return ax, ay
 
+    # Energía mecánica por unidad de masa del cuerpo (constante en la órbita exacta)
+    def energia_especifica(self):
+        r = math.sqrt(self.x**2 + self.y**2)
+        return 0.5 * (self.vx**2 + self.vy**2) - self.G * self.M_SOL / r
+
+    # Avanza el estado un paso y devuelve el tiempo avanzado. `restante` es el tiempo
+    # que falta hasta t_total (los métodos adaptativos no lo sobrepasan)
+    def paso(self, restante):
+        raise NotImplementedError("Método paso debe ser implementado en subclases")
+
     def simular(self):
-        raise NotImplementedError("Método simular debe ser implementado en subclases")
+        self.estado_inicial = (self.x, self.y, self.vx, self.vy)
+        if self.nucleo is not None and Nucleos.DISPONIBLE:
+            self._simular_con_nucleo()
+            return
+        t = 0
+        while t < self.t_total:
+            t += self.paso(self.t_total - t)
+            self.registrar_estado(t)
+
+    # Mismo bucle que simular, ejecutado por el núcleo compilado
+    def _simular_con_nucleo(self):
+        tray = self.trayectoria
+        t = 0.0
+        lleno = True
+        while lleno:
+            (
+                self.x,
+                self.y,
+                self.vx,
+                self.vy,
+                t,
+                tray.pasos,
+                tray.total,
+                evaluaciones,
+                lleno,
+            ) = self.nucleo(
+                self.x,
+                self.y,
+                self.vx,
+                self.vy,
+                t,
+                float(self.t_total),
+                float(self.dt),
+                self.G,
+                self.M_SOL,
+                tray.datos,
+                tray.cada,
+                tray.circular,
+                tray.pasos,
+                tray.total,
+            )
+            self.evaluaciones += evaluaciones
+            if lleno:
+                # Búfer lleno: registrar el paso pendiente lo amplía
+                self.registrar_estado(t)
+
+    # Versión en flujo de simular: avanza hasta t_final (por defecto t_total; puede ser
+    # math.inf) y entrega bloques de hasta `tamano` muestras según se calculan, sin
+    # guardarlas en la trayectoria. Cada bloque es un array (5, n) con las filas de
+    # AlmacenTrayectoria.CAMPOS (t, x, y, vx, vy) y es una vista de un búfer que se
+    # reutiliza en el bloque siguiente: hay que copiarlo para conservarlo. Así la
+    # memoria no depende de la duración de la simulación
+    def simular_por_bloques(self, tamano=1024, t_final=None, cada=1):
+        t_final = self.t_total if t_final is None else t_final
+        bloque = AlmacenTrayectoria(tamano, cada)
+        self.estado_inicial = (self.x, self.y, self.vx, self.vy)
+        t = 0
+        while t < t_final:
+            t += self.paso(t_final - t)
+            if bloque.registrar(t, self.x, self.y, self.vx, self.vy) == tamano - 1:
+                yield bloque.datos
+                bloque.reiniciar()
+        if len(bloque):
+            yield bloque.datos[:, : len(bloque)]
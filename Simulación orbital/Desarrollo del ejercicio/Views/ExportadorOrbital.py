@@ -0,0 +1,194 @@
+import math
+import os
+import queue
+import shutil
+import subprocess
+import threading
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image
+from Models.AlmacenTrayectoria import AlmacenTrayectoria
+
+# Extensiones que se codifican con ffmpeg; cualquier otra ruta es una carpeta de PNG
+FORMATOS_VIDEO = (".mp4", ".gif")
+# Fotogramas que pueden esperar a ser codificados antes de frenar la simulación
+MAX_FOTOGRAMAS_PENDIENTES = 8
+
+
+# Argumentos de ffmpeg para codificar fotogramas RGB crudos recibidos por stdin
+def _comando_ffmpeg(ruta, ancho, alto, fps):
+    comando = [
+        "ffmpeg",
+        "-y",
+        "-loglevel",
+        "error",
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "rgb24",
+        "-s",
+        f"{ancho}x{alto}",
+        "-r",
+        str(fps),
+        "-i",
+        "-",
+    ]
+    if ruta.lower().endswith(".gif"):
+        # Paleta calculada sobre el propio vídeo: colores fieles en el GIF
+        comando += ["-vf", "split[a][b];[a]palettegen[p];[b][p]paletteuse"]
+    else:
+        comando += ["-c:v", "libx264", "-pix_fmt", "yuv420p"]
+    return comando + [ruta]
+
+
+# Guarda un fotograma RGB de ancho × alto como PNG con PIL
+def guardar_png_pil(datos, ancho, alto, ruta):
+    Image.frombuffer("RGB", (ancho, alto), datos, "raw", "RGB", 0, 1).save(ruta)
+
+
+# Escribe fotogramas RGB en un hilo aparte, para que la codificación se solape con la
+# simulación. Según la ruta, los envía a ffmpeg (.mp4, .gif) o los guarda como
+# secuencia de PNG en una carpeta con `guardar_png(datos, ancho, alto, ruta)`, la
+# única parte que depende de la biblioteca gráfica. La cola es acotada: si el
+# codificador no da abasto, `escribir` espera en lugar de acumular fotogramas en
+# memoria. Un error del hilo escritor se relanza en la siguiente llamada a escribir o
+# en cerrar.
+# Copia de src/models/exportador.py del ejercicio de las N partículas
+class EscritorFotogramas:
+    def __init__(self, ruta, ancho, alto, fps=30, guardar_png=guardar_png_pil):
+        self.ruta = ruta
+        self.ancho = ancho
+        self.alto = alto
+        self.fps = fps
+        self.guardar_png = guardar_png
+        self.es_video = ruta.lower().endswith(FORMATOS_VIDEO)
+        self.fotogramas = 0
+        self._cola = queue.Queue(maxsize=MAX_FOTOGRAMAS_PENDIENTES)
+        self._error = None
+        self._proceso = None
+        if self.es_video:
+            if shutil.which("ffmpeg") is None:
+                raise RuntimeError(
+                    "Exportar a MP4 o GIF necesita ffmpeg en el PATH; "
+                    "indique una carpeta para guardar PNG"
+                )
+            self._proceso = subprocess.Popen(
+                _comando_ffmpeg(ruta, ancho, alto, fps), stdin=subprocess.PIPE
+            )
+        else:
+            os.makedirs(ruta, exist_ok=True)
+        self._hilo = threading.Thread(target=self._bucle, daemon=True)
+        self._hilo.start()
+
+    def _bucle(self):
+        numero = 0
+        while True:
+            datos = self._cola.get()
+            if datos is None:
+                break
+            if self._error is not None:
+                continue  # Se vacía la cola sin escribir
+            try:
+                if self.es_video:
+                    self._proceso.stdin.write(datos)
+                else:
+                    self.guardar_png(
+                        datos,
+                        self.ancho,
+                        self.alto,
+                        os.path.join(self.ruta, f"fotograma_{numero:06d}.png"),
+                    )
+                numero += 1
+            except Exception as error:
+                self._error = error
+
+    # Encola un fotograma (bytes RGB de ancho × alto píxeles)
+    def escribir(self, datos):
+        if self._error is not None:
+            raise self._error
+        self._cola.put(datos)
+        self.fotogramas += 1
+
+    # Espera a que se escriban los fotogramas pendientes y cierra el archivo
+    def cerrar(self):
+        if self._hilo is None:
+            return
+        self._cola.put(None)
+        self._hilo.join()
+        self._hilo = None
+        if self._proceso is not None:
+            self._proceso.stdin.close()
+            if self._proceso.wait() != 0 and self._error is None:
+                self._error = RuntimeError(
+                    f"ffmpeg terminó con código {self._proceso.returncode}"
+                )
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+# Graba la simulación sin pantalla: dibuja con el backend Agg de matplotlib (sin
+# pyplot) y consume el simulador en bloques (simular_por_bloques), de modo que la
+# simulación, el dibujo y la codificación avanzan a la vez y la memoria no depende de
+# la duración. La estela se guarda diezmada en un búfer circular de `max_puntos`
+class ExportadorOrbital:
+    def __init__(self, simulador, ruta, fps=30, ancho=800, alto=800, max_puntos=20000):
+        self.simulador = simulador
+        self.fps = fps
+        self.max_puntos = max_puntos
+        # Figura de tamaño exacto en píxeles (pares, como pide el H.264 en yuv420p)
+        self.ancho, self.alto = ancho - ancho % 2, alto - alto % 2
+        self.fig = Figure(figsize=(self.ancho / 100, self.alto / 100), dpi=100)
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot()
+        self.ruta = ruta
+
+    def configurar_grafico(self):
+        limite = 1.6 * self.simulador.UA
+        self.ax.set_xlim(-limite, limite)
+        self.ax.set_ylim(-limite, limite)
+        self.ax.scatter(0, 0, color="yellow", s=100, label="Sol")
+        self.ax.set_title("Simulación Orbital")
+        (self.linea,) = self.ax.plot([], [], color="blue", label="Órbita")
+        (self.cuerpo,) = self.ax.plot([], [], "o", color="blue", markersize=4)
+        self.texto = self.ax.text(0.02, 0.97, "", transform=self.ax.transAxes)
+        self.ax.legend(loc="upper right")
+
+    # Bytes RGB del fotograma actual
+    def _capturar(self):
+        self.canvas.draw()
+        return np.asarray(self.canvas.buffer_rgba())[..., :3].tobytes()
+
+    # Simula y graba unos `fotogramas` fotogramas repartidos a lo largo de la
+    # simulación (se estima su número de pasos con dt; en los adaptativos es
+    # aproximado). Devuelve el número de fotogramas escritos
+    def exportar(self, fotogramas=300, tamano_bloque=1024):
+        pasos_estimados = math.ceil(self.simulador.t_total / self.simulador.dt)
+        muestras_por_fotograma = max(1, pasos_estimados // fotogramas)
+        estela = AlmacenTrayectoria(
+            self.max_puntos,
+            cada=max(1, math.ceil(pasos_estimados / self.max_puntos)),
+            circular=True,
+        )
+        self.configurar_grafico()
+        escritor = EscritorFotogramas(self.ruta, self.ancho, self.alto, self.fps)
+        try:
+            muestras = 0
+            for bloque in self.simulador.simular_por_bloques(tamano_bloque):
+                for t, x, y, vx, vy in bloque.T.tolist():
+                    estela.registrar(t, x, y, vx, vy)
+                    muestras += 1
+                    if muestras % muestras_por_fotograma == 0:
+                        self.linea.set_data(estela.x, estela.y)
+                        self.cuerpo.set_data([x], [y])
+                        self.texto.set_text(f"t = {t / 86400:.1f} días")
+                        escritor.escribir(self._capturar())
+        finally:
+            escritor.cerrar()
+        return escritor.fotogramas
@@ -1,8 +1,15 @@
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from Models.AlmacenTrayectoria import AlmacenTrayectoria
 
 
 class VistaOrbital:
+    # Modo rápido: fotogramas como máximo y puntos dibujados como máximo en la línea
+    # (una pantalla no distingue más; una trayectoria larga se diezma)
+    MAX_FOTOGRAMAS = 1000
+    MAX_PUNTOS_LINEA = 20000
+
     def __init__(self, simulador):
         self.simulador = simulador
         self.fig, self.ax = plt.subplots(figsize=(8, 8))
@@ -29,3 +36,59 @@ class VistaOrbital:
             self.fig, update, frames=len(self.simulador.x_vals), interval=20
         )
         plt.show()
+
+    # Modo rápido de animar: el fondo (Sol, título, leyenda) se dibuja una sola vez y
+    # cada fotograma solo actualiza con set_data una línea persistente sobre vistas de
+    # la trayectoria, con blitting. Con más muestras que fotogramas o puntos visibles,
+    # se diezman ambos; el marcador muestra siempre la posición exacta
+    def animar_rapido(self, max_fotogramas=None, max_puntos=None):
+        x, y = self.simulador.x_vals, self.simulador.y_vals
+        n = len(x)
+        max_fotogramas = max_fotogramas or self.MAX_FOTOGRAMAS
+        max_puntos = max_puntos or self.MAX_PUNTOS_LINEA
+        # Índice final de la órbita visible en cada fotograma
+        finales = np.unique(np.linspace(1, n, min(n, max_fotogramas)).astype(int))
+        salto = max(1, n // max_puntos)
+        (linea,) = self.ax.plot([], [], color="blue", label="Órbita")
+        (cuerpo,) = self.ax.plot([], [], "o", color="blue", markersize=4)
+        self.ax.legend()
+
+        def inicio():
+            linea.set_data([], [])
+            cuerpo.set_data([], [])
+            return linea, cuerpo
+
+        def update(final):
+            # Rebanadas simples: vistas sin copia de la trayectoria
+            linea.set_data(x[:final:salto], y[:final:salto])
+            cuerpo.set_data(x[final - 1 : final], y[final - 1 : final])
+            return linea, cuerpo
+
+        ani = animation.FuncAnimation(
+            self.fig,
+            update,
+            frames=finales,
+            init_func=inicio,
+            interval=20,
+            blit=True,
+        )
+        plt.show()
+
+    # Anima un flujo de bloques (ver SimuladorBase.simular_por_bloques): cada fotograma
+    # añade un bloque a la línea de la órbita. Solo se dibujan los últimos
+    # `max_puntos` puntos, así que la memoria no crece con la duración
+    def animar_en_vivo(self, bloques, max_puntos=100_000):
+        estela = AlmacenTrayectoria(max_puntos, circular=True)
+        (linea,) = self.ax.plot([], [], color="blue", label="Órbita")
+        self.ax.legend()
+
+        def update(bloque):
+            for muestra in bloque.T:
+                estela.registrar(*muestra)
+            linea.set_data(estela.x, estela.y)
+            return (linea,)
+
+        ani = animation.FuncAnimation(
+            self.fig, update, frames=bloques, interval=20, cache_frame_data=False
+        )
+        plt.show()
@@ -0,0 +1,341 @@
+"""
+Benchmark de los algoritmos de emparejamiento
+Compara la búsqueda DFS recursiva original con Hopcroft-Karp sobre
+instancias aleatorias de 10k, 100k y 1M clientes/empleados y sobre una
+instancia de peor caso para el DFS, la construcción del grafo de
+compatibilidad comparando todos los pares frente a GrafoCompatibilidad,
+el voraz por umbral (sin grafo) frente a Hopcroft-Karp con su grafo, el
+modo de coste mínimo en instancias de 50k clientes y 50k empleados, y la
+latencia de las altas y bajas del emparejamiento incremental frente a
+recalcularlo entero
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import time
+from typing import List, Tuple
+
+# El módulo principal tiene espacios en el nombre: se carga por su ruta
+_RUTA_MODULO = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "Sistema de Emparejamiento.py"
+)
+_especificacion = importlib.util.spec_from_file_location(
+    "sistema_emparejamiento", _RUTA_MODULO
+)
+se = importlib.util.module_from_spec(_especificacion)
+_especificacion.loader.exec_module(se)
+
+TAMANOS = (10_000, 100_000, 1_000_000)
+# Empleados por ocupación: fija el grado medio del grafo de compatibilidad
+TAMANO_GRUPO = 20
+# Por encima de este tamaño no se ejecuta la construcción O(C·E) original
+MAX_CONSTRUCCION_ORIGINAL = 5_000
+# La escalera tiene n²/2 aristas: tamaños menores
+TAMANOS_ESCALERA = (500, 900, 3_000)
+# Instancias densas (pocas ocupaciones, unas n·TAMANO_GRUPO_DENSO/2 aristas)
+TAMANO_GRUPO_DENSO = 1_000
+TAMANOS_DENSOS = (10_000, 50_000)
+# Coste mínimo: objetivo < 10 s por criterio con 50k × 50k (unas 500k aristas)
+TAMANOS_COSTE = (10_000, 50_000)
+# Incremental: estado inicial y número de altas/bajas medidas
+TAMANO_INCREMENTAL = 100_000
+ACTUALIZACIONES = 5_000
+
+
+def generar_instancia(
+    n: int, semilla: int = 0, tamano_grupo: int = TAMANO_GRUPO
+) -> Tuple[List["se.Cliente"], List["se.Empleado"]]:
+    """Genera n clientes y n empleados con ocupaciones, precios y presupuestos aleatorios"""
+    generador = random.Random(semilla)
+    ocupaciones = [f"Ocupacion{i}" for i in range(max(1, n // tamano_grupo))]
+    empleados = [
+        se.Empleado(
+            f"Empleado{i}", generador.choice(ocupaciones), generador.randint(10, 100)
+        )
+        for i in range(n)
+    ]
+    clientes = [
+        se.Cliente(
+            f"Cliente{i}", generador.choice(ocupaciones), generador.randint(10, 100)
+        )
+        for i in range(n)
+    ]
+    return clientes, empleados
+
+
+def generar_escalera(n: int) -> Tuple[List["se.Cliente"], List["se.Empleado"]]:
+    """
+    Peor caso para el DFS original: una sola ocupación, empleados en orden de
+    precio creciente y clientes en orden de presupuesto decreciente. Cada
+    cliente nuevo desplaza a todos los anteriores: caminos aumentantes de
+    longitud creciente (O(V·E) y recursión de profundidad n)
+    """
+    empleados = [se.Empleado(f"Empleado{i}", "Ocupacion", i + 1) for i in range(n)]
+    clientes = [se.Cliente(f"Cliente{i}", "Ocupacion", n - i) for i in range(n)]
+    return clientes, empleados
+
+
+def emparejar_dfs_original(grafo: "se.GrafoCompatibilidad") -> int:
+    """
+    Ejecuta la búsqueda DFS recursiva de AlgoritmoEmparejamientoBipartito,
+    con los vecinos en el orden de su grafo original (índice de empleado)
+    """
+    algoritmo = se.AlgoritmoEmparejamientoBipartito()
+    algoritmo._grafo_compatibilidad = {
+        i: sorted(grafo.vecinos(i)) for i in range(grafo.num_clientes)
+    }
+    for i in range(grafo.num_clientes):
+        algoritmo._buscar_camino_aumentante(i, set())
+    return len(algoritmo._emparejamiento_clientes)
+
+
+def emparejar_hopcroft_karp(grafo: "se.GrafoCompatibilidad") -> int:
+    pareja_cliente, _ = se.AlgoritmoEmparejamientoHopcroftKarp.emparejar(grafo)
+    return sum(1 for empleado_idx in pareja_cliente if empleado_idx != -1)
+
+
+def hopcroft_karp_completo(
+    clientes: List["se.Cliente"], empleados: List["se.Empleado"]
+) -> int:
+    """Grafo indexado + Hopcroft-Karp"""
+    grafo = se.GrafoCompatibilidad.construir(clientes, empleados)
+    return emparejar_hopcroft_karp(grafo)
+
+
+def emparejar_umbral(
+    clientes: List["se.Cliente"], empleados: List["se.Empleado"]
+) -> int:
+    pareja_cliente = se.AlgoritmoEmparejamientoUmbral.emparejar(clientes, empleados)
+    return sum(1 for empleado_idx in pareja_cliente if empleado_idx != -1)
+
+
+def construir_original(
+    clientes: List["se.Cliente"], empleados: List["se.Empleado"]
+) -> int:
+    """Comparación de todos los pares con Cliente.puede_contratar, O(C·E)"""
+    return sum(
+        1
+        for cliente in clientes
+        for empleado in empleados
+        if cliente.puede_contratar(empleado)
+    )
+
+
+def construir_indexado(
+    clientes: List["se.Cliente"], empleados: List["se.Empleado"]
+) -> int:
+    return se.GrafoCompatibilidad.construir(clientes, empleados).num_aristas
+
+
+def medir(funcion, *argumentos):
+    """Retorna (resultado, segundos) o (mensaje de error, segundos)"""
+    inicio = time.perf_counter()
+    try:
+        resultado = funcion(*argumentos)
+    except RecursionError:
+        resultado = "RecursionError"
+    return resultado, time.perf_counter() - inicio
+
+
+def comparar_algoritmos(tamanos=TAMANOS):
+    """Tabla de tiempos de la fase de emparejamiento sobre el mismo grafo"""
+    print(f"{'n':>10} {'aristas':>11} {'DFS original':>22} {'Hopcroft-Karp':>22}")
+    for n in tamanos:
+        clientes, empleados = generar_instancia(n)
+        grafo = se.GrafoCompatibilidad.construir(clientes, empleados)
+        aristas = grafo.num_aristas
+        original, t_original = medir(emparejar_dfs_original, grafo)
+        nuevo, t_nuevo = medir(emparejar_hopcroft_karp, grafo)
+        print(
+            f"{n:>10} {aristas:>11} {str(original):>14} {t_original:>6.2f} s "
+            f"{str(nuevo):>14} {t_nuevo:>6.2f} s"
+        )
+
+
+def comparar_escalera(tamanos=TAMANOS_ESCALERA):
+    """Misma tabla sobre la instancia de peor caso (grafo denso, n²/2 aristas)"""
+    print("\nPeor caso (escalera de presupuestos):")
+    for n in tamanos:
+        clientes, empleados = generar_escalera(n)
+        grafo = se.GrafoCompatibilidad.construir(clientes, empleados)
+        aristas = grafo.num_aristas
+        original, t_original = medir(emparejar_dfs_original, grafo)
+        nuevo, t_nuevo = medir(emparejar_hopcroft_karp, grafo)
+        print(
+            f"{n:>10} {aristas:>11} {str(original):>14} {t_original:>6.2f} s "
+            f"{str(nuevo):>14} {t_nuevo:>6.2f} s"
+        )
+
+
+def comparar_construccion(tamanos=TAMANOS):
+    """
+    Construcción del grafo: comparación de todos los pares (solo hasta
+    MAX_CONSTRUCCION_ORIGINAL) frente al índice por ocupación y precio
+    """
+    print("\nConstrucción del grafo de compatibilidad:")
+    print(f"{'n':>10} {'aristas':>11} {'todos los pares':>16} {'indexado':>10}")
+    for n in (MAX_CONSTRUCCION_ORIGINAL,) + tuple(tamanos):
+        clientes, empleados = generar_instancia(n)
+        aristas, t_indexado = medir(construir_indexado, clientes, empleados)
+        if n <= MAX_CONSTRUCCION_ORIGINAL:
+            original, t_original = medir(construir_original, clientes, empleados)
+            assert original == aristas
+            texto_original = f"{t_original:.2f} s"
+        else:
+            texto_original = "omitido"
+        print(f"{n:>10} {aristas:>11} {texto_original:>16} {t_indexado:>8.2f} s")
+
+
+def comparar_umbral(tamanos=TAMANOS, tamanos_densos=TAMANOS_DENSOS):
+    """
+    Voraz por umbral frente a grafo indexado + Hopcroft-Karp, en las
+    instancias aleatorias y en instancias densas
+    """
+    print("\nVoraz por umbral (sin grafo) frente a grafo + Hopcroft-Karp:")
+    print(f"{'n':>10} {'aristas':>11} {'grafo + HK':>22} {'umbral':>22}")
+    casos = [(n, TAMANO_GRUPO) for n in tamanos]
+    casos += [(n, TAMANO_GRUPO_DENSO) for n in tamanos_densos]
+    for n, tamano_grupo in casos:
+        clientes, empleados = generar_instancia(n, tamano_grupo=tamano_grupo)
+        aristas = se.GrafoCompatibilidad.construir(clientes, empleados).num_aristas
+        completo, t_completo = medir(hopcroft_karp_completo, clientes, empleados)
+        umbral, t_umbral = medir(emparejar_umbral, clientes, empleados)
+        assert completo == umbral
+        print(
+            f"{n:>10} {aristas:>11} {completo:>14} {t_completo:>6.2f} s "
+            f"{umbral:>14} {t_umbral:>6.2f} s"
+        )
+
+
+def comparar_coste_minimo(tamanos=TAMANOS_COSTE):
+    """
+    Coste del emparejamiento arbitrario de Hopcroft-Karp frente al de coste
+    mínimo, con sus tiempos (sin contar la construcción del grafo)
+    """
+    print("\nCoste mínimo (suma de precios / suma de excedentes):")
+    clase = se.AlgoritmoEmparejamientoCosteMinimo
+    for n in tamanos:
+        clientes, empleados = generar_instancia(n)
+        grafo = se.GrafoCompatibilidad.construir(clientes, empleados)
+        pareja_cliente, _ = se.AlgoritmoEmparejamientoHopcroftKarp.emparejar(grafo)
+        parejas = [(c, e) for c, e in enumerate(pareja_cliente) if e != -1]
+        precio = sum(empleados[e].precio_por_hora for _, e in parejas)
+        excedente = sum(clientes[c].presupuesto for c, _ in parejas) - precio
+        print(f"  n={n}, {grafo.num_aristas} aristas, {len(parejas)} parejas")
+        print(
+            f"    {'Hopcroft-Karp':<22} precio {precio:>12.0f} "
+            f"excedente {excedente:>12.0f}"
+        )
+        for criterio in clase.CRITERIOS:
+            costes = clase.costes(grafo, clientes, empleados, criterio)
+            (pareja_cliente, _), segundos = medir(clase.emparejar, grafo, costes)
+            parejas_optimas = [(c, e) for c, e in enumerate(pareja_cliente) if e != -1]
+            assert len(parejas_optimas) == len(parejas)
+            precio = sum(empleados[e].precio_por_hora for _, e in parejas_optimas)
+            excedente = (
+                sum(clientes[c].presupuesto for c, _ in parejas_optimas) - precio
+            )
+            print(
+                f"    {criterio:<22} precio {precio:>12.0f} "
+                f"excedente {excedente:>12.0f} {segundos:>8.2f} s"
+            )
+
+
+def comparar_incremental(
+    n: int = TAMANO_INCREMENTAL, actualizaciones: int = ACTUALIZACIONES
+):
+    """
+    Latencia de cada alta o baja del emparejamiento incremental frente al
+    tiempo de recalcular el emparejamiento completo tras ella
+    """
+    clientes, empleados = generar_instancia(n)
+    ocupaciones = sorted({empleado.ocupacion for empleado in empleados})
+    generador = random.Random(1)
+    incremental = se.AlgoritmoEmparejamientoIncremental()
+    _, t_inicial = medir(
+        incremental.encontrar_emparejamientos_maximos, clientes, empleados
+    )
+    vivos_clientes = list(range(n))
+    vivos_empleados = list(range(n))
+
+    latencias = []
+    for _ in range(actualizaciones):
+        operacion = generador.randrange(4)
+        ocupacion = generador.choice(ocupaciones)
+        valor = generador.randint(10, 100)
+        inicio = time.perf_counter()
+        if operacion == 0:
+            nuevo = se.Cliente("Cliente", ocupacion, valor)
+            vivos_clientes.append(incremental.agregar_cliente(nuevo))
+        elif operacion == 1:
+            nuevo = se.Empleado("Empleado", ocupacion, valor)
+            vivos_empleados.append(incremental.agregar_empleado(nuevo))
+        elif operacion == 2:
+            k = generador.randrange(len(vivos_clientes))
+            vivos_clientes[k], vivos_clientes[-1] = (
+                vivos_clientes[-1],
+                vivos_clientes[k],
+            )
+            incremental.eliminar_cliente(vivos_clientes.pop())
+        else:
+            k = generador.randrange(len(vivos_empleados))
+            vivos_empleados[k], vivos_empleados[-1] = (
+                vivos_empleados[-1],
+                vivos_empleados[k],
+            )
+            incremental.eliminar_empleado(vivos_empleados.pop())
+        latencias.append(time.perf_counter() - inicio)
+
+    # Recalcular desde cero sobre el estado final
+    clientes = [incremental._clientes[i] for i in vivos_clientes]
+    empleados = [incremental._empleados[j] for j in vivos_empleados]
+    umbral, t_umbral = medir(emparejar_umbral, clientes, empleados)
+    completo, t_completo = medir(hopcroft_karp_completo, clientes, empleados)
+    assert umbral == completo == len(incremental._emparejamiento_clientes)
+
+    latencias.sort()
+    print(f"\nIncremental: {n} clientes y {n} empleados, {actualizaciones} altas/bajas")
+    print(f"  emparejamiento inicial {t_inicial:>10.2f} s")
+    for nombre, segundos in (
+        ("media", sum(latencias) / len(latencias)),
+        ("mediana", latencias[len(latencias) // 2]),
+        ("p99", latencias[int(len(latencias) * 0.99)]),
+        ("máxima", latencias[-1]),
+    ):
+        print(f"  actualización {nombre:<8} {segundos * 1e6:>10.1f} µs")
+    print(f"  recalcular (umbral)    {t_umbral:>10.2f} s")
+    print(f"  recalcular (grafo+HK)  {t_completo:>10.2f} s")
+
+
+def comparar_clases(n: int = MAX_CONSTRUCCION_ORIGINAL):
+    """Tiempo completo (grafo + emparejamiento) de cada IAlgoritmoEmparejamiento"""
+    clientes, empleados = generar_instancia(n)
+    print(f"\nClases completas con {n} clientes y {n} empleados:")
+    for clase in (
+        se.AlgoritmoEmparejamientoBipartito,
+        se.AlgoritmoEmparejamientoHopcroftKarp,
+        se.AlgoritmoEmparejamientoUmbral,
+        se.AlgoritmoEmparejamientoCosteMinimo,
+        se.AlgoritmoEmparejamientoIncremental,
+    ):
+        emparejamientos, segundos = medir(
+            clase().encontrar_emparejamientos_maximos, clientes, empleados
+        )
+        print(f"  {clase.__name__:<40} {len(emparejamientos):>8} {segundos:>8.2f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de emparejamiento")
+    parser.add_argument(
+        "--tamanos", type=int, nargs="+", default=list(TAMANOS), help="Valores de n"
+    )
+    argumentos = parser.parse_args()
+    comparar_algoritmos(argumentos.tamanos)
+    comparar_escalera()
+    comparar_construccion(argumentos.tamanos)
+    comparar_umbral(argumentos.tamanos)
+    comparar_coste_minimo()
+    comparar_incremental()
+    comparar_clases()
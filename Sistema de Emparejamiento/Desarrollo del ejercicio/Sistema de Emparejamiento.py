@@ -5,7 +5,10 @@ Algoritmo de Maximum Bipartite Matching usando Ford-Fulkerson
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from heapq import heapify, heappop, heappush
+from typing import Dict, List, Optional, Tuple
 import os
 
 
@@ -83,6 +86,84 @@ class Emparejamiento:
         return f"{self._cliente.nombre} - {self._empleado.nombre}"
 
 
+class GrafoCompatibilidad:
+    """
+    Grafo de compatibilidad cliente-empleado en formato CSR: los empleados
+    compatibles con el cliente i son
+    indices[desplazamientos[i]:desplazamientos[i + 1]], del más caro al más
+    barato
+    """
+
+    def __init__(self, desplazamientos: array, indices: array, num_empleados: int):
+        self._desplazamientos = desplazamientos
+        self._indices = indices
+        self._num_empleados = num_empleados
+
+    @property
+    def desplazamientos(self) -> array:
+        return self._desplazamientos
+
+    @property
+    def indices(self) -> array:
+        return self._indices
+
+    @property
+    def num_clientes(self) -> int:
+        return len(self._desplazamientos) - 1
+
+    @property
+    def num_empleados(self) -> int:
+        return self._num_empleados
+
+    @property
+    def num_aristas(self) -> int:
+        return len(self._indices)
+
+    def vecinos(self, cliente_idx: int) -> array:
+        """Empleados compatibles con un cliente"""
+        return self._indices[
+            self._desplazamientos[cliente_idx] : self._desplazamientos[cliente_idx + 1]
+        ]
+
+    @classmethod
+    def construir(
+        cls, clientes: List[Cliente], empleados: List[Empleado]
+    ) -> "GrafoCompatibilidad":
+        """
+        Construye el grafo indexando a los empleados por ocupación y precio:
+        agrupa por ocupación, ordena cada grupo de mayor a menor
+        precio_por_hora y toma para cada cliente el tramo final con
+        precio <= presupuesto (búsqueda binaria). Coste
+        O((C + E)·log E + aristas), sin comparar todos los pares como
+        Cliente.puede_contratar. Probar primero el empleado más caro que
+        el cliente puede pagar deja los baratos a los presupuestos bajos:
+        el emparejamiento voraz inicial queda casi completo
+        """
+        grupos: Dict[str, List[int]] = {}
+        for j, empleado in enumerate(empleados):
+            grupos.setdefault(empleado.ocupacion, []).append(j)
+
+        # Por ocupación: empleados de mayor a menor precio y sus precios con el
+        # signo cambiado (orden creciente, el que necesita bisect)
+        indice: Dict[str, Tuple[List[float], array]] = {}
+        for ocupacion, miembros in grupos.items():
+            miembros.sort(key=lambda j: -empleados[j].precio_por_hora)
+            precios = [-empleados[j].precio_por_hora for j in miembros]
+            indice[ocupacion] = (precios, array("q", miembros))
+
+        desplazamientos = array("q", [0])
+        indices = array("q")
+        for cliente in clientes:
+            grupo = indice.get(cliente.ocupacion_requerida)
+            if grupo is not None:
+                precios, miembros = grupo
+                primero = bisect_left(precios, -cliente.presupuesto)
+                indices.extend(miembros[primero:])
+            desplazamientos.append(len(indices))
+
+        return cls(desplazamientos, indices, len(empleados))
+
+
 class ILectorArchivos(ABC):
     """Interfaz para lectura de archivos (Principio de Inversión de Dependencias)"""
 
@@ -238,12 +319,15 @@ class AlgoritmoEmparejamientoBipartito(IAlgoritmoEmparejamiento):
     def _construir_grafo_compatibilidad(
         self, clientes: List[Cliente], empleados: List[Empleado]
     ):
-        """Construye el grafo de compatibilidad entre clientes y empleados"""
-        for i, cliente in enumerate(clientes):
-            self._grafo_compatibilidad[i] = []
-            for j, empleado in enumerate(empleados):
-                if cliente.puede_contratar(empleado):
-                    self._grafo_compatibilidad[i].append(j)
+        """
+        Construye el grafo de compatibilidad entre clientes y empleados a
+        partir del grafo indexado (sin comparar todos los pares). Los vecinos
+        de cada cliente quedan en orden de índice de empleado, el orden en que
+        los prueba la búsqueda
+        """
+        grafo = GrafoCompatibilidad.construir(clientes, empleados)
+        for i in range(grafo.num_clientes):
+            self._grafo_compatibilidad[i] = sorted(grafo.vecinos(i))
 
     def _buscar_camino_aumentante(self, cliente_idx: int, visitados: set) -> bool:
         """
@@ -286,6 +370,641 @@ class AlgoritmoEmparejamientoBipartito(IAlgoritmoEmparejamiento):
         return emparejamientos
 
 
+class AlgoritmoEmparejamientoHopcroftKarp(AlgoritmoEmparejamientoBipartito):
+    """
+    Implementación de Maximum Bipartite Matching con Hopcroft-Karp.
+    Cada fase hace un BFS por capas desde los clientes libres y después
+    busca caminos aumentantes disjuntos y de longitud mínima con un DFS
+    iterativo (sin recursión), en O(E·√V). Obtiene la misma cardinalidad
+    máxima que AlgoritmoEmparejamientoBipartito. El grafo de compatibilidad
+    se construye indexado (GrafoCompatibilidad) y se guarda aparte en
+    _grafo_indexado: _grafo_compatibilidad sigue siendo el diccionario que
+    espera _buscar_camino_aumentante
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._grafo_indexado: Optional[GrafoCompatibilidad] = None
+
+    def encontrar_emparejamientos_maximos(
+        self, clientes: List[Cliente], empleados: List[Empleado]
+    ) -> List[Emparejamiento]:
+        """Encuentra el emparejamiento máximo usando Hopcroft-Karp"""
+
+        # Reiniciar estructuras
+        self._emparejamiento_clientes = {}
+        self._emparejamiento_empleados = {}
+
+        self._grafo_indexado = GrafoCompatibilidad.construir(clientes, empleados)
+        pareja_cliente, _ = self.emparejar(self._grafo_indexado)
+
+        for cliente_idx, empleado_idx in enumerate(pareja_cliente):
+            if empleado_idx != -1:
+                self._emparejamiento_clientes[cliente_idx] = empleado_idx
+                self._emparejamiento_empleados[empleado_idx] = cliente_idx
+
+        return self._construir_emparejamientos(clientes, empleados)
+
+    @staticmethod
+    def emparejar(grafo: GrafoCompatibilidad) -> Tuple[List[int], List[int]]:
+        """
+        Emparejamiento máximo sobre el grafo de compatibilidad. Retorna la
+        pareja de cada cliente y de cada empleado (-1 si no tiene)
+        """
+        num_clientes = grafo.num_clientes
+        # Copias en listas: indexar una lista es más rápido que un array("q"),
+        # que crea un int nuevo en cada acceso
+        inicio = grafo.desplazamientos.tolist()
+        indices = grafo.indices.tolist()
+        pareja_cliente = [-1] * num_clientes
+        pareja_empleado = [-1] * grafo.num_empleados
+
+        # Emparejamiento voraz inicial: deja pocas aumentaciones para las fases
+        for c in range(num_clientes):
+            for k in range(inicio[c], inicio[c + 1]):
+                empleado_idx = indices[k]
+                if pareja_empleado[empleado_idx] == -1:
+                    pareja_cliente[c] = empleado_idx
+                    pareja_empleado[empleado_idx] = c
+                    break
+
+        infinito = num_clientes + 1
+        distancia = [infinito] * num_clientes
+        while True:
+            # BFS por capas desde los clientes libres, hasta la primera capa en la
+            # que aparece un empleado libre (longitud de los caminos más cortos)
+            libres = [c for c in range(num_clientes) if pareja_cliente[c] == -1]
+            for c in range(num_clientes):
+                distancia[c] = infinito
+            for c in libres:
+                distancia[c] = 0
+            cola = list(libres)
+            longitud = infinito
+            for c in cola:
+                d = distancia[c] + 1
+                if d > longitud:
+                    break
+                for k in range(inicio[c], inicio[c + 1]):
+                    siguiente = pareja_empleado[indices[k]]
+                    if siguiente == -1:
+                        longitud = d
+                    elif distancia[siguiente] == infinito:
+                        distancia[siguiente] = d
+                        cola.append(siguiente)
+            if longitud == infinito:
+                break
+
+            # DFS iterativo desde cada cliente libre por las capas del BFS. Cada
+            # cliente guarda la posición (en indices) del vecino por el que va,
+            # así cada arista se recorre como mucho una vez por fase
+            posicion = list(inicio[:-1])
+            for raiz in libres:
+                pila = [raiz]
+                while pila:
+                    c = pila[-1]
+                    d = distancia[c] + 1
+                    # Avanza por los vecinos de c hasta el primer empleado útil
+                    k = posicion[c]
+                    fin = inicio[c + 1]
+                    siguiente = -2
+                    while k < fin:
+                        siguiente = pareja_empleado[indices[k]]
+                        k += 1
+                        if siguiente == -1:
+                            if d == longitud:
+                                break
+                        elif distancia[siguiente] == d:
+                            break
+                        siguiente = -2
+                    posicion[c] = k
+                    if siguiente == -2:
+                        # Sin salida: se descarta para el resto de la fase
+                        distancia[c] = infinito
+                        pila.pop()
+                    elif siguiente == -1:
+                        # Camino aumentante: cada cliente de la pila pasa al
+                        # empleado por el que avanzó, y sale de la fase
+                        for cliente_idx in pila:
+                            nuevo = indices[posicion[cliente_idx] - 1]
+                            pareja_cliente[cliente_idx] = nuevo
+                            pareja_empleado[nuevo] = cliente_idx
+                            distancia[cliente_idx] = infinito
+                        break
+                    else:
+                        pila.append(siguiente)
+
+        return pareja_cliente, pareja_empleado
+
+
+class AlgoritmoEmparejamientoUmbral(IAlgoritmoEmparejamiento):
+    """
+    Maximum Bipartite Matching aprovechando la forma de la compatibilidad
+    (misma ocupación y presupuesto >= precio), sin construir las aristas.
+    Dentro de una ocupación los vecinos de los clientes están anidados: un
+    cliente puede pagar a todos los empleados que puede pagar otro de menor
+    presupuesto. Por eso basta un voraz de dos punteros: se recorren los
+    clientes de menor a mayor presupuesto, se van añadiendo a la lista de
+    disponibles los empleados que pasan a ser asequibles (de menor a mayor
+    precio) y cada cliente toma uno si queda alguno. Tiempo
+    O((C + E)·log(C + E)) por las ordenaciones y memoria O(C + E)
+    """
+
+    def encontrar_emparejamientos_maximos(
+        self, clientes: List[Cliente], empleados: List[Empleado]
+    ) -> List[Emparejamiento]:
+        """Encuentra el emparejamiento máximo sin materializar el grafo"""
+        pareja_cliente = self.emparejar(clientes, empleados)
+        return [
+            Emparejamiento(clientes[cliente_idx], empleados[empleado_idx])
+            for cliente_idx, empleado_idx in enumerate(pareja_cliente)
+            if empleado_idx != -1
+        ]
+
+    @staticmethod
+    def emparejar(clientes: List[Cliente], empleados: List[Empleado]) -> List[int]:
+        """
+        Retorna la pareja de cada cliente (-1 si no tiene).
+
+        Es óptimo. Por inducción, hay un emparejamiento máximo M que coincide
+        con el voraz en los clientes ya recorridos. Sea c el siguiente y D
+        los empleados disponibles. Si D está vacío, todos los vecinos de c
+        están ocupados en M por esos clientes y c tampoco tiene pareja en M.
+        Si no, sea e el empleado que toma c. Si e está libre en M, se le da
+        a c (soltando su pareja anterior, si la tenía). Si e está con un
+        cliente c' posterior, c' tiene presupuesto >= que c y puede pagar a
+        todos los vecinos de c: c' se queda con la pareja de c en M (o sin
+        pareja si c no tenía) y c con e. M sigue siendo máximo y coincide
+        con el voraz también en c
+        """
+        # Atributos copiados a listas: se leen una vez, en orden
+        precios = [empleado.precio_por_hora for empleado in empleados]
+        presupuestos = [cliente.presupuesto for cliente in clientes]
+
+        grupos_empleados: Dict[str, List[int]] = {}
+        for j, empleado in enumerate(empleados):
+            grupos_empleados.setdefault(empleado.ocupacion, []).append(j)
+        grupos_clientes: Dict[str, List[int]] = {}
+        for i, cliente in enumerate(clientes):
+            grupos_clientes.setdefault(cliente.ocupacion_requerida, []).append(i)
+
+        pareja_cliente = [-1] * len(clientes)
+        for ocupacion, grupo_clientes in grupos_clientes.items():
+            grupo_empleados = grupos_empleados.get(ocupacion)
+            if not grupo_empleados:
+                continue
+            grupo_clientes.sort(key=presupuestos.__getitem__)
+            grupo_empleados.sort(key=precios.__getitem__)
+            precios_grupo = [precios[j] for j in grupo_empleados]
+            precios_grupo.append(float("inf"))  # Centinela: evita comprobar el final
+
+            disponibles = []
+            siguiente = 0
+            for cliente_idx in grupo_clientes:
+                presupuesto = presupuestos[cliente_idx]
+                while precios_grupo[siguiente] <= presupuesto:
+                    disponibles.append(grupo_empleados[siguiente])
+                    siguiente += 1
+                if disponibles:
+                    pareja_cliente[cliente_idx] = disponibles.pop()
+
+        return pareja_cliente
+
+
+class AlgoritmoEmparejamientoCosteMinimo(AlgoritmoEmparejamientoBipartito):
+    """
+    Emparejamiento de cardinalidad máxima y, entre los de cardinalidad
+    máxima, de coste mínimo. Con criterio "precio" minimiza la suma de
+    precio_por_hora de los empleados contratados; con "excedente" maximiza
+    la suma de presupuesto - precio_por_hora de las parejas.
+    Caminos aumentantes más cortos sucesivos con Dijkstra y potenciales
+    sobre el grafo indexado (GrafoCompatibilidad): cada fase calcula las
+    distancias reducidas desde los clientes libres, actualiza los
+    potenciales y aumenta por un conjunto maximal de caminos disjuntos de
+    coste reducido nulo (todos de coste mínimo), como una fase de
+    Hopcroft-Karp
+    """
+
+    CRITERIOS = ("precio", "excedente")
+
+    def __init__(self, criterio: str = "precio"):
+        super().__init__()
+        if criterio not in self.CRITERIOS:
+            raise ValueError(
+                f"Criterio desconocido: {criterio} (use {', '.join(self.CRITERIOS)})"
+            )
+        self._criterio = criterio
+        # Grafo indexado de la última llamada; _grafo_compatibilidad se deja como
+        # el diccionario de la clase base
+        self._grafo_indexado: Optional[GrafoCompatibilidad] = None
+
+    def encontrar_emparejamientos_maximos(
+        self, clientes: List[Cliente], empleados: List[Empleado]
+    ) -> List[Emparejamiento]:
+        """Encuentra el emparejamiento máximo de coste mínimo"""
+
+        # Reiniciar estructuras
+        self._emparejamiento_clientes = {}
+        self._emparejamiento_empleados = {}
+
+        self._grafo_indexado = GrafoCompatibilidad.construir(clientes, empleados)
+        costes = self.costes(self._grafo_indexado, clientes, empleados, self._criterio)
+        pareja_cliente, _ = self.emparejar(self._grafo_indexado, costes)
+
+        for cliente_idx, empleado_idx in enumerate(pareja_cliente):
+            if empleado_idx != -1:
+                self._emparejamiento_clientes[cliente_idx] = empleado_idx
+                self._emparejamiento_empleados[empleado_idx] = cliente_idx
+
+        return self._construir_emparejamientos(clientes, empleados)
+
+    @staticmethod
+    def costes(
+        grafo: GrafoCompatibilidad,
+        clientes: List[Cliente],
+        empleados: List[Empleado],
+        criterio: str = "precio",
+    ) -> array:
+        """
+        Coste de cada arista, en el orden de grafo.indices. Para el
+        excedente se minimiza precio - presupuesto más el presupuesto
+        máximo: así ningún coste es negativo, y como todos los
+        emparejamientos máximos tienen el mismo número de aristas el
+        desplazamiento no cambia cuál es el óptimo
+        """
+        precios = [empleado.precio_por_hora for empleado in empleados]
+        if criterio == "precio":
+            return array("d", [precios[j] for j in grafo.indices])
+
+        maximo = max((cliente.presupuesto for cliente in clientes), default=0)
+        costes = array("d")
+        for cliente_idx, cliente in enumerate(clientes):
+            desplazamiento = maximo - cliente.presupuesto
+            costes.extend(
+                precios[j] + desplazamiento for j in grafo.vecinos(cliente_idx)
+            )
+        return costes
+
+    @staticmethod
+    def componentes(grafo: GrafoCompatibilidad) -> List[Tuple[List[int], List[int]]]:
+        """
+        Componentes conexas del grafo (clientes, empleados) con al menos una
+        arista, por unión-búsqueda. Los empleados se numeran tras los clientes
+        """
+        num_clientes = grafo.num_clientes
+        inicio = grafo.desplazamientos
+        indices = grafo.indices
+        padre = list(range(num_clientes + grafo.num_empleados))
+        for c in range(num_clientes):
+            for k in range(inicio[c], inicio[c + 1]):
+                v = num_clientes + indices[k]
+                while padre[v] != v:
+                    padre[v] = padre[padre[v]]
+                    v = padre[v]
+                if v != c:
+                    padre[v] = c
+
+        grupos: Dict[int, Tuple[List[int], List[int]]] = {}
+        for c in range(num_clientes):
+            if inicio[c] == inicio[c + 1]:
+                continue
+            v = c
+            while padre[v] != v:
+                padre[v] = padre[padre[v]]
+                v = padre[v]
+            grupos.setdefault(v, ([], []))[0].append(c)
+        for e in range(grafo.num_empleados):
+            v = num_clientes + e
+            while padre[v] != v:
+                padre[v] = padre[padre[v]]
+                v = padre[v]
+            if v in grupos:
+                grupos[v][1].append(e)
+        return list(grupos.values())
+
+    @staticmethod
+    def emparejar(
+        grafo: GrafoCompatibilidad, costes: array
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Emparejamiento máximo de coste mínimo con costes no negativos.
+        Retorna la pareja de cada cliente y de cada empleado (-1 si no
+        tiene). Cada componente conexa se resuelve por separado, así las
+        fases solo recorren los nodos que aún pueden mejorar. Los costes
+        reducidos se comparan con una tolerancia relativa de 1e-9 (con
+        costes enteros el cálculo es exacto)
+        """
+        num_clientes = grafo.num_clientes
+        num_empleados = grafo.num_empleados
+        inicio = grafo.desplazamientos.tolist()
+        indices = grafo.indices.tolist()
+        coste = costes.tolist()
+        pareja_cliente = [-1] * num_clientes
+        pareja_empleado = [-1] * num_empleados
+
+        # Coste reducido de la arista c -> e: coste + potencial[c] - potencial[e],
+        # siempre >= 0 y nulo en las aristas emparejadas. En cada componente los
+        # clientes libres conservan potencial 0 y los empleados libres comparten
+        # el mismo
+        potencial_cliente = [0.0] * num_clientes
+        potencial_empleado = [0.0] * num_empleados
+        tolerancia = 1e-9 * max(1.0, max(coste, default=0.0))
+        infinito = float("inf")
+        distancia_cliente = [infinito] * num_clientes
+        distancia_empleado = [infinito] * num_empleados
+        previo = [-1] * num_empleados  # Cliente desde el que se llega
+        visitado = [False] * num_empleados
+        posicion = [0] * num_clientes
+
+        componentes = AlgoritmoEmparejamientoCosteMinimo.componentes(grafo)
+        for clientes_componente, empleados_componente in componentes:
+            while True:
+                libres = [c for c in clientes_componente if pareja_cliente[c] == -1]
+                if not libres:
+                    break
+
+                # Dijkstra desde todos los clientes libres a la vez. En el
+                # montículo los empleados se guardan como ~e (negativos)
+                for c in clientes_componente:
+                    distancia_cliente[c] = infinito
+                for e in empleados_componente:
+                    distancia_empleado[e] = infinito
+                for c in libres:
+                    distancia_cliente[c] = 0.0
+                monticulo = [(0.0, c) for c in libres]
+                heapify(monticulo)
+                longitud = infinito
+                destino = -1
+                while monticulo:
+                    d, nodo = heappop(monticulo)
+                    if nodo >= 0:
+                        if d > distancia_cliente[nodo]:
+                            continue
+                        base = d + potencial_cliente[nodo]
+                        for k in range(inicio[nodo], inicio[nodo + 1]):
+                            e = indices[k]
+                            nueva = base + coste[k] - potencial_empleado[e]
+                            if nueva < d:
+                                nueva = d  # Coste reducido negativo por redondeo
+                            if nueva < distancia_empleado[e]:
+                                distancia_empleado[e] = nueva
+                                previo[e] = nodo
+                                heappush(monticulo, (nueva, ~e))
+                    else:
+                        e = ~nodo
+                        if d > distancia_empleado[e]:
+                            continue
+                        c = pareja_empleado[e]
+                        if c == -1:
+                            # Primer empleado libre: los nodos no extraídos
+                            # quedan a distancia >= d y no hace falta seguir
+                            longitud = d
+                            destino = e
+                            break
+                        if d < distancia_cliente[c]:
+                            distancia_cliente[c] = d
+                            heappush(monticulo, (d, c))
+                if destino == -1:
+                    break
+
+                # Potenciales: p += min(distancia, longitud). Los caminos más
+                # cortos quedan con coste reducido nulo y el resto sigue >= 0
+                for c in clientes_componente:
+                    d = distancia_cliente[c]
+                    potencial_cliente[c] += d if d < longitud else longitud
+                    posicion[c] = inicio[c]
+                for e in empleados_componente:
+                    d = distancia_empleado[e]
+                    potencial_empleado[e] += d if d < longitud else longitud
+                    visitado[e] = False
+
+                # Caminos aumentantes disjuntos por aristas de coste reducido
+                # nulo, con el DFS iterativo de Hopcroft-Karp
+                aumentos = 0
+                for raiz in libres:
+                    pila = [raiz]
+                    while pila:
+                        c = pila[-1]
+                        umbral = potencial_cliente[c] - tolerancia
+                        k = posicion[c]
+                        fin = inicio[c + 1]
+                        siguiente = -2
+                        while k < fin:
+                            e = indices[k]
+                            k += 1
+                            if not visitado[e] and coste[k - 1] + umbral <= (
+                                potencial_empleado[e]
+                            ):
+                                visitado[e] = True
+                                siguiente = pareja_empleado[e]
+                                break
+                        posicion[c] = k
+                        if siguiente == -2:
+                            pila.pop()
+                        elif siguiente == -1:
+                            for cliente_idx in pila:
+                                nuevo = indices[posicion[cliente_idx] - 1]
+                                pareja_cliente[cliente_idx] = nuevo
+                                pareja_empleado[nuevo] = cliente_idx
+                            aumentos += 1
+                            break
+                        else:
+                            pila.append(siguiente)
+
+                if aumentos == 0:
+                    # Solo por redondeo: se aumenta por el camino del Dijkstra
+                    e = destino
+                    while e != -1:
+                        c = previo[e]
+                        anterior = pareja_cliente[c]
+                        pareja_cliente[c] = e
+                        pareja_empleado[e] = c
+                        e = anterior
+
+        return pareja_cliente, pareja_empleado
+
+
+class AlgoritmoEmparejamientoIncremental(AlgoritmoEmparejamientoBipartito):
+    """
+    Emparejamiento máximo que se mantiene mientras llegan y se marchan
+    clientes y empleados, sin recalcularlo entero. Un alta o una baja solo
+    deja libre un vértice (el nuevo, o la pareja del que se va), y todo
+    camino aumentante tiene que empezar en él: basta una búsqueda desde ese
+    vértice para que el emparejamiento siga siendo máximo.
+    Clientes y empleados se identifican por el id que devuelve su alta (tras
+    encontrar_emparejamientos_maximos, su índice en las listas) y se guardan
+    por ocupación, ordenados por presupuesto y por precio. Los vecinos de un
+    vértice son un tramo de la lista de la otra parte, así que la búsqueda
+    en anchura visita cada vértice de la ocupación una sola vez
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._clientes: Dict[int, Cliente] = {}
+        self._empleados: Dict[int, Empleado] = {}
+        # Por ocupación: (presupuesto, id) y (precio, id) en orden creciente
+        self._clientes_por_ocupacion: Dict[str, List[Tuple[float, int]]] = {}
+        self._empleados_por_ocupacion: Dict[str, List[Tuple[float, int]]] = {}
+        self._siguiente_cliente = 0
+        self._siguiente_empleado = 0
+
+    def encontrar_emparejamientos_maximos(
+        self, clientes: List[Cliente], empleados: List[Empleado]
+    ) -> List[Emparejamiento]:
+        """Reinicia el estado con estos clientes y empleados y los empareja"""
+
+        # Reiniciar estructuras
+        self._emparejamiento_clientes = {}
+        self._emparejamiento_empleados = {}
+        self._clientes = {}
+        self._empleados = {}
+        self._clientes_por_ocupacion = {}
+        self._empleados_por_ocupacion = {}
+        for cliente_id, cliente in enumerate(clientes):
+            self._clientes[cliente_id] = cliente
+            self._clientes_por_ocupacion.setdefault(
+                cliente.ocupacion_requerida, []
+            ).append((cliente.presupuesto, cliente_id))
+        for empleado_id, empleado in enumerate(empleados):
+            self._empleados[empleado_id] = empleado
+            self._empleados_por_ocupacion.setdefault(empleado.ocupacion, []).append(
+                (empleado.precio_por_hora, empleado_id)
+            )
+        for grupo in self._clientes_por_ocupacion.values():
+            grupo.sort()
+        for grupo in self._empleados_por_ocupacion.values():
+            grupo.sort()
+        self._siguiente_cliente = len(clientes)
+        self._siguiente_empleado = len(empleados)
+
+        pareja_cliente = AlgoritmoEmparejamientoUmbral.emparejar(clientes, empleados)
+        for cliente_id, empleado_id in enumerate(pareja_cliente):
+            if empleado_id != -1:
+                self._emparejamiento_clientes[cliente_id] = empleado_id
+                self._emparejamiento_empleados[empleado_id] = cliente_id
+
+        return self.emparejamientos()
+
+    def emparejamientos(self) -> List[Emparejamiento]:
+        """Emparejamientos actuales"""
+        return self._construir_emparejamientos(self._clientes, self._empleados)
+
+    def agregar_cliente(self, cliente: Cliente) -> int:
+        """Da de alta un cliente y retorna su id"""
+        cliente_id = self._siguiente_cliente
+        self._siguiente_cliente += 1
+        self._clientes[cliente_id] = cliente
+        insort(
+            self._clientes_por_ocupacion.setdefault(cliente.ocupacion_requerida, []),
+            (cliente.presupuesto, cliente_id),
+        )
+        self._aumentar_desde_cliente(cliente_id)
+        return cliente_id
+
+    def agregar_empleado(self, empleado: Empleado) -> int:
+        """Da de alta un empleado y retorna su id"""
+        empleado_id = self._siguiente_empleado
+        self._siguiente_empleado += 1
+        self._empleados[empleado_id] = empleado
+        insort(
+            self._empleados_por_ocupacion.setdefault(empleado.ocupacion, []),
+            (empleado.precio_por_hora, empleado_id),
+        )
+        self._aumentar_desde_empleado(empleado_id)
+        return empleado_id
+
+    def eliminar_cliente(self, cliente_id: int):
+        """Da de baja un cliente; su empleado, si lo tenía, busca otro cliente"""
+        cliente = self._clientes.pop(cliente_id)
+        grupo = self._clientes_por_ocupacion[cliente.ocupacion_requerida]
+        grupo.pop(bisect_left(grupo, (cliente.presupuesto, cliente_id)))
+        if not grupo:
+            del self._clientes_por_ocupacion[cliente.ocupacion_requerida]
+
+        empleado_id = self._emparejamiento_clientes.pop(cliente_id, None)
+        if empleado_id is not None:
+            del self._emparejamiento_empleados[empleado_id]
+            self._aumentar_desde_empleado(empleado_id)
+
+    def eliminar_empleado(self, empleado_id: int):
+        """Da de baja un empleado; su cliente, si lo tenía, busca otro empleado"""
+        empleado = self._empleados.pop(empleado_id)
+        grupo = self._empleados_por_ocupacion[empleado.ocupacion]
+        grupo.pop(bisect_left(grupo, (empleado.precio_por_hora, empleado_id)))
+        if not grupo:
+            del self._empleados_por_ocupacion[empleado.ocupacion]
+
+        cliente_id = self._emparejamiento_empleados.pop(empleado_id, None)
+        if cliente_id is not None:
+            del self._emparejamiento_clientes[cliente_id]
+            self._aumentar_desde_cliente(cliente_id)
+
+    def _aumentar_desde_cliente(self, raiz: int) -> bool:
+        """
+        Busca en anchura un camino aumentante desde un cliente libre y, si lo
+        encuentra, empareja por él. Los empleados alcanzados son siempre los
+        más baratos de la ocupación: basta con contar cuántos van
+        """
+        cliente = self._clientes[raiz]
+        empleados = self._empleados_por_ocupacion.get(cliente.ocupacion_requerida)
+        if not empleados:
+            return False
+
+        previo: Dict[int, int] = {}  # Empleado -> cliente desde el que se llega
+        alcanzados = 0
+        cola = [raiz]
+        for cliente_id in cola:
+            limite = bisect_right(
+                empleados, (self._clientes[cliente_id].presupuesto, float("inf"))
+            )
+            for _, empleado_id in empleados[alcanzados:limite]:
+                previo[empleado_id] = cliente_id
+                siguiente = self._emparejamiento_empleados.get(empleado_id)
+                if siguiente is None:
+                    # Camino aumentante: se invierte hasta la raíz
+                    while empleado_id is not None:
+                        cliente_id = previo[empleado_id]
+                        anterior = self._emparejamiento_clientes.get(cliente_id)
+                        self._emparejamiento_clientes[cliente_id] = empleado_id
+                        self._emparejamiento_empleados[empleado_id] = cliente_id
+                        empleado_id = anterior
+                    return True
+                cola.append(siguiente)
+            alcanzados = max(alcanzados, limite)
+        return False
+
+    def _aumentar_desde_empleado(self, raiz: int) -> bool:
+        """
+        Igual que _aumentar_desde_cliente desde un empleado libre: los
+        clientes alcanzados son siempre los de mayor presupuesto
+        """
+        empleado = self._empleados[raiz]
+        clientes = self._clientes_por_ocupacion.get(empleado.ocupacion)
+        if not clientes:
+            return False
+
+        previo: Dict[int, int] = {}  # Cliente -> empleado desde el que se llega
+        alcanzados = len(clientes)
+        cola = [raiz]
+        for empleado_id in cola:
+            primero = bisect_left(
+                clientes, (self._empleados[empleado_id].precio_por_hora, -1)
+            )
+            for _, cliente_id in clientes[primero:alcanzados]:
+                previo[cliente_id] = empleado_id
+                siguiente = self._emparejamiento_clientes.get(cliente_id)
+                if siguiente is None:
+                    while cliente_id is not None:
+                        empleado_id = previo[cliente_id]
+                        anterior = self._emparejamiento_empleados.get(empleado_id)
+                        self._emparejamiento_clientes[cliente_id] = empleado_id
+                        self._emparejamiento_empleados[empleado_id] = cliente_id
+                        cliente_id = anterior
+                    return True
+                cola.append(siguiente)
+            alcanzados = min(alcanzados, primero)
+        return False
+
+
 class IVisualizadorResultados(ABC):
     """Interfaz para mostrar resultados (Principio de Responsabilidad Única)"""
 